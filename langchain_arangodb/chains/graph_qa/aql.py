@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from langchain.chains.base import Chain
-from langchain_core.callbacks import CallbackManagerForChainRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForChainRun,
+    CallbackManagerForChainRun,
+)
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.messages import (
     AIMessage,
@@ -19,10 +33,20 @@ from langchain_core.prompts import (
     HumanMessagePromptTemplate,
     MessagesPlaceholder,
 )
-from langchain_core.runnables import Runnable
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import (
+    ensure_config,
+    get_async_callback_manager_for_config,
+    get_callback_manager_for_config,
+    run_in_executor,
+)
 from pydantic import Field
 
+from langchain_arangodb.chains.graph_qa.cache import AQLGenerationCache
+from langchain_arangodb.chains.graph_qa.context import ContextPacker
+from langchain_arangodb.chains.graph_qa.guard import AQLGuard, QueryRejected
 from langchain_arangodb.chains.graph_qa.prompts import (
+    AQL_FIX_PROMPT,
     AQL_GENERATION_PROMPT,
     AQL_QA_PROMPT,
 )
@@ -44,6 +68,21 @@ class GraphAQLQAChain(Chain):
     return_intermediate_steps: bool = False
     return_direct: bool = False
     use_function_response: bool = False
+    max_concurrent_queries: int = 16
+    """Queries executed at once by ``batch``/``abatch``."""
+    aql_cache: Optional[AQLGenerationCache] = Field(default=None, exclude=True)
+    """Reuses AQL generated for the same (or, with embeddings, a similar)
+    question against the same schema; see ``AQLGenerationCache.stats``."""
+    context_packer: Optional[ContextPacker] = Field(default=None, exclude=True)
+    """Projects, truncates and budgets the query result sent to the QA
+    prompt; token savings are reported in the intermediate steps."""
+    aql_guard: Optional[AQLGuard] = Field(default=None, exclude=True)
+    """Validates and explains generated AQL before running it, rejecting
+    expensive queries and injecting ``LIMIT top_k``."""
+    aql_fix_chain: Optional[Runnable[Dict[str, Any], str]] = None
+    """Rewrites a query rejected by ``aql_guard`` given the rejection reasons
+    and plan (``schema``, ``question``, ``aql`` and ``error`` inputs)."""
+    max_aql_regenerations: int = 2
 
     @property
     def input_keys(self) -> List[str]:
@@ -64,6 +103,7 @@ class GraphAQLQAChain(Chain):
         *,
         qa_prompt: Optional[BasePromptTemplate] = None,
         aql_prompt: Optional[BasePromptTemplate] = None,
+        aql_fix_prompt: Optional[BasePromptTemplate] = None,
         qa_llm: Optional[BaseLanguageModel] = None,
         aql_llm: Optional[BaseLanguageModel] = None,
         qa_llm_kwargs: Optional[Dict[str, Any]] = None,
@@ -80,6 +120,7 @@ class GraphAQLQAChain(Chain):
             raise ValueError("Provide either llm or both qa_llm and aql_llm")
 
         aql_prompt = aql_prompt or AQL_GENERATION_PROMPT
+        aql_fix_prompt = aql_fix_prompt or AQL_FIX_PROMPT
         qa_prompt = qa_prompt or AQL_QA_PROMPT
 
         use_qa_llm_kwargs = qa_llm_kwargs or {}
@@ -101,14 +142,193 @@ class GraphAQLQAChain(Chain):
         aql_generation_chain = (
                 aql_prompt | aql_llm.bind(**use_aql_llm_kwargs) | StrOutputParser()
         )
+        aql_fix_chain = (
+                aql_fix_prompt | aql_llm.bind(**use_aql_llm_kwargs) | StrOutputParser()
+        )
 
         return cls(
             qa_chain=qa_chain,
             aql_generation_chain=aql_generation_chain,
+            aql_fix_chain=aql_fix_chain,
             use_function_response=use_function_response,
             **kwargs,
         )
 
+    def _generation_args(self, inputs: Dict[str, Any], schema: str) -> Dict[str, Any]:
+        args = {"question": inputs[self.input_key], "schema": schema}
+        args.update(inputs)
+        return args
+
+    def _cached_aql(self, args: Dict[str, Any]) -> Optional[str]:
+        if self.aql_cache is None:
+            return None
+        return self.aql_cache.get(args["question"], self._cache_schema(args))
+
+    def _cache_aql(self, args: Dict[str, Any], aql: str) -> None:
+        if self.aql_cache is not None and aql:
+            self.aql_cache.put(args["question"], self._cache_schema(args), aql)
+
+    async def _acached_aql(self, args: Dict[str, Any]) -> Optional[str]:
+        if self.aql_cache is None:
+            return None
+        return await self.aql_cache.aget(args["question"], self._cache_schema(args))
+
+    async def _acache_aql(self, args: Dict[str, Any], aql: str) -> None:
+        if self.aql_cache is not None and aql:
+            await self.aql_cache.aput(args["question"], self._cache_schema(args), aql)
+
+    def _cache_schema(self, args: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        # The structured schema leaves out document counts, which change on
+        # every write; the prompt text is only used if it is unavailable.
+        return getattr(self.graph, "structured_schema", None) or args["schema"]
+
+    def _check_aql(
+        self, args: Dict[str, Any], aql: str, callbacks: Any = None
+    ) -> str:
+        """Run ``aql`` past ``aql_guard``, regenerating it when rejected.
+
+        Raises the last ``QueryRejected`` once ``max_aql_regenerations``
+        rewrites have been rejected too (or at once without ``aql_fix_chain``).
+        """
+        if self.aql_guard is None or not aql:
+            return aql
+        regenerations = 0
+        while True:
+            try:
+                return self.aql_guard.check(self.graph.db, aql, self.top_k)
+            except QueryRejected as e:
+                if (
+                    self.aql_fix_chain is None
+                    or regenerations >= self.max_aql_regenerations
+                ):
+                    raise
+                regenerations += 1
+                aql = self.aql_fix_chain.invoke(
+                    {**args, "aql": e.aql, "error": e.feedback()}, callbacks=callbacks
+                )
+
+    async def _acheck_aql(
+        self, args: Dict[str, Any], aql: str, callbacks: Any = None
+    ) -> str:
+        if self.aql_guard is None or not aql:
+            return aql
+        regenerations = 0
+        while True:
+            try:
+                return await run_in_executor(
+                    None, self.aql_guard.check, self.graph.db, aql, self.top_k
+                )
+            except QueryRejected as e:
+                if (
+                    self.aql_fix_chain is None
+                    or regenerations >= self.max_aql_regenerations
+                ):
+                    raise
+                regenerations += 1
+                aql = await self.aql_fix_chain.ainvoke(
+                    {**args, "aql": e.aql, "error": e.feedback()}, callbacks=callbacks
+                )
+
+    def _query_options(self) -> Dict[str, Any]:
+        return self.aql_guard.query_options() if self.aql_guard is not None else {}
+
+    def _pack_context(
+        self, aql: str, context: List[Any]
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Return the context for the QA prompt and packing statistics."""
+        if self.context_packer is None:
+            return context, None
+        return self.context_packer.pack(context, aql)
+
+    def _qa_input(self, question: str, context: Any) -> Dict[str, Any]:
+        if not self.use_function_response:
+            return {"question": question, "context": context}
+
+        tool_id = "call_arango_tool"
+        tool_messages = [
+            AIMessage(
+                content="",
+                additional_kwargs={
+                    "tool_calls": [
+                        {
+                            "id": tool_id,
+                            "function": {
+                                "arguments": '{"question":"' + question + '"}',
+                                "name": "GetInformation",
+                            },
+                            "type": "function",
+                        }
+                    ]
+                },
+            ),
+            ToolMessage(content=str(context), tool_call_id=tool_id),
+        ]
+        return {"question": question, "function_response": tool_messages}
+
+    def _output(
+        self,
+        aql: str,
+        context: List[Any],
+        result: Any,
+        packing: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        output = {self.output_key: result}
+        if self.return_intermediate_steps:
+            steps: List[Dict[str, Any]] = [{"aql": aql}]
+            if not self.return_direct:
+                steps.append({"context": context})
+            if packing is not None:
+                steps.append({"context_packing": packing})
+            output["intermediate_steps"] = steps
+        return output
+
+    def _generate_aql(
+        self, args: Dict[str, Any], run_manager: CallbackManagerForChainRun
+    ) -> str:
+        """Cached or generated AQL, checked by ``aql_guard``."""
+        callbacks = run_manager.get_child()
+        cached = self._cached_aql(args)
+        if cached is None:
+            aql = self.aql_generation_chain.invoke(args, callbacks=callbacks)
+            run_manager.on_text("Generated AQL:", end="\n", verbose=self.verbose)
+        else:
+            aql = cached
+            run_manager.on_text("Cached AQL:", end="\n", verbose=self.verbose)
+        run_manager.on_text(aql, color="green", end="\n", verbose=self.verbose)
+        checked = self._check_aql(args, aql, callbacks)
+        if checked != aql:
+            run_manager.on_text("Checked AQL:", end="\n", verbose=self.verbose)
+            run_manager.on_text(
+                checked, color="green", end="\n", verbose=self.verbose
+            )
+        aql = checked
+        if aql != cached:
+            self._cache_aql(args, aql)
+        return aql
+
+    async def _agenerate_aql(
+        self, args: Dict[str, Any], run_manager: AsyncCallbackManagerForChainRun
+    ) -> str:
+        callbacks = run_manager.get_child()
+        cached = await self._acached_aql(args)
+        if cached is None:
+            aql = await self.aql_generation_chain.ainvoke(args, callbacks=callbacks)
+            await run_manager.on_text("Generated AQL:", end="\n", verbose=self.verbose)
+        else:
+            aql = cached
+            await run_manager.on_text("Cached AQL:", end="\n", verbose=self.verbose)
+        await run_manager.on_text(aql, color="green", end="\n", verbose=self.verbose)
+        checked = await self._acheck_aql(args, aql, callbacks)
+        if checked != aql:
+            await run_manager.on_text("Checked AQL:", end="\n", verbose=self.verbose)
+            await run_manager.on_text(
+                checked, color="green", end="\n", verbose=self.verbose
+            )
+        aql = checked
+        if aql != cached:
+            await self._acache_aql(args, aql)
+        return aql
+
     def _call(
         self,
         inputs: Dict[str, Any],
@@ -117,57 +337,346 @@ class GraphAQLQAChain(Chain):
         _run_manager = run_manager or CallbackManagerForChainRun.get_noop_manager()
         callbacks = _run_manager.get_child()
         question = inputs[self.input_key]
+        args = self._generation_args(inputs, self.graph.get_schema)
 
-        args = {"question": question}
-        args.update(inputs)
+        aql = self._generate_aql(args, _run_manager)
+
+        context = []
+        if aql:
+            context = list(
+                self.graph.stream_aql(aql, limit=self.top_k, **self._query_options())
+            )
+
+        if self.return_direct:
+            return self._output(aql, context, context)
 
-        intermediate_steps = []
+        qa_context, packing = self._pack_context(aql, context)
+        _run_manager.on_text("Full Context:", end="\n", verbose=self.verbose)
+        _run_manager.on_text(
+            str(qa_context), color="green", end="\n", verbose=self.verbose
+        )
+        result = self.qa_chain.invoke(
+            self._qa_input(question, qa_context), callbacks=callbacks
+        )
+        return self._output(aql, context, result, packing)
 
-        aql = self.aql_generation_chain.invoke(args, callbacks=callbacks)
-        _run_manager.on_text("Generated AQL:", end="\n", verbose=self.verbose)
-        _run_manager.on_text(aql, color="green", end="\n", verbose=self.verbose)
+    async def _acall(
+        self,
+        inputs: Dict[str, Any],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> Dict[str, Any]:
+        _run_manager = run_manager or AsyncCallbackManagerForChainRun.get_noop_manager()
+        callbacks = _run_manager.get_child()
+        question = inputs[self.input_key]
+        args = self._generation_args(inputs, await self.graph.aget_schema())
 
-        intermediate_steps.append({"aql": aql})
+        aql = await self._agenerate_aql(args, _run_manager)
 
-        context = self.graph.run_aql(aql)[: self.top_k] if aql else []
+        context = []
+        if aql:
+            context = await self.graph.arun_aql(
+                aql, limit=self.top_k, **self._query_options()
+            )
 
         if self.return_direct:
-            result = context
-        else:
-            _run_manager.on_text("Full Context:", end="\n", verbose=self.verbose)
-            _run_manager.on_text(str(context), color="green", end="\n", verbose=self.verbose)
-            intermediate_steps.append({"context": context})
-
-            if self.use_function_response:
-                tool_id = "call_arango_tool"
-                tool_messages = [
-                    AIMessage(
-                        content="",
-                        additional_kwargs={
-                            "tool_calls": [
-                                {
-                                    "id": tool_id,
-                                    "function": {
-                                        "arguments": '{"question":"' + question + '"}',
-                                        "name": "GetInformation",
-                                    },
-                                    "type": "function",
-                                }
-                            ]
-                        },
-                    ),
-                    ToolMessage(content=str(context), tool_call_id=tool_id),
-                ]
-                result = self.qa_chain.invoke(
-                    {"question": question, "function_response": tool_messages},
+            return self._output(aql, context, context)
+
+        qa_context, packing = self._pack_context(aql, context)
+        await _run_manager.on_text("Full Context:", end="\n", verbose=self.verbose)
+        await _run_manager.on_text(
+            str(qa_context), color="green", end="\n", verbose=self.verbose
+        )
+        result = await self.qa_chain.ainvoke(
+            self._qa_input(question, qa_context), callbacks=callbacks
+        )
+        return self._output(aql, context, result, packing)
+
+    def stream(
+        self,
+        input: Any,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Answer ``input`` while yielding events as each stage progresses.
+
+        Events are ``{"event": "aql", "data": query}`` once the query is
+        generated and checked, ``{"event": "row", "data": row}`` for every
+        result row as the cursor delivers it, ``{"event": "token", "data":
+        chunk}`` for every chunk streamed from ``qa_chain`` and finally
+        ``{"event": "end", "data": outputs}`` with what ``invoke`` returns.
+        """
+        config = ensure_config(config)
+        inputs = self.prep_inputs(input)
+        run_manager = get_callback_manager_for_config(config).on_chain_start(
+            None,
+            inputs,
+            name=config.get("run_name") or self.get_name(),
+            run_id=config.pop("run_id", None),
+        )
+        try:
+            args = self._generation_args(inputs, self.graph.get_schema)
+            aql = self._generate_aql(args, run_manager)
+            yield {"event": "aql", "data": aql}
+
+            context: List[Any] = []
+            if aql:
+                rows = self.graph.stream_aql(
+                    aql, limit=self.top_k, **self._query_options()
                 )
+                for row in rows:
+                    context.append(row)
+                    yield {"event": "row", "data": row}
+
+            packing = None
+            if self.return_direct:
+                result: Any = context
             else:
-                result = self.qa_chain.invoke(
-                    {"question": question, "context": context}, callbacks=callbacks
+                qa_context, packing = self._pack_context(aql, context)
+                chunks = []
+                for chunk in self.qa_chain.stream(
+                    self._qa_input(args["question"], qa_context),
+                    {"callbacks": run_manager.get_child()},
+                ):
+                    chunks.append(chunk)
+                    yield {"event": "token", "data": chunk}
+                result = _concat(chunks)
+            outputs = self.prep_outputs(
+                inputs, self._output(aql, context, result, packing)
+            )
+        except BaseException as e:
+            run_manager.on_chain_error(e)
+            raise
+        run_manager.on_chain_end(outputs)
+        yield {"event": "end", "data": outputs}
+
+    async def astream(
+        self,
+        input: Any,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async ``stream``, reading rows from the graph's async client."""
+        config = ensure_config(config)
+        inputs = await self.aprep_inputs(input)
+        callback_manager = get_async_callback_manager_for_config(config)
+        run_manager = await callback_manager.on_chain_start(
+            None,
+            inputs,
+            name=config.get("run_name") or self.get_name(),
+            run_id=config.pop("run_id", None),
+        )
+        try:
+            args = self._generation_args(inputs, await self.graph.aget_schema())
+            aql = await self._agenerate_aql(args, run_manager)
+            yield {"event": "aql", "data": aql}
+
+            context: List[Any] = []
+            if aql:
+                rows = self.graph.astream_aql(
+                    aql, limit=self.top_k, **self._query_options()
                 )
+                async for row in rows:
+                    context.append(row)
+                    yield {"event": "row", "data": row}
+
+            packing = None
+            if self.return_direct:
+                result: Any = context
+            else:
+                qa_context, packing = self._pack_context(aql, context)
+                chunks = []
+                async for chunk in self.qa_chain.astream(
+                    self._qa_input(args["question"], qa_context),
+                    {"callbacks": run_manager.get_child()},
+                ):
+                    chunks.append(chunk)
+                    yield {"event": "token", "data": chunk}
+                result = _concat(chunks)
+            outputs = await self.aprep_outputs(
+                inputs, self._output(aql, context, result, packing)
+            )
+        except BaseException as e:
+            await run_manager.on_chain_error(e)
+            raise
+        await run_manager.on_chain_end(outputs)
+        yield {"event": "end", "data": outputs}
+
+    def batch(
+        self,
+        inputs: List[Any],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Answer many questions with three batched stages instead of N runs.
+
+        All AQL generation prompts go through ``aql_generation_chain.batch``
+        (and so the model's native batch API), the queries run concurrently
+        with at most ``max_concurrency`` (default ``max_concurrent_queries``)
+        in flight, and the answers come from one ``qa_chain.batch``.
+        Callbacks in ``config`` reach the nested runnables; chain-level
+        callbacks and memory are only used by the per-input fallback taken
+        for a list of configs or a chain with memory.
+        """
+        if not inputs:
+            return []
+        if isinstance(config, list) or self.memory is not None:
+            return super().batch(
+                inputs, config, return_exceptions=return_exceptions, **kwargs
+            )
+        config = ensure_config(config)
+        prepped = [self.prep_inputs(item) for item in inputs]
+        schema = self.graph.get_schema
+        args = [self._generation_args(item, schema) for item in prepped]
+
+        cached: List[Optional[str]] = [self._cached_aql(item) for item in args]
+        aqls: List[Any] = list(cached)
+        missing = [i for i, aql in enumerate(aqls) if aql is None]
+        if missing:
+            generated = self.aql_generation_chain.batch(
+                [args[i] for i in missing], config, return_exceptions=return_exceptions
+            )
+            for i, aql in zip(missing, generated):
+                aqls[i] = aql
+        options = self._query_options()
+
+        def execute(i: int) -> Any:
+            if isinstance(aqls[i], Exception):
+                return aqls[i]
+            try:
+                aqls[i] = self._check_aql(args[i], aqls[i], config.get("callbacks"))
+                if aqls[i] != cached[i]:
+                    self._cache_aql(args[i], aqls[i])
+                if not aqls[i]:
+                    return []
+                return list(self.graph.stream_aql(aqls[i], limit=self.top_k, **options))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        max_workers = config.get("max_concurrency") or self.max_concurrent_queries
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contexts = list(executor.map(execute, range(len(aqls))))
+
+        pending = self._pending_answers(aqls, contexts)
+        packed = {i: self._pack_context(aqls[i], contexts[i]) for i in pending}
+        answers: List[Any] = []
+        if pending:
+            answers = self.qa_chain.batch(
+                [self._qa_input(args[i]["question"], packed[i][0]) for i in pending],
+                config,
+                return_exceptions=return_exceptions,
+            )
+        return self._batch_outputs(prepped, aqls, contexts, packed, answers)
+
+    async def abatch(
+        self,
+        inputs: List[Any],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Async ``batch``; queries run on the graph's async client, bounded
+        by an ``asyncio.Semaphore`` instead of a thread pool."""
+        if not inputs:
+            return []
+        if isinstance(config, list) or self.memory is not None:
+            return await super().abatch(
+                inputs, config, return_exceptions=return_exceptions, **kwargs
+            )
+        config = ensure_config(config)
+        prepped = [self.prep_inputs(item) for item in inputs]
+        schema = await self.graph.aget_schema()
+        args = [self._generation_args(item, schema) for item in prepped]
+
+        cached: List[Optional[str]] = list(
+            await asyncio.gather(*(self._acached_aql(item) for item in args))
+        )
+        aqls: List[Any] = list(cached)
+        missing = [i for i, aql in enumerate(aqls) if aql is None]
+        if missing:
+            generated = await self.aql_generation_chain.abatch(
+                [args[i] for i in missing], config, return_exceptions=return_exceptions
+            )
+            for i, aql in zip(missing, generated):
+                aqls[i] = aql
+        options = self._query_options()
+        semaphore = asyncio.Semaphore(
+            config.get("max_concurrency") or self.max_concurrent_queries
+        )
+
+        async def execute(i: int) -> Any:
+            if isinstance(aqls[i], Exception):
+                return aqls[i]
+            async with semaphore:
+                aqls[i] = await self._acheck_aql(
+                    args[i], aqls[i], config.get("callbacks")
+                )
+                if aqls[i] != cached[i]:
+                    await self._acache_aql(args[i], aqls[i])
+                if not aqls[i]:
+                    return []
+                return await self.graph.arun_aql(
+                    aqls[i], limit=self.top_k, **options
+                )
+
+        contexts = await asyncio.gather(
+            *(execute(i) for i in range(len(aqls))),
+            return_exceptions=return_exceptions,
+        )
+
+        pending = self._pending_answers(aqls, contexts)
+        packed = {i: self._pack_context(aqls[i], contexts[i]) for i in pending}
+        answers: List[Any] = []
+        if pending:
+            answers = await self.qa_chain.abatch(
+                [self._qa_input(args[i]["question"], packed[i][0]) for i in pending],
+                config,
+                return_exceptions=return_exceptions,
+            )
+        return self._batch_outputs(prepped, aqls, contexts, packed, answers)
+
+    def _pending_answers(self, aqls: List[Any], contexts: List[Any]) -> List[int]:
+        """Indexes of inputs that still need a QA answer."""
+        if self.return_direct:
+            return []
+        return [
+            i
+            for i, (aql, context) in enumerate(zip(aqls, contexts))
+            if not isinstance(aql, Exception) and not isinstance(context, Exception)
+        ]
+
+    def _batch_outputs(
+        self,
+        prepped: List[Dict[str, Any]],
+        aqls: List[Any],
+        contexts: List[Any],
+        packed: Dict[int, Tuple[Any, Optional[Dict[str, Any]]]],
+        answers: List[Any],
+    ) -> List[Any]:
+        results: List[Any] = list(contexts)
+        for i, answer in zip(packed, answers):
+            results[i] = answer
+        outputs: List[Any] = []
+        for i, result in enumerate(results):
+            # A failed generation is carried through as its query's context.
+            if isinstance(result, Exception):
+                outputs.append(result)
+                continue
+            packing = packed[i][1] if i in packed else None
+            output = self._output(aqls[i], contexts[i], result, packing)
+            outputs.append(self.prep_outputs(prepped[i], output))
+        return outputs
 
-        output = {self.output_key: result}
-        if self.return_intermediate_steps:
-            output["intermediate_steps"] = intermediate_steps
 
-        return output
\ No newline at end of file
+def _concat(chunks: List[Any]) -> Any:
+    """Join streamed chunks (strings or message chunks) into one output."""
+    if not chunks:
+        return ""
+    result = chunks[0]
+    for chunk in chunks[1:]:
+        result = result + chunk
+    return result
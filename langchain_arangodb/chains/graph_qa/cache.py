@@ -0,0 +1,231 @@
+"""Cache of generated AQL queries for GraphAQLQAChain."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# Query embeddings kept between a missed ``get`` and the matching ``put``.
+MAX_PENDING_EMBEDDINGS = 64
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return re.sub(r"\s+", " ", question).strip().rstrip("?!. ").lower()
+
+
+def schema_hash(schema: Union[str, Dict[str, Any]]) -> str:
+    """Hash a prompt schema string, or fingerprint a structured schema."""
+    if isinstance(schema, dict):
+        return schema_fingerprint(schema)
+    return md5(schema.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(structured_schema: Dict[str, Any]) -> str:
+    """Hash of the parts of a structured schema that generated AQL depends on.
+
+    Collection names, types, attributes and edge endpoints and the named
+    graphs are included; document counts and revisions are not, so writes
+    to the data do not invalidate cached queries.
+    """
+    shape = {
+        "collections": {
+            name: {
+                "type": entry.get("type"),
+                "attributes": entry.get("attributes", {}),
+                "endpoints": sorted(
+                    (e["from"], e["to"]) for e in entry.get("endpoints", [])
+                ),
+            }
+            for name, entry in structured_schema.get("collections", {}).items()
+        },
+        "graphs": structured_schema.get("graphs", []),
+    }
+    payload = json.dumps(shape, sort_keys=True, default=str)
+    return md5(payload.encode("utf-8")).hexdigest()
+
+
+class AQLGenerationCache:
+    """Two-tier cache of generated AQL keyed by question and schema.
+
+    The exact tier is an LRU of ``max_size`` normalized questions. With
+    ``embeddings`` set, a miss falls through to a semantic tier that returns
+    the AQL of the most similar cached question if their cosine similarity
+    is at least ``similarity_threshold``. Entries belong to the schema they
+    were generated against: the first lookup with a different schema drops
+    the whole cache, so a ``refresh_schema`` that changes the schema never
+    serves stale queries. Pass the graph's ``structured_schema`` as
+    ``schema`` so that only structural changes count, see
+    ``schema_fingerprint``; a string is compared verbatim.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        embeddings: Optional[Embeddings] = None,
+        similarity_threshold: float = 0.95,
+    ) -> None:
+        self.max_size = max_size
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._schema_hash: Optional[str] = None
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        # Semantic tier: normalized questions and their unit-length embeddings.
+        self._questions: List[str] = []
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        # Embeddings computed by ``get`` on a miss, reused by ``put``.
+        self._pending: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, question: str, schema: Union[str, Dict[str, Any]]
+    ) -> Optional[str]:
+        key = normalize_question(question)
+        aql, semantic = self._get_exact(key, schema)
+        if not semantic:
+            return aql
+        return self._get_semantic(key, self._embed(key))
+
+    async def aget(
+        self, question: str, schema: Union[str, Dict[str, Any]]
+    ) -> Optional[str]:
+        """``get`` embedding the question with ``aembed_query``."""
+        key = normalize_question(question)
+        aql, semantic = self._get_exact(key, schema)
+        if not semantic:
+            return aql
+        return self._get_semantic(key, await self._aembed(key))
+
+    def put(
+        self, question: str, schema: Union[str, Dict[str, Any]], aql: str
+    ) -> None:
+        key = normalize_question(question)
+        vector = self._take_pending(key, schema)
+        if self.embeddings is not None and vector is None:
+            vector = self._embed(key)
+        self._store(key, aql, vector)
+
+    async def aput(
+        self, question: str, schema: Union[str, Dict[str, Any]], aql: str
+    ) -> None:
+        """``put`` embedding the question with ``aembed_query``."""
+        key = normalize_question(question)
+        vector = self._take_pending(key, schema)
+        if self.embeddings is not None and vector is None:
+            vector = await self._aembed(key)
+        self._store(key, aql, vector)
+
+    def _get_exact(
+        self, key: str, schema: Union[str, Dict[str, Any]]
+    ) -> Tuple[Optional[str], bool]:
+        """Exact-tier lookup; the flag tells whether to try the semantic tier."""
+        with self._lock:
+            self._check_schema(schema)
+            aql = self._entries.get(key)
+            if aql is not None:
+                self._entries.move_to_end(key)
+                self.exact_hits += 1
+                return aql, False
+            if self.embeddings is None or not self._questions:
+                self.misses += 1
+                return None, False
+            return None, True
+
+    def _get_semantic(self, key: str, vector: np.ndarray) -> Optional[str]:
+        with self._lock:
+            if self._questions:
+                similarities = self._vectors @ vector
+                best = int(np.argmax(similarities))
+                aql = self._entries.get(self._questions[best])
+                if similarities[best] >= self.similarity_threshold and aql is not None:
+                    self.semantic_hits += 1
+                    return aql
+            self.misses += 1
+            self._pending[key] = vector
+            while len(self._pending) > MAX_PENDING_EMBEDDINGS:
+                self._pending.popitem(last=False)
+            return None
+
+    def _take_pending(
+        self, key: str, schema: Union[str, Dict[str, Any]]
+    ) -> Optional[np.ndarray]:
+        with self._lock:
+            self._check_schema(schema)
+            return self._pending.pop(key, None)
+
+    def _store(self, key: str, aql: str, vector: Optional[np.ndarray]) -> None:
+        with self._lock:
+            if key not in self._entries and vector is not None:
+                self._questions.append(key)
+                vectors = [self._vectors] if len(self._vectors) else []
+                self._vectors = np.vstack(vectors + [vector[None, :]])
+            self._entries[key] = aql
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._drop_vector(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        hits = self.exact_hits + self.semantic_hits
+        total = hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": hits / total if total else 0.0,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+        }
+
+    def _check_schema(self, schema: Union[str, Dict[str, Any]]) -> None:
+        current = schema_hash(schema)
+        if self._schema_hash is not None and current != self._schema_hash:
+            self._clear()
+            self.invalidations += 1
+        self._schema_hash = current
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+        self._questions = []
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def _drop_vector(self, key: str) -> None:
+        if key in self._questions:
+            index = self._questions.index(key)
+            del self._questions[index]
+            self._vectors = np.delete(self._vectors, index, axis=0)
+
+    def _embed(self, text: str) -> np.ndarray:
+        assert self.embeddings is not None
+        return _unit(self.embeddings.embed_query(text))
+
+    async def _aembed(self, text: str) -> np.ndarray:
+        assert self.embeddings is not None
+        return _unit(await self.embeddings.aembed_query(text))
+
+
+def _unit(embedding: List[float]) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
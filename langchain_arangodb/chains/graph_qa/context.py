@@ -0,0 +1,138 @@
+"""Compact, token-budgeted rendering of AQL results for QA prompts."""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+FORMATS = ("jsonl", "table")
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def approximate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+def referenced_attributes(aql: str) -> Set[str]:
+    """Identifiers appearing in ``aql``, a superset of the attributes it reads
+    (``doc.name``) or returns (``{name: ...}``)."""
+    without_strings = re.sub(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"", " ", aql)
+    return set(_IDENTIFIER.findall(without_strings))
+
+
+class ContextPacker:
+    """Shrink query results to what the QA prompt needs.
+
+    Rows that are documents keep only the top-level attributes named in the
+    generated AQL (all of them if none are), strings longer than
+    ``max_value_chars`` and lists longer than ``max_list_items`` are cut,
+    and rows are serialized as JSON lines or a ``|``-separated table until
+    ``max_tokens`` is reached. ``tokenizer`` counts the tokens of a string;
+    pass e.g. ``llm.get_num_tokens`` for exact counts, the default
+    approximates four characters per token.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 2000,
+        max_value_chars: int = 200,
+        max_list_items: int = 10,
+        format: str = "jsonl",
+        tokenizer: Optional[Callable[[str], int]] = None,
+        project: bool = True,
+    ) -> None:
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}; use one of {FORMATS}")
+        self.max_tokens = max_tokens
+        self.max_value_chars = max_value_chars
+        self.max_list_items = max_list_items
+        self.format = format
+        self.tokenizer = tokenizer or approximate_tokens
+        self.project = project
+
+    def pack(self, context: List[Any], aql: str = "") -> Tuple[str, Dict[str, Any]]:
+        """Return the packed context and token statistics for it.
+
+        The statistics compare against ``str(context)``, which is what the
+        chain sent before packing.
+        """
+        rows = [self._truncate(row) for row in self._projected(context, aql)]
+        header, lines = self._serialize(rows)
+
+        # Lines are counted separately, which keeps packing linear in the
+        # number of rows at the cost of slightly overestimating the total.
+        kept = [header] if header else []
+        budget = self.max_tokens - sum(self.tokenizer(line) for line in kept)
+        used = 0
+        for line in lines:
+            budget -= self.tokenizer(line)
+            if budget < 0:
+                break
+            kept.append(line)
+            used += 1
+        if used < len(lines):
+            kept.append(f"... {len(lines) - used} more rows omitted")
+        text = "\n".join(kept)
+
+        original = self.tokenizer(str(context))
+        tokens = self.tokenizer(text)
+        return text, {
+            "tokens": tokens,
+            "original_tokens": original,
+            "tokens_saved": original - tokens,
+            "rows": used,
+            "rows_omitted": len(lines) - used,
+        }
+
+    def _projected(self, context: List[Any], aql: str) -> List[Any]:
+        if not self.project or not aql:
+            return context
+        names = referenced_attributes(aql)
+        projected = []
+        for row in context:
+            if isinstance(row, dict):
+                kept = {key: value for key, value in row.items() if key in names}
+                row = kept or row
+            projected.append(row)
+        return projected
+
+    def _truncate(self, value: Any) -> Any:
+        if isinstance(value, str) and len(value) > self.max_value_chars:
+            return value[: self.max_value_chars] + "..."
+        if isinstance(value, dict):
+            return {key: self._truncate(item) for key, item in value.items()}
+        if isinstance(value, list):
+            items = [self._truncate(item) for item in value[: self.max_list_items]]
+            if len(value) > self.max_list_items:
+                items.append(f"... {len(value) - self.max_list_items} more")
+            return items
+        return value
+
+    def _serialize(self, rows: List[Any]) -> Tuple[Optional[str], List[str]]:
+        """Return the table header (if any) and one line per row."""
+        if self.format == "table" and rows and all(isinstance(r, dict) for r in rows):
+            columns: Dict[str, None] = {}
+            for row in rows:
+                columns.update(dict.fromkeys(row))
+            lines = [
+                " | ".join(_cell(row.get(column)) for column in columns)
+                for row in rows
+            ]
+            return " | ".join(columns), lines
+        return None, [_dumps(row) for row in rows]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.replace("|", "\\|").replace("\n", " ")
+    return _dumps(value)
@@ -0,0 +1,173 @@
+"""Pre-execution checks for generated AQL."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from arango.database import StandardDatabase
+from arango.exceptions import AQLQueryExplainError, AQLQueryValidateError
+
+_TOKEN = re.compile(
+    r"""(?P<skip>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|//[^\n]*|/\*.*?\*/"""
+    # Attribute access such as ``doc.limit`` is never a keyword.
+    r"|\.\s*[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<open>[(\[{])|(?P<close>[)\]}])|(?P<word>[A-Za-z_][A-Za-z0-9_]*)",
+    re.DOTALL,
+)
+
+TRAVERSAL_NODES = ("TraversalNode", "ShortestPathNode", "EnumeratePathsNode")
+
+
+class QueryRejected(ValueError):
+    """Generated AQL that failed validation or exceeded a guard threshold."""
+
+    def __init__(
+        self, aql: str, reasons: List[str], plan: Optional[Dict[str, Any]] = None
+    ) -> None:
+        super().__init__("; ".join(reasons))
+        self.aql = aql
+        self.reasons = reasons
+        self.plan = plan
+
+    def feedback(self) -> str:
+        """Reasons and a compact plan summary, for regenerating the query."""
+        lines = [f"- {reason}" for reason in self.reasons]
+        if self.plan is not None:
+            lines.append("Execution plan: " + json.dumps(summarize_plan(self.plan)))
+        return "\n".join(lines)
+
+
+def top_level_keywords(aql: str) -> List[re.Match]:
+    """Keyword matches outside strings, comments and brackets."""
+    depth = 0
+    words = []
+    for match in _TOKEN.finditer(aql):
+        if match.group("open"):
+            depth += 1
+        elif match.group("close"):
+            depth -= 1
+        elif match.group("word") and depth == 0:
+            words.append(match)
+    return words
+
+
+def inject_limit(aql: str, limit: int) -> str:
+    """Add ``LIMIT limit`` before the final ``RETURN`` of a top-level loop.
+
+    Queries without a top-level ``FOR`` or that already have a top-level
+    ``LIMIT`` are returned unchanged.
+    """
+    words = top_level_keywords(aql)
+    keywords = [match.group("word").upper() for match in words]
+    if "FOR" not in keywords or "LIMIT" in keywords or "RETURN" not in keywords:
+        return aql
+    position = words[len(keywords) - 1 - keywords[::-1].index("RETURN")].start()
+    return f"{aql[:position]}LIMIT {limit}\n{aql[position:]}"
+
+
+def summarize_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    nodes = []
+    for node in plan.get("nodes", []):
+        summary = {"type": node.get("type")}
+        if "collection" in node:
+            summary["collection"] = node["collection"]
+        if node.get("indexes"):
+            summary["indexes"] = [index.get("type") for index in node["indexes"]]
+        if "estimatedNrItems" in node:
+            summary["estimatedNrItems"] = node["estimatedNrItems"]
+        nodes.append(summary)
+    return {"estimatedCost": plan.get("estimatedCost"), "nodes": nodes}
+
+
+class AQLGuard:
+    """Validate and ``EXPLAIN`` generated AQL before it runs.
+
+    A query is rejected when it does not parse or plan, when its estimated
+    cost exceeds ``max_estimated_cost``, when it fully scans a collection
+    estimated at more than ``max_full_scan_documents`` documents (``0``
+    forbids full scans), or when a traversal may go deeper than
+    ``max_traversal_depth``. With ``inject_limit`` a ``LIMIT`` is added to
+    queries whose top-level loop has none. ``max_runtime`` (seconds),
+    ``memory_limit`` (bytes) and ``fail_on_warning`` are passed to the
+    execution of accepted queries, see ``query_options``.
+    """
+
+    def __init__(
+        self,
+        max_estimated_cost: Optional[float] = None,
+        max_full_scan_documents: Optional[int] = None,
+        max_traversal_depth: Optional[int] = None,
+        inject_limit: bool = True,
+        max_runtime: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+        fail_on_warning: Optional[bool] = None,
+    ) -> None:
+        self.max_estimated_cost = max_estimated_cost
+        self.max_full_scan_documents = max_full_scan_documents
+        self.max_traversal_depth = max_traversal_depth
+        self.inject_limit = inject_limit
+        self.max_runtime = max_runtime
+        self.memory_limit = memory_limit
+        self.fail_on_warning = fail_on_warning
+
+    def query_options(self) -> Dict[str, Any]:
+        options = {
+            "max_runtime": self.max_runtime,
+            "memory_limit": self.memory_limit,
+            "fail_on_warning": self.fail_on_warning,
+        }
+        return {key: value for key, value in options.items() if value is not None}
+
+    def check(
+        self, db: StandardDatabase, aql: str, limit: Optional[int] = None
+    ) -> str:
+        """Return ``aql``, with a ``LIMIT`` injected if configured, or raise
+        ``QueryRejected``."""
+        try:
+            db.aql.validate(aql)
+        except AQLQueryValidateError as e:
+            raise QueryRejected(aql, [f"invalid AQL: {e.error_message}"])
+
+        if self.inject_limit and limit is not None:
+            aql = inject_limit(aql, limit)
+
+        try:
+            plan = db.aql.explain(aql)
+        except AQLQueryExplainError as e:
+            raise QueryRejected(aql, [f"query cannot be planned: {e.error_message}"])
+
+        reasons = self.violations(plan)
+        if reasons:
+            raise QueryRejected(aql, reasons, plan)
+        return aql
+
+    def violations(self, plan: Dict[str, Any]) -> List[str]:
+        reasons = []
+        cost = plan.get("estimatedCost", 0)
+        if self.max_estimated_cost is not None and cost > self.max_estimated_cost:
+            reasons.append(
+                f"estimated cost {cost} exceeds {self.max_estimated_cost}"
+            )
+        for node in plan.get("nodes", []):
+            if (
+                node.get("type") == "EnumerateCollectionNode"
+                and self.max_full_scan_documents is not None
+                and node.get("estimatedNrItems", 0) > self.max_full_scan_documents
+            ):
+                reasons.append(
+                    f"full scan of collection {node.get('collection')} "
+                    f"(~{node.get('estimatedNrItems')} documents) without an index"
+                )
+            if (
+                node.get("type") in TRAVERSAL_NODES
+                and self.max_traversal_depth is not None
+            ):
+                options = node.get("options", {})
+                depth = options.get("maxDepth", node.get("maxDepth"))
+                if depth is not None and depth > self.max_traversal_depth:
+                    reasons.append(
+                        f"traversal depth {depth} exceeds {self.max_traversal_depth}"
+                    )
+        return reasons
@@ -41,3 +41,27 @@ Helpful Answer:"""
 AQL_QA_PROMPT = PromptTemplate(
     input_variables=["context", "question"], template=AQL_QA_TEMPLATE
 )
+
+AQL_FIX_TEMPLATE = """Task: Rewrite an AQL query that was rejected before execution.
+Instructions:
+- Use only the provided attributes and collection names in the schema.
+- Address every listed problem, e.g. filter on indexed attributes, add a LIMIT or bound traversal depth.
+- Do not include any explanations or additional text.
+- Return only a valid AQL query as output.
+
+Schema:
+{schema}
+
+The question is:
+{question}
+
+Rejected query:
+{aql}
+
+Problems:
+{error}
+"""
+
+AQL_FIX_PROMPT = PromptTemplate(
+    input_variables=["schema", "question", "aql", "error"], template=AQL_FIX_TEMPLATE
+)
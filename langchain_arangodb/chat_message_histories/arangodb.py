@@ -1,11 +1,35 @@
-from typing import List, Optional, Union
+import random
+import threading
+import time
+import warnings
+from datetime import datetime, timezone
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Sequence, Union
+from arango.exceptions import ArangoServerError
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage, messages_from_dict
 from langchain_arangodb.graphs.graph import ArangoGraph
 
+# Write-write conflict and unique constraint violation: two writers raced on
+# the same counter document. The write aborts as a whole and is repeated.
+_RETRYABLE_ERRORS = (1200, 1210)
+SEQUENCE_RETRIES = 5
+SEQUENCE_BACKOFF_SECONDS = 0.01
+
 
 class ArangoChatMessageHistory(BaseChatMessageHistory):
-    """Chat message history stored in an ArangoDB collection."""
+    """Chat message history stored in an ArangoDB collection.
+
+    Messages are ordered by a per-session sequence number ``seq``. Each
+    write advances a counter document per session in ``sequence_collection``
+    and inserts the messages with the numbers it reserved in the same AQL
+    query, so histories for the same session in other threads or processes
+    never hand out the same number. With ``write_behind=True`` added
+    messages are buffered and written in one request once ``flush_size``
+    are pending, ``flush_interval`` seconds after the first of them, on
+    ``flush()``, before ``messages`` is read, or on ``close()``, which also
+    runs when a ``with`` block exits.
+    """
 
     def __init__(
             self,
@@ -18,14 +42,28 @@ class ArangoChatMessageHistory(BaseChatMessageHistory):
             username: str = "root",
             hosts: Union[str, List[str]] = "http://localhost:8529",
             window: int = 3,
+            write_behind: bool = False,
+            flush_size: int = 32,
+            flush_interval: Optional[float] = 1.0,
+            sequence_collection: Optional[str] = None,
     ):
         if not session_id:
             raise ValueError("session_id must be provided")
 
         self._session_id = str(session_id)
         self._collection = collection
+        self._sequence_collection = sequence_collection or f"{collection}_seq"
         self._window = window
+        self._write_behind = write_behind
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._buffer: List[Dict[str, Any]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
 
+        # A graph created here only borrows a pooled client and gives it
+        # back on ``close``; one passed in stays owned by the caller.
+        self._owns_graph = graph is None
         if graph:
             self._graph = graph
         else:
@@ -37,23 +75,46 @@ class ArangoChatMessageHistory(BaseChatMessageHistory):
             )
 
         # Ensure collection exists (optional: add init script if needed)
-        if not self._graph.db.has_collection(self._collection):
-            self._graph.db.create_collection(self._collection)
+        for name in (self._collection, self._sequence_collection):
+            if not self._graph.db.has_collection(name):
+                self._graph.db.create_collection(name)
+        # Serves the latest-window read and the sequence lookup below;
+        # creating an identical index again returns the existing one.
+        messages = self._graph.db.collection(self._collection)
+        index = messages.add_index(
+            {
+                "type": "persistent",
+                "fields": ["session_id", "seq"],
+                "name": "session_seq",
+            }
+        )
+        if isinstance(index, dict) and index.get("new"):
+            # Replaces the (session_id, timestamp) index of earlier versions,
+            # which would otherwise still be maintained on every insert.
+            messages.delete_index("session_timestamp", ignore_missing=True)
 
     @property
     def messages(self) -> List[BaseMessage]:
+        """The latest ``window * 2`` messages of the session, oldest first.
+
+        The ``(session_id, seq)`` index is scanned backwards from the newest
+        message and stops after the window, so the cost does not grow with
+        the session or collection size.
+        """
+        if self._buffer:
+            self.flush()
         query = f"""
         FOR doc IN {self._collection}
             FILTER doc.session_id == @session_id
-            SORT doc.timestamp ASC
+            SORT doc.seq DESC
             LIMIT @limit
-            RETURN {{ type: doc.role, data: doc.content }}
+            RETURN {{ type: doc.role, data: {{ content: doc.content }} }}
         """
         results = self._graph.run_aql(query, {
             "session_id": self._session_id,
             "limit": self._window * 2,
         })
-        return messages_from_dict(results)
+        return messages_from_dict(results[::-1])
 
     @messages.setter
     def messages(self, messages: List[BaseMessage]) -> None:
@@ -63,12 +124,110 @@ class ArangoChatMessageHistory(BaseChatMessageHistory):
         )
 
     def add_message(self, message: BaseMessage) -> None:
-        self._graph.db.collection(self._collection).insert({
+        self.add_messages([message])
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Write ``messages`` in one request, or buffer them in write-behind
+        mode. Sequence numbers are assigned when the messages are written."""
+        if not messages:
+            return
+        timestamp = datetime.now(timezone.utc).isoformat()
+        documents = [
+            {
+                "session_id": self._session_id,
+                "role": message.type,
+                "content": message.content,
+                "timestamp": timestamp,
+            }
+            for message in messages
+        ]
+        if not self._write_behind:
+            self._insert(documents)
+            return
+
+        with self._lock:
+            self._buffer.extend(documents)
+            full = len(self._buffer) >= self._flush_size
+            if not full and self._timer is None and self._flush_interval is not None:
+                self._timer = threading.Timer(
+                    self._flush_interval, self._flush_in_background
+                )
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered messages; they stay buffered if the write fails."""
+        with self._lock:
+            documents, self._buffer = self._buffer, []
+            self._cancel_timer()
+        if not documents:
+            return
+        try:
+            self._insert(documents)
+        except Exception:
+            with self._lock:
+                self._buffer[:0] = documents
+            raise
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            # Kept in the buffer for the next flush, which raises to its caller.
+            pass
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _insert(self, documents: List[Dict[str, Any]]) -> None:
+        """Reserve sequence numbers for ``documents`` and insert them in one
+        query.
+
+        A new counter starts after the highest ``seq`` already stored for
+        the session, so sessions written before counters existed continue
+        in order.
+        """
+        query = """
+        LET latest = FIRST(
+            FOR doc IN @@messages
+                FILTER doc.session_id == @session_id
+                SORT doc.seq DESC
+                LIMIT 1
+                RETURN doc.seq
+        ) || 0
+        LET last = FIRST(
+            UPSERT { _key: @key }
+                INSERT { _key: @key, session_id: @session_id, seq: latest + @count }
+                UPDATE { seq: OLD.seq + @count }
+                IN @@counters
+            RETURN NEW.seq
+        )
+        FOR i IN 0..(@count - 1)
+            INSERT MERGE(@documents[i], { seq: last - @count + 1 + i }) IN @@messages
+        """
+        bind_vars = {
+            "@messages": self._collection,
+            "@counters": self._sequence_collection,
+            # Session ids may contain characters that are not valid in keys.
+            "key": md5(self._session_id.encode("utf-8")).hexdigest(),
             "session_id": self._session_id,
-            "role": message.type,
-            "content": message.content,
-            "timestamp": self._graph.db.datetime().isoformat(),  # optional
-        })
+            "count": len(documents),
+            "documents": documents,
+        }
+        attempt = 0
+        while True:
+            try:
+                self._graph.db.aql.execute(query, bind_vars=bind_vars)
+                return
+            except ArangoServerError as e:
+                if e.error_code not in _RETRYABLE_ERRORS or attempt == SEQUENCE_RETRIES:
+                    raise
+            time.sleep(SEQUENCE_BACKOFF_SECONDS * 2 ** attempt * (1 + random.random()))
+            attempt += 1
 
     def clear(self, delete_session_node: bool = False) -> None:
         if delete_session_node:
@@ -83,7 +242,34 @@ class ArangoChatMessageHistory(BaseChatMessageHistory):
                 FILTER doc.session_id == @session_id
                 REMOVE doc IN {self._collection}
             """
+        with self._lock:
+            self._buffer = []
+            self._cancel_timer()
         self._graph.run_aql(query, {"session_id": self._session_id})
 
+    def __enter__(self) -> "ArangoChatMessageHistory":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write buffered messages and release a graph created by this history."""
+        self.flush()
+        self._release_graph()
+
+    def _release_graph(self) -> None:
+        if getattr(self, "_owns_graph", False):
+            self._owns_graph = False
+            self._graph.close()
+
     def __del__(self) -> None:
-        pass
+        # No network calls from a finalizer; unflushed messages are lost.
+        if getattr(self, "_buffer", None):
+            warnings.warn(
+                f"ArangoChatMessageHistory for session {self._session_id!r} was "
+                f"discarded with {len(self._buffer)} unwritten messages; call "
+                "close() or use it as a context manager.",
+                ResourceWarning,
+            )
+        self._release_graph()
@@ -1,63 +1,247 @@
+import json
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+from langchain_arangodb.graphs.client_registry import PooledClient, default_registry
+from langchain_arangodb.graphs.cursor import iter_aql
 from langchain_arangodb.graphs.graph_store import GraphStore
+from langchain_arangodb.graphs.schema import SchemaIntrospector, format_schema
 from langchain_arangodb.graphs.graph_document import GraphDocument
 from arango.client import ArangoClient
 from arango.database import StandardDatabase
+from arango.exceptions import ArangoServerError
+from arango.resolver import HostResolver
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_RETRIES = 5
+RETRY_BACKOFF_SECONDS = 0.05
+
+# ArangoDB's "conflict" error, raised on write-write conflicts.
+ERROR_ARANGO_CONFLICT = 1200
+# An import detail reads "at position N: ... with error '<message>',
+# offending document: {...}". Only the quoted error message is matched, so
+# document contents and unique constraint violations are not retried.
+_CONFLICT_DETAIL = re.compile(r"^at position (\d+): [^']*'[^']*write-write conflict")
+
+# Documents to write, by collection name and then by ``_key``.
+_Groups = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+def _is_conflict(error: ArangoServerError) -> bool:
+    # Not the HTTP status: unique constraint violations are a 409 as well.
+    return error.error_code == ERROR_ARANGO_CONFLICT
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt * (1 + random.random()))
+
+
+class _InFlightBytes:
+    """Blocks submitters while more than ``limit`` request bytes are in flight.
+
+    A single batch larger than ``limit`` is still let through on its own so
+    that oversized batches cannot deadlock the pool.
+    """
+
+    def __init__(self, limit: Optional[int]) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int) -> None:
+        if self.limit is None:
+            return
+        with self._condition:
+            while self.in_flight and self.in_flight + size > self.limit:
+                self._condition.wait()
+            self.in_flight += size
+
+    def release(self, size: int) -> None:
+        if self.limit is None:
+            return
+        with self._condition:
+            self.in_flight -= size
+            self._condition.notify_all()
 
 
 class ArangoGraph(GraphStore):
     def __init__(
         self,
-        hosts: str = "http://localhost:8529",
+        hosts: Union[str, Sequence[str]] = "http://localhost:8529",
         username: str = "root",
         password: Optional[str] = None,
         db_name: str = "_system",
         enhanced_schema: bool = False,
+        schema_sample_size: int = 100,
+        schema_ttl: Optional[float] = 300.0,
+        schema_max_workers: int = 8,
+        pool_size: int = 10,
+        auth_method: str = "basic",
+        host_resolver: Union[str, HostResolver] = "fallback",
     ) -> None:
-        self.client = ArangoClient(hosts=hosts)
-        self.db: StandardDatabase = self.client.db(db_name, username=username, password=password)
+        self.hosts = hosts
+        self.username = username
+        self.password = password
+        self.db_name = db_name
+        # Shared with every other graph and chat history using the same
+        # credentials; released again by ``close``.
+        self._pooled: Optional[PooledClient] = default_registry.acquire(
+            hosts,
+            db_name,
+            username=username,
+            password=password,
+            pool_size=pool_size,
+            auth_method=auth_method,
+            host_resolver=host_resolver,
+        )
+        self.client = self._pooled.client
+        self.db: StandardDatabase = self._pooled.db
         self.schema = ""
         self.structured_schema: Dict[str, Any] = {}
         self._enhanced_schema = enhanced_schema
+        # Sampled lazily by ``get_schema`` and re-sampled once ``schema_ttl`` passes.
+        self._schema_introspector = SchemaIntrospector(
+            self.db,
+            sample_size=schema_sample_size,
+            ttl=schema_ttl,
+            max_workers=schema_max_workers,
+        )
+
+    @property
+    def host_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-coordinator request, error, in-flight and latency counters.
+
+        Only populated when ``host_resolver`` is a load-balancing strategy or
+        a ``LoadBalancingHostResolver``.
+        """
+        resolver = self._pooled.resolver if self._pooled is not None else None
+        return resolver.stats() if resolver is not None else {}
 
     def query(self, aql: str, bind_vars: dict = {}) -> List[Dict[str, Any]]:
         cursor = self.db.aql.execute(aql, bind_vars=bind_vars)
         return list(cursor)
 
+    def iter_query(
+        self,
+        aql: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+        stream: bool = True,
+        ttl: Optional[int] = None,
+        limit: Optional[int] = None,
+        batches: bool = False,
+    ) -> Iterator[Any]:
+        """Yield query rows (or row batches) lazily instead of as one list.
+
+        See ``iter_aql`` for the cursor options; the server-side cursor is
+        released as soon as iteration stops.
+        """
+        return iter_aql(
+            self.db,
+            aql,
+            bind_vars,
+            batch_size=batch_size,
+            stream=stream,
+            ttl=ttl,
+            limit=limit,
+            batches=batches,
+        )
+
     @property
     def get_schema(self) -> str:
+        if self._schema_introspector.expired():
+            self.refresh_schema()
         return self.schema
 
     @property
     def get_structured_schema(self) -> Dict[str, Any]:
+        if self._schema_introspector.expired():
+            self.refresh_schema()
         return self.structured_schema
 
-    def refresh_schema(self) -> None:
-        # Placeholder: should be implemented with custom AQL to introspect collections and fields
-        self.schema = "(Schema inspection not implemented for ArangoDB)"
-        self.structured_schema = {}
+    def refresh_schema(self, full: bool = False) -> None:
+        """Re-sample collections changed since the last refresh (all with ``full``)."""
+        self.structured_schema = self._schema_introspector.refresh(full=full)
+        self.schema = format_schema(self.structured_schema)
 
     def add_graph_documents(
         self,
         graph_documents: List[GraphDocument],
         include_source: bool = False,
         baseEntityLabel: bool = False,
-    ) -> None:
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_duplicate: str = "replace",
+        workers: int = 1,
+        max_in_flight_bytes: Optional[int] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> Dict[str, Dict[str, int]]:
+        """Write nodes, relationships and (optionally) source documents.
+
+        Documents are grouped by target collection across all of
+        ``graph_documents`` and de-duplicated by ``_key`` (later properties
+        win), then written with one ``import_bulk`` call per ``batch_size``
+        documents. Missing collections are created up front and nodes are
+        written before edges. Returns ``import_bulk`` counts per collection.
+
+        With ``workers > 1`` batches are spread over a thread pool in which
+        every worker has its own HTTP session; all node batches complete
+        before the first edge batch is sent. ``max_in_flight_bytes`` bounds
+        the serialized size of the batches being written at any time.
+        Write-write conflicts are retried up to ``max_retries`` times with
+        exponential backoff.
+        """
+        nodes, edges = self._group_graph_documents(graph_documents, include_source)
+        self._create_missing_collections(nodes, edges)
+
+        counts: Dict[str, Dict[str, int]] = {}
+        for groups in (nodes, edges):
+            jobs = []
+            for name, group in groups.items():
+                docs = list(group.values())
+                for start in range(0, len(docs), batch_size):
+                    jobs.append((name, docs[start:start + batch_size]))
+            results = self._run_imports(
+                jobs, on_duplicate, workers, max_in_flight_bytes, max_retries
+            )
+            for name, result in results:
+                totals = counts.setdefault(
+                    name, {"created": 0, "updated": 0, "ignored": 0, "errors": 0}
+                )
+                for field in totals:
+                    totals[field] += result[field]
+        return counts
+
+    def _group_graph_documents(
+        self, graph_documents: List[GraphDocument], include_source: bool
+    ) -> Tuple[_Groups, _Groups]:
+        nodes: _Groups = defaultdict(dict)
+        edges: _Groups = defaultdict(dict)
+
         for document in graph_documents:
             for node in document.nodes:
-                doc = node.properties.copy()
-                doc["_key"] = node.id
+                key = str(node.id)
+                doc = nodes[node.type].setdefault(key, {"_key": key})
+                doc.update(node.properties)
                 doc["_type"] = node.type
-                self.db.collection(node.type).insert(doc, overwrite=True)
 
             for rel in document.relationships:
                 edge_collection = rel.type.replace(" ", "_").lower()
-                edge = rel.properties.copy()
-                edge["_from"] = f"{rel.source.type}/{rel.source.id}"
-                edge["_to"] = f"{rel.target.type}/{rel.target.id}"
-                self.db.collection(edge_collection).insert(edge, overwrite=True)
+                source = f"{rel.source.type}/{rel.source.id}"
+                target = f"{rel.target.type}/{rel.target.id}"
+                # One edge per (source, target) pair and relationship type.
+                key = rel.properties.get("_key") or md5(
+                    f"{source}\x00{target}".encode("utf-8")
+                ).hexdigest()
+                edge = edges[edge_collection].setdefault(key, {"_key": key})
+                edge.update(rel.properties)
+                edge["_from"] = source
+                edge["_to"] = target
 
             if include_source and document.source:
                 if not document.source.metadata.get("id"):
@@ -67,11 +251,119 @@ class ArangoGraph(GraphStore):
                     "text": document.source.page_content,
                     **document.source.metadata,
                 }
-                self.db.collection("Document").insert(doc, overwrite=True)
+                nodes["Document"][doc["_key"]] = doc
+
+        return nodes, edges
+
+    def _create_missing_collections(self, nodes: _Groups, edges: _Groups) -> None:
+        existing = {collection["name"] for collection in self.db.collections()}
+        for name in nodes:
+            if name not in existing:
+                self.db.create_collection(name)
+        for name in edges:
+            if name not in existing:
+                self.db.create_collection(name, edge=True)
+
+    def _run_imports(
+        self,
+        jobs: List[Tuple[str, List[Dict[str, Any]]]],
+        on_duplicate: str,
+        workers: int,
+        max_in_flight_bytes: Optional[int],
+        max_retries: int,
+    ) -> List[Tuple[str, Dict[str, int]]]:
+        if workers <= 1:
+            return [
+                (
+                    name,
+                    self._import_batch(self.db, name, batch, on_duplicate, max_retries),
+                )
+                for name, batch in jobs
+            ]
+
+        budget = _InFlightBytes(max_in_flight_bytes)
+        local = threading.local()
+        clients: List[ArangoClient] = []
+        clients_lock = threading.Lock()
+
+        def worker_db() -> StandardDatabase:
+            # python-arango clients hold one requests session each; worker
+            # clients share the pooled entry's resolver, options and auth.
+            if not hasattr(local, "db"):
+                client, local.db = self._pooled.connect()
+                with clients_lock:
+                    clients.append(client)
+            return local.db
+
+        def run(name: str, batch: List[Dict[str, Any]], size: int) -> Dict[str, int]:
+            try:
+                return self._import_batch(
+                    worker_db(), name, batch, on_duplicate, max_retries
+                )
+            finally:
+                budget.release(size)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = []
+                for name, batch in jobs:
+                    size = len(json.dumps(batch)) if max_in_flight_bytes else 0
+                    budget.acquire(size)
+                    futures.append((name, executor.submit(run, name, batch, size)))
+                return [(name, future.result()) for name, future in futures]
+        finally:
+            for client in clients:
+                client.close()
+
+    def _import_batch(
+        self,
+        db: StandardDatabase,
+        collection_name: str,
+        docs: List[Dict[str, Any]],
+        on_duplicate: str,
+        max_retries: int,
+    ) -> Dict[str, int]:
+        """``import_bulk`` one batch, retrying write-write conflicts.
+
+        A conflict can fail the whole request or, with ``halt_on_error``
+        off, individual documents; in the latter case only the documents
+        reported as conflicting are re-sent.
+        """
+        collection = db.collection(collection_name)
+        counts = {"created": 0, "updated": 0, "ignored": 0, "errors": 0}
+        for attempt in range(max_retries + 1):
+            try:
+                result = collection.import_bulk(
+                    docs,
+                    on_duplicate=on_duplicate,
+                    halt_on_error=False,
+                    details=True,
+                )
+            except ArangoServerError as e:
+                if not _is_conflict(e) or attempt == max_retries:
+                    raise
+                _backoff(attempt)
+                continue
+
+            for field in counts:
+                counts[field] += result.get(field, 0)
+            conflicts = [
+                int(match.group(1))
+                for match in map(_CONFLICT_DETAIL.search, result.get("details", []))
+                if match
+            ]
+            if not conflicts or attempt == max_retries:
+                break
+            counts["errors"] -= len(conflicts)
+            docs = [docs[position] for position in conflicts]
+            _backoff(attempt)
+        return counts
 
     def close(self) -> None:
-        # Nothing to close for arango-python driver
-        pass
+        """Release the pooled client; safe to call more than once."""
+        pooled, self._pooled = getattr(self, "_pooled", None), None
+        if pooled is not None:
+            default_registry.release(pooled)
 
     def __enter__(self) -> "ArangoGraph":
         return self
@@ -0,0 +1,183 @@
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from langchain_arangodb.graphs.load_balancing import LoadBalancingHostResolver
+
+
+class AsyncArangoClient:
+    """Minimal asyncio client for the ArangoDB HTTP API.
+
+    Covers what the async code paths of this package need (AQL cursors, bulk
+    import and index listing) on top of a single ``httpx.AsyncClient``, so
+    every coroutine shares one keep-alive connection pool instead of
+    borrowing a thread from the event loop's executor.
+
+    With a ``LoadBalancingHostResolver`` each request (each cursor, with
+    all of its batches) goes to the host the resolver picks and is counted
+    in its statistics. Without one, every request goes to the first of
+    ``hosts``; there is no failover to the others.
+    """
+
+    def __init__(
+        self,
+        hosts: Union[str, Sequence[str]] = "http://localhost:8529",
+        db_name: str = "_system",
+        username: str = "root",
+        password: Optional[str] = None,
+        max_connections: int = 100,
+        timeout: Optional[float] = 60.0,
+        transport: Any = None,
+        resolver: Optional[LoadBalancingHostResolver] = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "Could not import httpx python package. "
+                "Please install it with `pip install httpx`."
+            )
+
+        self.host = (hosts if isinstance(hosts, str) else hosts[0]).rstrip("/")
+        self.db_name = db_name
+        self.resolver = resolver
+        self._client = httpx.AsyncClient(
+            auth=(username, password or ""),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    def _pick_host(self) -> str:
+        if self.resolver is None:
+            return self.host
+        return self.resolver.hosts[self.resolver.get_host_index()]
+
+    async def _send(
+        self, method: str, endpoint: str, host: Optional[str] = None, **kwargs: Any
+    ) -> Any:
+        host = host or self._pick_host()
+        url = f"{host}/_db/{self.db_name}{endpoint}"
+        index = self.resolver.host_index(host) if self.resolver else None
+        if index is None:
+            return await self._client.request(method, url, **kwargs)
+
+        self.resolver.begin(index)
+        started = time.perf_counter()
+        try:
+            response = await self._client.request(method, url, **kwargs)
+        except Exception:
+            self.resolver.record(index, time.perf_counter() - started, error=True)
+            raise
+        self.resolver.record(
+            index, time.perf_counter() - started, error=response.status_code >= 500
+        )
+        return response
+
+    async def _request(
+        self, method: str, endpoint: str, host: Optional[str] = None, **kwargs: Any
+    ) -> Any:
+        response = await self._send(method, endpoint, host, **kwargs)
+        if response.is_error:
+            # Proxies and load balancers answer e.g. a 502 with HTML.
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            self._raise(method, endpoint, response.status_code, body)
+        body = response.json()
+        if isinstance(body, dict) and body.get("error"):
+            self._raise(method, endpoint, response.status_code, body)
+        return body
+
+    @staticmethod
+    def _raise(method: str, endpoint: str, status_code: int, body: Any) -> None:
+        message = body.get("errorMessage") if isinstance(body, dict) else body
+        raise RuntimeError(
+            f"ArangoDB request {method} {endpoint} failed ({status_code}): {message}"
+        )
+
+    async def iter_query(
+        self,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+        memory_limit: Optional[int] = None,
+        **options: Any,
+    ) -> AsyncIterator[Any]:
+        """Yield AQL result rows, fetching further cursor batches on demand.
+
+        ``options`` are passed as cursor ``options`` (e.g. ``stream=True``).
+        The server-side cursor is deleted if iteration stops early.
+        """
+        payload: Dict[str, Any] = {"query": query, "bindVars": bind_vars or {}}
+        if batch_size is not None:
+            payload["batchSize"] = batch_size
+        if memory_limit is not None:
+            payload["memoryLimit"] = memory_limit
+        if options:
+            payload["options"] = options
+
+        # Cursors live on one coordinator, so every batch is read from it.
+        host = self._pick_host()
+        body = await self._request("POST", "/_api/cursor", host, json=payload)
+        cursor_id = body.get("id")
+        try:
+            while True:
+                for row in body.get("result", []):
+                    yield row
+                if not body.get("hasMore"):
+                    cursor_id = None
+                    return
+                body = await self._request("PUT", f"/_api/cursor/{cursor_id}", host)
+        finally:
+            if cursor_id is not None:
+                await self._send("DELETE", f"/_api/cursor/{cursor_id}", host)
+
+    async def execute(
+        self,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+        **options: Any,
+    ) -> List[Any]:
+        return [
+            row
+            async for row in self.iter_query(query, bind_vars, batch_size, **options)
+        ]
+
+    async def import_bulk(
+        self,
+        collection: str,
+        documents: List[Dict[str, Any]],
+        on_duplicate: str = "error",
+        details: bool = True,
+    ) -> Dict[str, Any]:
+        return await self._request(
+            "POST",
+            "/_api/import",
+            params={
+                "collection": collection,
+                "type": "list",
+                "onDuplicate": on_duplicate,
+                "details": str(details).lower(),
+            },
+            json=documents,
+        )
+
+    async def indexes(self, collection: str) -> List[Dict[str, Any]]:
+        body = await self._request(
+            "GET", "/_api/index", params={"collection": collection}
+        )
+        return body["indexes"]
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncArangoClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,190 @@
+import functools
+import threading
+import time
+from hashlib import sha256
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from arango.client import ArangoClient
+from arango.database import StandardDatabase
+from arango.http import DefaultHTTPClient
+from arango.resolver import HostResolver
+
+from langchain_arangodb.graphs.load_balancing import (
+    STRATEGIES,
+    InstrumentedHTTPClient,
+    LoadBalancingHostResolver,
+)
+
+_Key = Tuple[Tuple[str, ...], str, str, str, Any]
+_Connect = Callable[[], Tuple[ArangoClient, StandardDatabase]]
+
+
+class PooledClient:
+    """A shared ``ArangoClient`` and database handle with a reference count."""
+
+    def __init__(
+        self,
+        key: _Key,
+        client: ArangoClient,
+        db: StandardDatabase,
+        resolver: Optional[LoadBalancingHostResolver] = None,
+        connect: Optional[_Connect] = None,
+    ) -> None:
+        self.key = key
+        self.client = client
+        self.db = db
+        self.resolver = resolver
+        self.references = 0
+        self.released_at = time.monotonic()
+        self._connect = connect
+
+    def connect(self) -> Tuple[ArangoClient, StandardDatabase]:
+        """Open another client and database handle configured like this entry.
+
+        The new client has its own HTTP session but the same hosts, host
+        resolver (so ``host_stats`` counts its requests), HTTP options and
+        authentication. It is not pooled; the caller closes it.
+        """
+        if self._connect is None:
+            raise RuntimeError("This pooled client cannot open further sessions.")
+        return self._connect()
+
+    def close(self) -> None:
+        self.client.close()
+        if self.resolver is not None:
+            self.resolver.close()
+
+
+class ClientRegistry:
+    """Process-wide pool of ArangoDB clients keyed by hosts, database and user.
+
+    Each entry owns one HTTP session (a ``requests`` connection pool of
+    ``pool_size`` keep-alive connections) and one database handle, so with
+    ``auth_method="jwt"`` the token fetched on first use is reused by every
+    holder. The password is part of the key (as a digest) so that a handle
+    is never shared with a caller holding different credentials.
+
+    Entries are reference counted; once the last holder releases one it is
+    kept for ``idle_timeout`` seconds (``None`` keeps it forever, ``0``
+    closes it immediately) so that short-lived objects such as per-request
+    chat histories do not pay connection setup and authentication again.
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = 300.0) -> None:
+        self.idle_timeout = idle_timeout
+        self._entries: Dict[_Key, PooledClient] = {}
+        # Reentrant: a graph finalized by the garbage collector while this
+        # thread holds the lock releases its entry from inside ``__del__``.
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire(
+        self,
+        hosts: Union[str, Sequence[str]] = "http://localhost:8529",
+        db_name: str = "_system",
+        username: str = "root",
+        password: Optional[str] = None,
+        pool_size: int = 10,
+        auth_method: str = "basic",
+        request_timeout: Optional[float] = 60,
+        host_resolver: Union[str, HostResolver] = "fallback",
+    ) -> PooledClient:
+        """Return the shared entry for these credentials, creating it if needed.
+
+        ``host_resolver`` is one of python-arango's resolver names, one of the
+        ``LoadBalancingHostResolver`` strategies or a resolver instance, and is
+        part of the key. ``pool_size``, ``auth_method`` and ``request_timeout``
+        only apply when the entry is created. Pair every call with ``release``.
+        """
+        host_list = (hosts,) if isinstance(hosts, str) else tuple(hosts)
+        digest = sha256((password or "").encode("utf-8")).hexdigest()
+        resolver_key = (
+            host_resolver if isinstance(host_resolver, str) else id(host_resolver)
+        )
+        key = (host_list, db_name, username, digest, resolver_key)
+
+        with self._lock:
+            self._prune()
+            entry = self._entries.get(key)
+            if entry is None:
+                if host_resolver in STRATEGIES:
+                    host_resolver = LoadBalancingHostResolver(
+                        host_list, strategy=str(host_resolver)
+                    )
+                resolver = (
+                    host_resolver
+                    if isinstance(host_resolver, LoadBalancingHostResolver)
+                    else None
+                )
+                connect = functools.partial(
+                    _connect,
+                    hosts,
+                    host_resolver,
+                    {
+                        "request_timeout": request_timeout,
+                        "pool_connections": pool_size,
+                        "pool_maxsize": pool_size,
+                    },
+                    db_name,
+                    username,
+                    password,
+                    auth_method,
+                )
+                client, db = connect()
+                entry = self._entries[key] = PooledClient(
+                    key, client, db, resolver, connect
+                )
+            entry.references += 1
+            return entry
+
+    def release(self, entry: PooledClient) -> None:
+        with self._lock:
+            entry.references -= 1
+            entry.released_at = time.monotonic()
+            self._prune()
+
+    def close_all(self) -> None:
+        """Close every pooled client, including ones still referenced."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.close()
+            self._entries.clear()
+
+    def _prune(self) -> None:
+        if self.idle_timeout is None:
+            return
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if entry.references <= 0 and now - entry.released_at >= self.idle_timeout:
+                # A reentrant ``release`` may have pruned it already.
+                if self._entries.pop(key, None) is not None:
+                    entry.close()
+
+
+def _connect(
+    hosts: Union[str, Sequence[str]],
+    host_resolver: Union[str, HostResolver],
+    http_options: Dict[str, Any],
+    db_name: str,
+    username: str,
+    password: Optional[str],
+    auth_method: str,
+) -> Tuple[ArangoClient, StandardDatabase]:
+    if isinstance(host_resolver, LoadBalancingHostResolver):
+        http_client: DefaultHTTPClient = InstrumentedHTTPClient(
+            host_resolver, **http_options
+        )
+    else:
+        http_client = DefaultHTTPClient(**http_options)
+    client = ArangoClient(
+        hosts=hosts, host_resolver=host_resolver, http_client=http_client
+    )
+    db = client.db(
+        db_name, username=username, password=password, auth_method=auth_method
+    )
+    return client, db
+
+
+default_registry = ClientRegistry()
@@ -0,0 +1,62 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+from arango.database import StandardDatabase
+
+
+def check_limit(limit: Optional[int]) -> None:
+    if limit is not None and limit < 0:
+        raise ValueError(f"limit must not be negative, got {limit}")
+
+
+def iter_aql(
+    db: StandardDatabase,
+    query: str,
+    bind_vars: Optional[Dict[str, Any]] = None,
+    batch_size: Optional[int] = None,
+    stream: bool = True,
+    ttl: Optional[int] = None,
+    limit: Optional[int] = None,
+    batches: bool = False,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Lazily yield the rows of an AQL query, or lists of rows with ``batches``.
+
+    Rows are pulled from the server ``batch_size`` at a time. With
+    ``stream=True`` the server also produces them lazily instead of
+    materializing the full result before the first batch. Iteration stops
+    after ``limit`` rows, and the server-side cursor is deleted whenever
+    iteration ends before the result is exhausted (``limit``, ``break`` or
+    an exception in the consumer). ``limit=0`` yields nothing without
+    running the query.
+    """
+    check_limit(limit)
+    if limit == 0:
+        return
+    if limit is not None and batch_size is None:
+        batch_size = limit
+    cursor = db.aql.execute(
+        query,
+        bind_vars=bind_vars or {},
+        batch_size=batch_size,
+        stream=stream,
+        ttl=ttl,
+        **kwargs,
+    )
+    remaining = limit
+    try:
+        while True:
+            batch: List[Any] = []
+            while not cursor.empty() and (remaining is None or len(batch) < remaining):
+                batch.append(cursor.pop())
+            if remaining is not None:
+                remaining -= len(batch)
+            if batches and batch:
+                yield batch
+            elif not batches:
+                yield from batch
+            if remaining == 0 or not cursor.has_more():
+                return
+            cursor.fetch()
+    finally:
+        if cursor.has_more():
+            cursor.close(ignore_missing=True)
@@ -1,5 +1,12 @@
-from arango.client import ArangoClient
-from typing import Optional, Union, Sequence
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union, Sequence
+
+from arango.resolver import HostResolver
+from langchain_core.runnables.config import run_in_executor
+
+from langchain_arangodb.graphs.async_client import AsyncArangoClient
+from langchain_arangodb.graphs.client_registry import PooledClient, default_registry
+from langchain_arangodb.graphs.cursor import check_limit, iter_aql
+from langchain_arangodb.graphs.schema import SchemaIntrospector, format_schema
 
 
 class ArangoGraph:
@@ -8,10 +15,161 @@ class ArangoGraph:
         db_name: str = "_system",
         username: str = "root",
         password: Optional[str] = None,
-        hosts: Union[str, Sequence[str]] = "http://localhost:8529"
+        hosts: Union[str, Sequence[str]] = "http://localhost:8529",
+        schema_sample_size: int = 100,
+        schema_ttl: Optional[float] = 300.0,
+        pool_size: int = 10,
+        auth_method: str = "basic",
+        host_resolver: Union[str, HostResolver] = "fallback",
+        async_max_connections: int = 100,
     ):
-        self.client = ArangoClient(hosts=hosts)
-        self.db = self.client.db(db_name, username=username, password=password)
+        self.hosts = hosts
+        self.db_name = db_name
+        self.username = username
+        self.password = password
+        self.async_max_connections = async_max_connections
+        # Created on first use by the async methods, see ``async_client``.
+        self._async_client: Optional[AsyncArangoClient] = None
+        self._pooled: Optional[PooledClient] = default_registry.acquire(
+            hosts,
+            db_name,
+            username=username,
+            password=password,
+            pool_size=pool_size,
+            auth_method=auth_method,
+            host_resolver=host_resolver,
+        )
+        self.client = self._pooled.client
+        self.db = self._pooled.db
+        self.schema = ""
+        self.structured_schema: Dict[str, Any] = {}
+        self._schema_introspector = SchemaIntrospector(
+            self.db, sample_size=schema_sample_size, ttl=schema_ttl
+        )
+
+    @property
+    def host_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-coordinator request, error, in-flight and latency counters.
+
+        Only populated when ``host_resolver`` is a load-balancing strategy or
+        a ``LoadBalancingHostResolver``.
+        """
+        resolver = self._pooled.resolver if self._pooled is not None else None
+        return resolver.stats() if resolver is not None else {}
+
+    @property
+    def get_schema(self) -> str:
+        """Sampled schema text, refreshed once ``schema_ttl`` has passed."""
+        if self._schema_introspector.expired():
+            self.refresh_schema()
+        return self.schema
+
+    @property
+    def get_structured_schema(self) -> Dict[str, Any]:
+        if self._schema_introspector.expired():
+            self.refresh_schema()
+        return self.structured_schema
+
+    def refresh_schema(self, full: bool = False) -> None:
+        """Re-sample collections changed since the last refresh (all with ``full``)."""
+        self.structured_schema = self._schema_introspector.refresh(full=full)
+        self.schema = format_schema(self.structured_schema)
+
+    async def aget_schema(self) -> str:
+        """``get_schema`` with the (blocking) refresh moved to an executor."""
+        if self._schema_introspector.expired():
+            await run_in_executor(None, self.refresh_schema)
+        return self.schema
+
+    @property
+    def async_client(self) -> AsyncArangoClient:
+        """Shared asyncio client; all async methods reuse its connection pool.
+
+        It picks hosts through the same load-balancing resolver as the
+        synchronous client, if there is one, and otherwise uses only the
+        first host.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncArangoClient(
+                hosts=self.hosts,
+                db_name=self.db_name,
+                username=self.username,
+                password=self.password,
+                max_connections=self.async_max_connections,
+                resolver=self._pooled.resolver if self._pooled is not None else None,
+            )
+        return self._async_client
+
+    async def arun_aql(
+        self,
+        query: str,
+        bind_vars: Optional[dict] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        stream: bool = True,
+        max_runtime: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+        fail_on_warning: Optional[bool] = None,
+    ) -> List[Any]:
+        """Async ``run_aql`` reading at most ``limit`` rows."""
+        return [
+            row
+            async for row in self.astream_aql(
+                query,
+                bind_vars,
+                limit=limit,
+                batch_size=batch_size,
+                stream=stream,
+                max_runtime=max_runtime,
+                memory_limit=memory_limit,
+                fail_on_warning=fail_on_warning,
+            )
+        ]
+
+    async def astream_aql(
+        self,
+        query: str,
+        bind_vars: Optional[dict] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        stream: bool = True,
+        max_runtime: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+        fail_on_warning: Optional[bool] = None,
+    ) -> AsyncIterator[Any]:
+        """Async ``stream_aql``: yields at most ``limit`` rows as they arrive."""
+        check_limit(limit)
+        if limit == 0:
+            return
+        options: Dict[str, Any] = {"stream": stream}
+        if max_runtime is not None:
+            options["maxRuntime"] = max_runtime
+        if fail_on_warning is not None:
+            options["failOnWarning"] = fail_on_warning
+        cursor = self.async_client.iter_query(
+            query,
+            bind_vars,
+            batch_size=batch_size if batch_size is not None else limit,
+            memory_limit=memory_limit,
+            **options,
+        )
+        count = 0
+        try:
+            async for row in cursor:
+                yield row
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+        except Exception as e:
+            raise RuntimeError(f"AQL execution failed: {e}")
+        finally:
+            # Deletes the server-side cursor if rows are left.
+            await cursor.aclose()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
 
     def run_aql(self, query: str, bind_vars: Optional[dict] = None) -> list[dict]:
         try:
@@ -19,3 +177,50 @@ class ArangoGraph:
             return list(cursor)
         except Exception as e:
             raise RuntimeError(f"AQL execution failed: {e}")
+
+    def stream_aql(
+        self,
+        query: str,
+        bind_vars: Optional[dict] = None,
+        batch_size: Optional[int] = None,
+        stream: bool = True,
+        ttl: Optional[int] = None,
+        limit: Optional[int] = None,
+        batches: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Like ``run_aql`` but yields rows (or row batches) lazily, see ``iter_aql``.
+
+        ``kwargs`` are further ``db.aql.execute`` options such as
+        ``max_runtime``, ``memory_limit`` or ``fail_on_warning``.
+        """
+        check_limit(limit)
+        try:
+            yield from iter_aql(
+                self.db,
+                query,
+                bind_vars,
+                batch_size=batch_size,
+                stream=stream,
+                ttl=ttl,
+                limit=limit,
+                batches=batches,
+                **kwargs,
+            )
+        except Exception as e:
+            raise RuntimeError(f"AQL execution failed: {e}")
+
+    def close(self) -> None:
+        """Release the pooled client; safe to call more than once."""
+        pooled, self._pooled = getattr(self, "_pooled", None), None
+        if pooled is not None:
+            default_registry.release(pooled)
+
+    def __enter__(self) -> "ArangoGraph":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
@@ -0,0 +1,227 @@
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+import requests
+from arango.http import DefaultHTTPClient
+from arango.resolver import HostResolver
+from arango.response import Response
+
+STRATEGIES = ("round_robin", "least_outstanding", "latency_weighted")
+
+
+class HostStats:
+    """Request, error and latency counters of one coordinator."""
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.in_flight = 0
+        # Exponentially weighted moving average of successful request latency.
+        self.latency: Optional[float] = None
+        self.ejected_until = 0.0
+
+    def as_dict(self, now: float) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "latency_ms": None if self.latency is None else self.latency * 1000,
+            "ejected": self.ejected_until > now,
+        }
+
+
+class LoadBalancingHostResolver(HostResolver):
+    """Spread requests over several coordinators and eject unhealthy ones.
+
+    ``strategy`` is ``"round_robin"``, ``"least_outstanding"`` (fewest
+    requests in flight) or ``"latency_weighted"`` (random choice weighted by
+    the inverse of each host's average latency). A host is ejected for
+    ``eject_seconds`` after ``eject_after_errors`` consecutive connection or
+    5xx errors, or when its average latency exceeds ``slow_threshold``
+    seconds; it is re-admitted when the period ends or a health check
+    succeeds. If every host is ejected, all of them are eligible again
+    rather than failing outright.
+
+    Counters are fed by ``InstrumentedHTTPClient``, which ``ClientRegistry``
+    installs for clients created with this resolver.
+    """
+
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        strategy: str = "round_robin",
+        max_tries: Optional[int] = None,
+        eject_after_errors: int = 3,
+        eject_seconds: float = 30.0,
+        slow_threshold: Optional[float] = None,
+        latency_smoothing: float = 0.2,
+        health_check_interval: Optional[float] = None,
+        health_check_timeout: float = 2.0,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; use one of {STRATEGIES}")
+        super().__init__(len(hosts), max_tries)
+        self.hosts = [host.strip("/") for host in hosts]
+        self.strategy = strategy
+        self.eject_after_errors = eject_after_errors
+        self.eject_seconds = eject_seconds
+        self.slow_threshold = slow_threshold
+        self.latency_smoothing = latency_smoothing
+        self.health_check_timeout = health_check_timeout
+        self._stats = [HostStats(host) for host in self.hosts]
+        self._next = 0
+        self._lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        if health_check_interval is not None:
+            self._health_thread = threading.Thread(
+                target=self._health_loop, args=(health_check_interval,), daemon=True
+            )
+            self._health_thread.start()
+
+    def get_host_index(self, indexes_to_filter: Optional[Set[int]] = None) -> int:
+        indexes_to_filter = indexes_to_filter or set()
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                i for i in range(self.host_count) if i not in indexes_to_filter
+            ] or list(range(self.host_count))
+            healthy = [i for i in candidates if self._stats[i].ejected_until <= now]
+            candidates = healthy or candidates
+
+            if self.strategy == "least_outstanding":
+                start = self._next
+                self._next = (self._next + 1) % self.host_count
+                return min(
+                    candidates,
+                    key=lambda i: (
+                        self._stats[i].in_flight,
+                        (i - start) % self.host_count,
+                    ),
+                )
+            if self.strategy == "latency_weighted":
+                known = [
+                    self._stats[i].latency
+                    for i in candidates
+                    if self._stats[i].latency is not None
+                ]
+                # Unmeasured hosts are treated as the fastest so they get sampled.
+                fastest = min(known) if known else 1.0
+                weights = [
+                    1.0 / max(self._stats[i].latency or fastest, 1e-6)
+                    for i in candidates
+                ]
+                return random.choices(candidates, weights=weights)[0]
+
+            for _ in range(self.host_count):
+                index = self._next
+                self._next = (self._next + 1) % self.host_count
+                if index in candidates:
+                    return index
+            return candidates[0]
+
+    def host_index(self, url: str) -> Optional[int]:
+        for i, host in enumerate(self.hosts):
+            if url.startswith(host):
+                return i
+        return None
+
+    def begin(self, index: int) -> None:
+        with self._lock:
+            self._stats[index].in_flight += 1
+
+    def record(self, index: int, latency: float, error: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats[index]
+            stats.in_flight -= 1
+            stats.requests += 1
+            if error:
+                stats.errors += 1
+                stats.consecutive_errors += 1
+                if stats.consecutive_errors >= self.eject_after_errors:
+                    self._eject(stats, now)
+                return
+
+            stats.consecutive_errors = 0
+            if stats.latency is None:
+                stats.latency = latency
+            else:
+                stats.latency += self.latency_smoothing * (latency - stats.latency)
+            if self.slow_threshold is not None and stats.latency > self.slow_threshold:
+                self._eject(stats, now)
+
+    def _eject(self, stats: HostStats, now: float) -> None:
+        stats.ejected_until = now + self.eject_seconds
+        stats.consecutive_errors = 0
+        # Start afresh when the host is re-admitted.
+        stats.latency = None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host counters, keyed by host URL."""
+        now = time.monotonic()
+        with self._lock:
+            return {stats.host: stats.as_dict(now) for stats in self._stats}
+
+    def check_health(self) -> List[bool]:
+        """Probe every host's availability endpoint, ejecting or re-admitting it."""
+        results = []
+        for index, host in enumerate(self.hosts):
+            try:
+                response = requests.get(
+                    f"{host}/_admin/server/availability",
+                    timeout=self.health_check_timeout,
+                )
+                healthy = response.status_code < 500
+            except requests.RequestException:
+                healthy = False
+            now = time.monotonic()
+            with self._lock:
+                if healthy:
+                    self._stats[index].ejected_until = 0.0
+                    self._stats[index].consecutive_errors = 0
+                else:
+                    self._eject(self._stats[index], now)
+            results.append(healthy)
+        return results
+
+    def close(self) -> None:
+        self._stop.set()
+
+    def _health_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.check_health()
+
+
+class InstrumentedHTTPClient(DefaultHTTPClient):
+    """``DefaultHTTPClient`` reporting per-host outcomes to a resolver."""
+
+    def __init__(self, resolver: LoadBalancingHostResolver, **kwargs: Any) -> None:
+        # Fail over to another host at once instead of retrying the same one.
+        kwargs.setdefault("retry_attempts", 0)
+        super().__init__(**kwargs)
+        self.resolver = resolver
+
+    def send_request(
+        self, session: Any, method: str, url: str, **kwargs: Any
+    ) -> Response:
+        index = self.resolver.host_index(url)
+        if index is None:
+            return super().send_request(session, method, url, **kwargs)
+
+        self.resolver.begin(index)
+        started = time.perf_counter()
+        try:
+            response = super().send_request(session, method, url, **kwargs)
+        except Exception:
+            self.resolver.record(index, time.perf_counter() - started, error=True)
+            raise
+        self.resolver.record(
+            index, time.perf_counter() - started, error=response.status_code >= 500
+        )
+        return response
@@ -0,0 +1,150 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from arango.database import StandardDatabase
+
+ATTRIBUTE_TYPES_QUERY = """
+FOR doc IN @@collection
+    LIMIT @sample_size
+    FOR attribute IN ATTRIBUTES(doc, true)
+        COLLECT name = attribute, type = TYPENAME(doc[attribute])
+        RETURN { name, type }
+"""
+
+EDGE_ENDPOINTS_QUERY = """
+FOR edge IN @@collection
+    LIMIT @sample_size
+    COLLECT from = PARSE_IDENTIFIER(edge._from).collection,
+            to = PARSE_IDENTIFIER(edge._to).collection
+    RETURN { from, to }
+"""
+
+
+class SchemaIntrospector:
+    """Infer a database schema by sampling documents, with caching.
+
+    Each non-system collection contributes its type, document count and the
+    attribute names and types seen in its first ``sample_size`` documents;
+    edge collections also list the collection pairs their edges connect.
+    Collections are sampled in parallel and the result is cached per
+    collection revision, so ``refresh`` only re-samples collections that
+    were added or written to since the previous call. ``expired`` reports
+    whether the cache is older than ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        db: StandardDatabase,
+        sample_size: int = 100,
+        ttl: Optional[float] = 300.0,
+        max_workers: int = 8,
+    ) -> None:
+        self.db = db
+        self.sample_size = sample_size
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.refreshed_at: Optional[float] = None
+        self._collections: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def expired(self) -> bool:
+        if self.refreshed_at is None:
+            return True
+        return self.ttl is not None and time.monotonic() - self.refreshed_at > self.ttl
+
+    def refresh(self, full: bool = False) -> Dict[str, Any]:
+        """Return the structured schema, re-sampling changed collections.
+
+        ``full=True`` discards the cache and samples every collection.
+        """
+        with self._lock:
+            if full:
+                self._collections = {}
+            listed = [c for c in self.db.collections() if not c["system"]]
+
+            def revision(info: Dict[str, Any]) -> str:
+                return self.db.collection(info["name"]).revision()
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                revisions = list(executor.map(revision, listed))
+                stale = [
+                    (info, rev)
+                    for info, rev in zip(listed, revisions)
+                    if self._collections.get(info["name"], {}).get("revision") != rev
+                ]
+                sampled = list(executor.map(lambda item: self._sample(*item), stale))
+
+            names = {info["name"] for info in listed}
+            self._collections = {
+                name: entry
+                for name, entry in self._collections.items()
+                if name in names
+            }
+            for entry in sampled:
+                self._collections[entry["name"]] = entry
+            self.refreshed_at = time.monotonic()
+
+            return {
+                "collections": {
+                    name: self._collections[name] for name in sorted(self._collections)
+                },
+                "graphs": [
+                    {
+                        "name": graph["name"],
+                        "edge_definitions": graph["edge_definitions"],
+                    }
+                    for graph in self.db.graphs()
+                ],
+            }
+
+    def _sample(self, info: Dict[str, Any], revision: str) -> Dict[str, Any]:
+        name = info["name"]
+        bind_vars = {"@collection": name, "sample_size": self.sample_size}
+
+        attributes: Dict[str, List[str]] = {}
+        for row in self.db.aql.execute(ATTRIBUTE_TYPES_QUERY, bind_vars=bind_vars):
+            attributes.setdefault(row["name"], []).append(row["type"])
+
+        entry: Dict[str, Any] = {
+            "name": name,
+            "type": info["type"],
+            "count": self.db.collection(name).count(),
+            "revision": revision,
+            "attributes": {
+                attribute: "|".join(sorted(types))
+                for attribute, types in sorted(attributes.items())
+            },
+        }
+        if info["type"] == "edge":
+            entry["endpoints"] = list(
+                self.db.aql.execute(EDGE_ENDPOINTS_QUERY, bind_vars=bind_vars)
+            )
+        return entry
+
+
+def format_schema(structured_schema: Dict[str, Any]) -> str:
+    """Render a structured schema as the text used in AQL generation prompts."""
+    lines = ["Collections:"]
+    for name, entry in structured_schema.get("collections", {}).items():
+        attributes = ", ".join(
+            f"{attribute}: {type_}" for attribute, type_ in entry["attributes"].items()
+        )
+        lines.append(
+            f"- {name} ({entry['type']}, {entry['count']} documents): {attributes}"
+        )
+        for endpoints in entry.get("endpoints", []):
+            lines.append(f"  {endpoints['from']} -> {endpoints['to']}")
+
+    if structured_schema.get("graphs"):
+        lines.append("Graphs:")
+        for graph in structured_schema["graphs"]:
+            definitions = "; ".join(
+                f"{definition['edge_collection']} "
+                f"({', '.join(definition['from_vertex_collections'])} -> "
+                f"{', '.join(definition['to_vertex_collections'])})"
+                for definition in graph["edge_definitions"]
+            )
+            lines.append(f"- {graph['name']}: {definitions}")
+    return "\n".join(lines)
@@ -0,0 +1,116 @@
+"""Compare sync (thread executor) and native async ArangoVector throughput.
+
+Runs against a local stand-in for the ArangoDB HTTP API that answers every
+AQL cursor request after a fixed delay, so the numbers reflect how many
+queries each path keeps in flight rather than database speed::
+
+    python -m langchain_arangodb.tests.integration_tests.benchmark_async
+"""
+
+import asyncio
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from langchain_core.embeddings import FakeEmbeddings
+from langchain_core.vectorstores import VectorStore
+
+from langchain_arangodb.vectorstores.arango_vector import ArangoVector
+
+LATENCY_SECONDS = 0.02
+DIMENSION = 16
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Buffer each response into a single write to avoid Nagle/delayed-ACK stalls.
+    wbufsize = -1
+
+    def _reply(self, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        if "/_api/collection" in self.path:
+            self._reply(200, {"error": False, "result": [{"name": "vectors"}]})
+        else:
+            self._reply(200, {"error": False, "indexes": []})
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(LATENCY_SECONDS)
+        rows = [
+            {"doc": {"_key": str(i), "text": f"doc {i}"}, "score": 1.0, "embedding": None}
+            for i in range(4)
+        ]
+        self._reply(201, {"error": False, "result": rows, "hasMore": False})
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+async def run(store: ArangoVector, concurrency: int, total: int, native: bool) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    query = [0.1] * DIMENSION
+
+    async def one() -> None:
+        async with semaphore:
+            if native:
+                await store.asimilarity_search_by_vector(query, k=4)
+            else:
+                # LangChain's default: the sync method on the loop's executor.
+                await VectorStore.asimilarity_search_by_vector(store, query, k=4)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+def serve(ports: "multiprocessing.Queue[int]") -> None:
+    server = StandInServer(("127.0.0.1", 0), StandInHandler)
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def main() -> None:
+    # The stand-in runs in its own process so it does not share the GIL
+    # with the client being measured.
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(ports,), daemon=True)
+    server.start()
+    port = ports.get()
+
+    store = ArangoVector(
+        FakeEmbeddings(size=DIMENSION),
+        db_url=f"http://127.0.0.1:{port}",
+        username="root",
+        password="",
+        database="_system",
+        collection_name="vectors",
+        async_max_connections=256,
+    )
+
+    print(f"{'in-flight':>10} {'sync q/s':>10} {'async q/s':>10}")
+    for concurrency in (10, 50, 100, 200):
+        total = concurrency * 5
+        sync_rate = asyncio.run(run(store, concurrency, total, native=False))
+        store._async_client = None
+        async_rate = asyncio.run(run(store, concurrency, total, native=True))
+        store._async_client = None
+        print(f"{concurrency:>10} {sync_rate:>10.0f} {async_rate:>10.0f}")
+
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
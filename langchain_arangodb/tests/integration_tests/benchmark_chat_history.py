@@ -0,0 +1,74 @@
+"""Measure ArangoChatMessageHistory.messages latency as the collection grows.
+
+Needs a running ArangoDB on localhost:8529. Loads up to 10M messages spread
+over 100k sessions in stages and, after each stage, reads the latest window
+of randomly chosen sessions. With the ``(session_id, seq)`` index the
+read latency should stay flat from the first stage to the last::
+
+    python -m langchain_arangodb.tests.integration_tests.benchmark_chat_history
+"""
+
+import random
+import statistics
+import time
+
+from langchain_arangodb.chat_message_histories.arangodb import (
+    ArangoChatMessageHistory,
+)
+from langchain_arangodb.graphs.graph import ArangoGraph
+
+COLLECTION = "bench_chat_history"
+SESSIONS = 100_000
+STAGES = (100_000, 1_000_000, 10_000_000)
+IMPORT_BATCH = 50_000
+READS = 500
+
+
+def load(graph: ArangoGraph, start: int, stop: int) -> None:
+    collection = graph.db.collection(COLLECTION)
+    rng = random.Random(start)
+    for offset in range(start, stop, IMPORT_BATCH):
+        collection.import_bulk(
+            [
+                {
+                    "session_id": f"s{rng.randrange(SESSIONS)}",
+                    "role": "human" if i % 2 else "ai",
+                    "content": f"message {i}",
+                    "seq": i,
+                }
+                for i in range(offset, min(offset + IMPORT_BATCH, stop))
+            ]
+        )
+
+
+def main() -> None:
+    graph = ArangoGraph(password="openSesame")
+    graph.db.delete_collection(COLLECTION, ignore_missing=True)
+    rng = random.Random(0)
+
+    print(f"{'messages':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    loaded = 0
+    for stage in STAGES:
+        load(graph, loaded, stage)
+        loaded = stage
+
+        latencies = []
+        for _ in range(READS):
+            history = ArangoChatMessageHistory(
+                f"s{rng.randrange(SESSIONS)}", graph=graph, collection=COLLECTION
+            )
+            started = time.perf_counter()
+            history.messages
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        print(
+            f"{stage:>10} {statistics.median(latencies):>8.2f} "
+            f"{latencies[int(len(latencies) * 0.99)]:>8.2f}"
+        )
+
+    graph.db.delete_collection(COLLECTION)
+    graph.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare ArangoVector embedding encodings by size, encode speed and recall.
+
+Sizes are the serialized JSON bytes sent to ``import_bulk`` per vector,
+encode speed covers encoding plus JSON serialization on the client, and
+recall@10 compares exact cosine top-10 over decoded vectors with the
+float32 originals::
+
+    python -m langchain_arangodb.tests.integration_tests.benchmark_encodings
+"""
+
+import json
+import time
+
+import numpy as np
+
+from langchain_arangodb.vectorstores.local_index import LocalVectorIndex
+from langchain_arangodb.vectorstores.utils import (
+    EmbeddingEncoding,
+    decode_embedding,
+    encode_embedding,
+)
+
+NUM_VECTORS = 10_000
+NUM_QUERIES = 100
+DIMENSION = 1536
+K = 10
+
+
+def top_k(vectors: np.ndarray, queries: np.ndarray) -> list:
+    index = LocalVectorIndex()
+    index.upsert([str(i) for i in range(len(vectors))], ["0"] * len(vectors), vectors)
+    return [{key for key, _ in hits} for hits in index.search_batch(queries, K)]
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(NUM_VECTORS, DIMENSION)).astype(np.float32)
+    queries = vectors[:NUM_QUERIES] + rng.normal(
+        scale=0.5, size=(NUM_QUERIES, DIMENSION)
+    ).astype(np.float32)
+    expected = top_k(vectors, queries)
+    rows = vectors.tolist()
+
+    print(f"{'encoding':>16} {'bytes/vec':>10} {'encode vec/s':>13} {'recall@10':>10}")
+    for encoding in EmbeddingEncoding:
+        started = time.perf_counter()
+        encoded = [encode_embedding(row, encoding) for row in rows]
+        size = sum(len(json.dumps([value, scale])) for value, scale in encoded)
+        rate = NUM_VECTORS / (time.perf_counter() - started)
+
+        decoded = np.stack(
+            [decode_embedding(value, encoding, scale) for value, scale in encoded]
+        )
+        found = top_k(decoded, queries)
+        recall = np.mean([len(a & b) / K for a, b in zip(expected, found)])
+
+        print(
+            f"{encoding.value:>16} {size / NUM_VECTORS:>10.0f} "
+            f"{rate:>13.0f} {recall:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure filtered ArangoVector search latency at several selectivities.
+
+Needs a running ArangoDB (3.12.4+ for vector indexes) on localhost:8529.
+Every document gets a ``bucket`` between 0 and 99, so filtering on
+``bucket < n`` keeps n% of the collection. Each selectivity is measured
+with post-filtering on the vector index and with pre-filtering through a
+persistent index on ``bucket``, and recall@k is reported against an exact
+filtered scan::
+
+    python -m langchain_arangodb.tests.integration_tests.benchmark_filtered_search
+"""
+
+import statistics
+import time
+
+import numpy as np
+from langchain_core.embeddings import FakeEmbeddings
+
+from langchain_arangodb.vectorstores.arango_vector import ArangoVector
+
+NUM_VECTORS = 50_000
+NUM_QUERIES = 50
+DIMENSION = 128
+K = 10
+SELECTIVITIES = (1, 10, 50)
+
+
+def measure(store: ArangoVector, queries: np.ndarray, filter: dict, **kwargs):
+    latencies, results = [], []
+    for query in queries:
+        started = time.perf_counter()
+        docs = store.similarity_search_by_vector(
+            query.tolist(), k=K, filter=filter, **kwargs
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append({doc.metadata["_key"] for doc in docs})
+    return statistics.median(latencies), results
+
+
+def recall(results: list, expected: list) -> float:
+    return float(np.mean([
+        len(found & truth) / max(len(truth), 1)
+        for found, truth in zip(results, expected)
+    ]))
+
+
+def main() -> None:
+    store = ArangoVector(
+        FakeEmbeddings(size=DIMENSION),
+        db_url="http://localhost:8529",
+        username="root",
+        password="openSesame",
+        database="_system",
+        collection_name="benchmark_filtered_search",
+    )
+    store.collection.truncate()
+    for index in store.collection.indexes():
+        if index["type"] not in ("primary", "edge"):
+            store.collection.delete_index(index["id"].split("/")[-1])
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(NUM_VECTORS, DIMENSION)).astype(np.float32)
+    store.add_embeddings(
+        texts=[f"doc {i}" for i in range(NUM_VECTORS)],
+        embeddings=vectors.tolist(),
+        metadatas=[{"bucket": i % 100} for i in range(NUM_VECTORS)],
+    )
+    store.create_vector_index()
+    queries = rng.normal(size=(NUM_QUERIES, DIMENSION)).astype(np.float32)
+
+    print(
+        f"{'selectivity':>12} {'post ms':>9} {'recall':>7} "
+        f"{'pre ms':>9} {'recall':>7} {'exact ms':>9}"
+    )
+    results = {}
+    for percent in SELECTIVITIES:
+        filter = {"bucket": {"$lt": percent}}
+        exact_ms, expected = measure(store, queries, filter, use_index=False)
+        post_ms, post = measure(store, queries, filter)
+        results[percent] = [exact_ms, expected, post_ms, post]
+
+    index = store.create_metadata_index(["bucket"])
+    for percent in SELECTIVITIES:
+        exact_ms, expected, post_ms, post = results[percent]
+        pre_ms, pre = measure(store, queries, {"bucket": {"$lt": percent}})
+        print(
+            f"{percent:>11}% {post_ms:>9.1f} {recall(post, expected):>7.2f} "
+            f"{pre_ms:>9.1f} {recall(pre, expected):>7.2f} {exact_ms:>9.1f}"
+        )
+
+    store.collection.delete_index(index["id"].split("/")[-1])
+
+
+if __name__ == "__main__":
+    main()
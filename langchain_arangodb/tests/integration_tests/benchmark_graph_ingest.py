@@ -0,0 +1,74 @@
+"""Measure ArangoGraph.add_graph_documents throughput against worker count.
+
+Needs a running ArangoDB on localhost:8529. Generates synthetic extraction
+output (a few entities and relationships per source document), drops the
+benchmark collections between runs and reports source documents per
+second for each worker count::
+
+    python -m langchain_arangodb.tests.integration_tests.benchmark_graph_ingest
+"""
+
+import random
+import time
+
+from langchain_core.documents import Document
+
+from langchain_arangodb.graphs.arango_graph import ArangoGraph
+from langchain_arangodb.graphs.graph_document import GraphDocument, Node, Relationship
+
+NUM_DOCUMENTS = 10_000
+NODES_PER_DOCUMENT = 5
+ENTITY_POOL = 20_000
+WORKER_COUNTS = (1, 2, 4, 8, 16)
+COLLECTIONS = ("BenchEntity", "bench_mentions", "Document")
+
+
+def make_documents() -> list:
+    rng = random.Random(0)
+    documents = []
+    for i in range(NUM_DOCUMENTS):
+        nodes = [
+            Node(
+                id=f"e{rng.randrange(ENTITY_POOL)}",
+                type="BenchEntity",
+                properties={"name": f"entity {i}-{j}", "score": rng.random()},
+            )
+            for j in range(NODES_PER_DOCUMENT)
+        ]
+        relationships = [
+            Relationship(source=a, target=b, type="BENCH MENTIONS")
+            for a, b in zip(nodes, nodes[1:])
+        ]
+        documents.append(GraphDocument(
+            nodes=nodes,
+            relationships=relationships,
+            source=Document(page_content=f"source document {i}"),
+        ))
+    return documents
+
+
+def main() -> None:
+    graph = ArangoGraph(password="openSesame")
+    documents = make_documents()
+
+    print(f"{'workers':>8} {'seconds':>9} {'docs/s':>9}")
+    for workers in WORKER_COUNTS:
+        for name in COLLECTIONS:
+            graph.db.delete_collection(name, ignore_missing=True)
+
+        started = time.perf_counter()
+        graph.add_graph_documents(
+            documents,
+            include_source=True,
+            workers=workers,
+            max_in_flight_bytes=64 * 1024 * 1024,
+        )
+        elapsed = time.perf_counter() - started
+        print(f"{workers:>8} {elapsed:>9.2f} {NUM_DOCUMENTS / elapsed:>9.0f}")
+
+    for name in COLLECTIONS:
+        graph.db.delete_collection(name, ignore_missing=True)
+
+
+if __name__ == "__main__":
+    main()
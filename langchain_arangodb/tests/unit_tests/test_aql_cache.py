@@ -0,0 +1,168 @@
+import asyncio
+from typing import List
+from unittest.mock import PropertyMock, patch
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.runnables import RunnableLambda
+
+from langchain_arangodb.chains.graph_qa.aql import GraphAQLQAChain
+from langchain_arangodb.chains.graph_qa.cache import AQLGenerationCache
+from langchain_arangodb.graphs.client_registry import default_registry
+from langchain_arangodb.graphs.graph import ArangoGraph
+
+
+class KeywordEmbeddings(Embeddings):
+    """Bag-of-keywords vectors, so similar wording gives similar vectors."""
+
+    vocabulary = ["people", "persons", "count", "many", "list", "companies"]
+
+    def embed_query(self, text: str) -> List[float]:
+        words = text.replace("?", "").split()
+        vector = [float(word in words) for word in self.vocabulary]
+        # "people" and "persons" mean the same thing here.
+        vector[0] = vector[1] = max(vector[0], vector[1])
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+
+def test_exact_tier_normalizes_questions():
+    cache = AQLGenerationCache()
+    cache.put("How many people?", "schema", "RETURN 1")
+
+    assert cache.get("  how MANY people ", "schema") == "RETURN 1"
+    assert cache.get("how many companies", "schema") is None
+    assert cache.stats["exact_hits"] == 1
+    assert cache.stats["hit_rate"] == 0.5
+
+
+def test_semantic_tier_reuses_similar_questions():
+    cache = AQLGenerationCache(embeddings=KeywordEmbeddings(), similarity_threshold=0.9)
+    cache.put("how many people", "schema", "RETURN 1")
+
+    assert cache.get("how many persons", "schema") == "RETURN 1"
+    assert cache.get("list companies", "schema") is None
+    assert cache.stats["semantic_hits"] == 1
+
+
+class AsyncOnlyEmbeddings(KeywordEmbeddings):
+    """Fails if the blocking ``embed_query`` is used."""
+
+    def embed_query(self, text: str) -> List[float]:
+        raise AssertionError("blocking embed_query called")
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return KeywordEmbeddings.embed_query(self, text)
+
+
+def test_async_lookups_embed_with_aembed_query():
+    cache = AQLGenerationCache(
+        embeddings=AsyncOnlyEmbeddings(), similarity_threshold=0.9
+    )
+
+    async def run():
+        await cache.aput("how many people", "schema", "RETURN 1")
+        assert await cache.aget("how many people", "schema") == "RETURN 1"
+        assert await cache.aget("how many persons", "schema") == "RETURN 1"
+        assert await cache.aget("list companies", "schema") is None
+        await cache.aput("list companies", "schema", "RETURN 2")
+
+    asyncio.run(run())
+
+    assert cache.stats["semantic_hits"] == 1
+    assert len(cache) == 2
+
+
+def test_schema_change_invalidates():
+    cache = AQLGenerationCache(max_size=1)
+    cache.put("a", "schema v1", "RETURN 1")
+    cache.put("b", "schema v1", "RETURN 2")
+
+    assert cache.get("a", "schema v1") is None
+    assert cache.get("b", "schema v2") is None
+    assert cache.stats["invalidations"] == 1
+    assert len(cache) == 0
+
+
+def test_chain_skips_generation_on_cache_hit():
+    with patch("langchain_arangodb.graphs.client_registry.ArangoClient"), patch.object(
+        ArangoGraph, "get_schema", new_callable=PropertyMock, return_value="schema"
+    ):
+        graph = ArangoGraph(password="")
+        graph.stream_aql = lambda aql, limit: iter([{"n": 1}])
+        generated = []
+        chain = GraphAQLQAChain(
+            graph=graph,
+            aql_generation_chain=RunnableLambda(
+                lambda inputs, **kwargs: generated.append(inputs["question"])
+                or "RETURN 1"
+            ),
+            qa_chain=RunnableLambda(lambda inputs, **kwargs: str(inputs["context"])),
+            aql_cache=AQLGenerationCache(),
+        )
+
+        chain.invoke({"query": "How many?"})
+        result = chain.invoke({"query": "how many"})
+
+        assert generated == ["How many?"]
+        assert result["result"] == "[{'n': 1}]"
+        assert chain.aql_cache.stats["exact_hits"] == 1
+        graph.close()
+    default_registry.close_all()
+
+
+def test_data_writes_do_not_invalidate_structured_schema():
+    def structured(count, attributes):
+        return {
+            "collections": {
+                "Person": {
+                    "name": "Person",
+                    "type": "document",
+                    "count": count,
+                    "revision": str(count),
+                    "attributes": attributes,
+                }
+            },
+            "graphs": [],
+        }
+
+    cache = AQLGenerationCache()
+    cache.put("q", structured(10, {"name": "string"}), "RETURN 1")
+
+    assert cache.get("q", structured(11, {"name": "string"})) == "RETURN 1"
+    assert cache.stats["invalidations"] == 0
+    assert cache.get("q", structured(11, {"name": "string", "age": "number"})) is None
+    assert cache.stats["invalidations"] == 1
+
+
+def test_chain_abatch_uses_async_cache_lookups():
+    with patch("langchain_arangodb.graphs.client_registry.ArangoClient"), patch.object(
+        ArangoGraph, "get_schema", new_callable=PropertyMock, return_value="schema"
+    ):
+        graph = ArangoGraph(password="")
+
+        async def aget_schema():
+            return "schema"
+
+        async def arun_aql(aql, limit=None, **kwargs):
+            return [{"n": 1}]
+
+        graph.aget_schema = aget_schema
+        graph.arun_aql = arun_aql
+        chain = GraphAQLQAChain(
+            graph=graph,
+            aql_generation_chain=RunnableLambda(lambda inputs, **kwargs: "RETURN 1"),
+            qa_chain=RunnableLambda(lambda inputs, **kwargs: str(inputs["context"])),
+            aql_cache=AQLGenerationCache(embeddings=AsyncOnlyEmbeddings()),
+        )
+
+        asyncio.run(chain.abatch([{"query": "how many people"}]))
+        results = asyncio.run(
+            chain.abatch([{"query": "how many persons"}, {"query": "list companies"}])
+        )
+
+        assert [r["result"] for r in results] == ["[{'n': 1}]"] * 2
+        assert chain.aql_cache.stats["semantic_hits"] == 1
+        graph.close()
+    default_registry.close_all()
@@ -0,0 +1,205 @@
+import asyncio
+from typing import Any, List
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableLambda
+
+from langchain_arangodb.chains.graph_qa.aql import GraphAQLQAChain
+from langchain_arangodb.chains.graph_qa.context import ContextPacker
+from langchain_arangodb.chains.graph_qa.guard import AQLGuard, QueryRejected
+from langchain_arangodb.chains.graph_qa.prompts import AQL_QA_PROMPT
+from langchain_arangodb.graphs.client_registry import default_registry
+from langchain_arangodb.graphs.graph import ArangoGraph
+
+
+class BatchRecorder(RunnableLambda):
+    """RunnableLambda that records the size of every batch call."""
+
+    def __init__(self, func: Any) -> None:
+        super().__init__(func)
+        object.__setattr__(self, "batches", [])
+
+    def batch(self, inputs: List[Any], *args: Any, **kwargs: Any) -> List[Any]:
+        self.batches.append(len(inputs))
+        return super().batch(inputs, *args, **kwargs)
+
+    async def abatch(self, inputs: List[Any], *args: Any, **kwargs: Any) -> List[Any]:
+        self.batches.append(len(inputs))
+        return await super().abatch(inputs, *args, **kwargs)
+
+
+def generate(inputs, **kwargs):
+    if inputs["question"] == "fail":
+        raise ValueError("no AQL")
+    return f"RETURN {len(inputs['question'])}"
+
+
+@pytest.fixture
+def graph():
+    default_registry.close_all()
+    with patch("langchain_arangodb.graphs.client_registry.ArangoClient"), patch.object(
+        ArangoGraph, "get_schema", new_callable=PropertyMock, return_value="schema"
+    ):
+        graph = ArangoGraph(password="")
+        graph.stream_aql = lambda aql, limit: iter([{"aql": aql}])
+
+        async def arun_aql(aql, limit=None, **kwargs):
+            return [{"aql": aql}]
+
+        async def aget_schema():
+            return "schema"
+
+        graph.arun_aql = arun_aql
+        graph.aget_schema = aget_schema
+        yield graph
+        graph.close()
+    default_registry.close_all()
+
+
+def make_chain(graph):
+    return GraphAQLQAChain(
+        graph=graph,
+        aql_generation_chain=BatchRecorder(generate),
+        qa_chain=BatchRecorder(lambda inputs, **kwargs: str(inputs["context"])),
+        return_intermediate_steps=True,
+    )
+
+
+def test_acall_uses_async_graph(graph):
+    chain = make_chain(graph)
+
+    result = asyncio.run(chain.ainvoke({"query": "abc"}))
+
+    assert result["result"] == "[{'aql': 'RETURN 3'}]"
+    assert result["intermediate_steps"][0] == {"aql": "RETURN 3"}
+
+
+def test_batch_generates_and_answers_in_one_call_each(graph):
+    chain = make_chain(graph)
+
+    results = chain.batch([{"query": "a"}, {"query": "bb"}, {"query": "ccc"}])
+
+    assert [r["result"] for r in results] == [
+        "[{'aql': 'RETURN 1'}]",
+        "[{'aql': 'RETURN 2'}]",
+        "[{'aql': 'RETURN 3'}]",
+    ]
+    assert results[1]["query"] == "bb"
+    assert chain.aql_generation_chain.batches == [3]
+    assert chain.qa_chain.batches == [3]
+
+
+def test_batch_return_exceptions_keeps_other_answers(graph):
+    chain = make_chain(graph)
+
+    results = chain.batch(
+        [{"query": "a"}, {"query": "fail"}], return_exceptions=True
+    )
+
+    assert results[0]["result"] == "[{'aql': 'RETURN 1'}]"
+    assert isinstance(results[1], ValueError)
+    assert chain.qa_chain.batches == [1]
+
+
+def test_abatch(graph):
+    chain = make_chain(graph)
+
+    results = asyncio.run(
+        chain.abatch([{"query": "a"}, {"query": "bb"}], {"max_concurrency": 1})
+    )
+
+    assert [r["result"] for r in results] == [
+        "[{'aql': 'RETURN 1'}]",
+        "[{'aql': 'RETURN 2'}]",
+    ]
+    assert chain.aql_generation_chain.batches == [2]
+
+
+def test_context_packing_is_reported(graph):
+    chain = make_chain(graph)
+    chain.context_packer = ContextPacker()
+
+    result = chain.invoke({"query": "abc"})
+
+    assert result["result"] == '{"aql":"RETURN 3"}'
+    packing = result["intermediate_steps"][2]["context_packing"]
+    assert packing["rows"] == 1
+    assert packing["tokens"] < packing["original_tokens"]
+
+
+def test_rejected_aql_is_regenerated_with_feedback(graph):
+    graph.db.aql.explain.side_effect = lambda aql: (
+        {"estimatedCost": 10**6, "nodes": []}
+        if "Person" in aql
+        else {"estimatedCost": 1, "nodes": []}
+    )
+    fixes = []
+    chain = make_chain(graph)
+    chain.aql_guard = AQLGuard(max_estimated_cost=100)
+    chain.aql_fix_chain = RunnableLambda(
+        lambda inputs, **kwargs: fixes.append(inputs["error"]) or "RETURN 1"
+    )
+    chain.aql_generation_chain = RunnableLambda(
+        lambda inputs, **kwargs: "FOR p IN Person RETURN p"
+    )
+
+    result = chain.invoke({"query": "abc"})
+
+    assert result["intermediate_steps"][0] == {"aql": "RETURN 1"}
+    assert "estimated cost" in fixes[0]
+
+
+def test_rejection_raised_after_max_regenerations(graph):
+    graph.db.aql.explain.return_value = {"estimatedCost": 10**6, "nodes": []}
+    chain = make_chain(graph)
+    chain.aql_guard = AQLGuard(max_estimated_cost=100)
+    chain.aql_fix_chain = RunnableLambda(lambda inputs, **kwargs: "RETURN 2")
+    chain.max_aql_regenerations = 1
+
+    results = chain.batch([{"query": "a"}], return_exceptions=True)
+
+    assert isinstance(results[0], QueryRejected)
+    assert results[0].aql == "RETURN 2"
+
+
+def streaming_chain(graph):
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content="Three people.")]))
+    return GraphAQLQAChain(
+        graph=graph,
+        aql_generation_chain=RunnableLambda(generate),
+        qa_chain=AQL_QA_PROMPT | llm | StrOutputParser(),
+    )
+
+
+def test_stream_yields_aql_rows_and_tokens(graph):
+    graph.stream_aql = lambda aql, limit: iter([{"n": 1}, {"n": 2}])
+
+    events = list(streaming_chain(graph).stream({"query": "abc"}))
+
+    assert events[0] == {"event": "aql", "data": "RETURN 3"}
+    assert [e["data"] for e in events if e["event"] == "row"] == [{"n": 1}, {"n": 2}]
+    tokens = [e["data"] for e in events if e["event"] == "token"]
+    assert len(tokens) > 1
+    assert events[-1] == {
+        "event": "end",
+        "data": {"query": "abc", "result": "Three people."},
+    }
+
+
+def test_astream(graph):
+    async def astream_aql(aql, limit=None, **kwargs):
+        yield {"aql": aql}
+
+    graph.astream_aql = astream_aql
+
+    async def collect():
+        return [e async for e in streaming_chain(graph).astream({"query": "abc"})]
+
+    events = asyncio.run(collect())
+
+    assert [e["event"] for e in events[:2]] == ["aql", "row"]
+    assert events[-1]["data"]["result"] == "Three people."
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_arangodb.chains.graph_qa.guard import (
+    AQLGuard,
+    QueryRejected,
+    inject_limit,
+)
+
+FULL_SCAN = {
+    "estimatedCost": 1_000_002,
+    "nodes": [
+        {"type": "SingletonNode", "estimatedNrItems": 1},
+        {
+            "type": "EnumerateCollectionNode",
+            "collection": "Person",
+            "estimatedNrItems": 1_000_000,
+        },
+    ],
+}
+
+
+def test_inject_limit_before_final_top_level_return():
+    aql = "FOR p IN Person\n  LET f = (FOR x IN Friend LIMIT 2 RETURN x)\n  RETURN p"
+
+    assert inject_limit(aql, 5) == (
+        "FOR p IN Person\n  LET f = (FOR x IN Friend LIMIT 2 RETURN x)\n"
+        "  LIMIT 5\nRETURN p"
+    )
+
+
+def test_inject_limit_ignores_attributes_named_like_keywords():
+    aql = "FOR doc IN Quota FILTER doc.limit > 5 SORT doc . limit RETURN doc.limit"
+
+    assert inject_limit(aql, 5) == (
+        "FOR doc IN Quota FILTER doc.limit > 5 SORT doc . limit LIMIT 5\n"
+        "RETURN doc.limit"
+    )
+
+
+@pytest.mark.parametrize(
+    "aql",
+    [
+        "FOR p IN Person LIMIT 3 RETURN p",
+        "RETURN LENGTH(FOR p IN Person RETURN p)",
+        "FOR p IN Person FILTER p.note == 'RETURN' SORT p.age limit 1 RETURN p",
+    ],
+)
+def test_inject_limit_leaves_bounded_queries(aql):
+    assert inject_limit(aql, 5) == aql
+
+
+def test_check_rejects_large_full_scans_with_plan_feedback():
+    db = MagicMock()
+    db.aql.explain.return_value = FULL_SCAN
+    guard = AQLGuard(max_full_scan_documents=10_000, max_estimated_cost=1e5)
+
+    with pytest.raises(QueryRejected) as info:
+        guard.check(db, "FOR p IN Person RETURN p", limit=10)
+
+    assert len(info.value.reasons) == 2
+    assert info.value.aql == "FOR p IN Person LIMIT 10\nRETURN p"
+    assert '"collection": "Person"' in info.value.feedback()
+
+
+def test_check_accepts_cheap_queries_and_reports_options():
+    db = MagicMock()
+    db.aql.explain.return_value = {"estimatedCost": 3, "nodes": []}
+    guard = AQLGuard(max_estimated_cost=10, max_runtime=5.0, fail_on_warning=True)
+
+    assert guard.check(db, "RETURN 1", limit=10) == "RETURN 1"
+    assert guard.query_options() == {"max_runtime": 5.0, "fail_on_warning": True}
@@ -0,0 +1,154 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from arango.exceptions import ArangoServerError
+from langchain_core.documents import Document
+
+from langchain_arangodb.graphs.arango_graph import ArangoGraph
+from langchain_arangodb.graphs.client_registry import default_registry
+from langchain_arangodb.graphs.graph_document import GraphDocument, Node, Relationship
+
+
+@pytest.fixture
+def mock_graph():
+    with patch("langchain_arangodb.graphs.client_registry.ArangoClient") as client, \
+            patch("langchain_arangodb.graphs.arango_graph.ArangoClient", client):
+        default_registry.close_all()
+        db = client.return_value.db.return_value
+        db.collections.return_value = [{"name": "Person"}]
+        collections = {}
+
+        def collection(name):
+            if name not in collections:
+                collections[name] = MagicMock()
+                collections[name].import_bulk.side_effect = lambda docs, **kwargs: {
+                    "created": len(docs), "updated": 0, "ignored": 0, "errors": 0,
+                }
+            return collections[name]
+
+        db.collection.side_effect = collection
+        graph = ArangoGraph()
+        graph.collections = collections
+        yield graph
+        graph.close()
+        default_registry.close_all()
+
+
+def graph_documents(count):
+    alice = Node(id="alice", type="Person", properties={"age": 30})
+    documents = []
+    for i in range(count):
+        company = Node(id=f"c{i % 3}", type="Company")
+        documents.append(GraphDocument(
+            nodes=[alice, company],
+            relationships=[Relationship(source=alice, target=company, type="WORKS AT")],
+            source=Document(page_content=f"text {i}"),
+        ))
+    return documents
+
+
+def test_add_graph_documents_groups_and_deduplicates(mock_graph):
+    counts = mock_graph.add_graph_documents(
+        graph_documents(5), include_source=True, batch_size=2
+    )
+
+    assert counts["Person"]["created"] == 1
+    assert counts["Company"]["created"] == 3
+    assert counts["works_at"]["created"] == 3
+    assert counts["Document"]["created"] == 5
+
+    company_calls = mock_graph.collections["Company"].import_bulk.call_args_list
+    assert [len(call.args[0]) for call in company_calls] == [2, 1]
+    assert all(call.kwargs["on_duplicate"] == "replace" for call in company_calls)
+    edge = mock_graph.collections["works_at"].import_bulk.call_args_list[0].args[0][0]
+    assert edge["_from"] == "Person/alice" and edge["_to"] == "Company/c0"
+
+
+def test_add_graph_documents_creates_missing_collections_once(mock_graph):
+    mock_graph.add_graph_documents(graph_documents(3))
+
+    created = mock_graph.db.create_collection.call_args_list
+    assert [(call.args, call.kwargs) for call in created] == [
+        (("Company",), {}),
+        (("works_at",), {"edge": True}),
+    ]
+    assert mock_graph.db.collections.call_count == 1
+
+
+def test_parallel_ingest_writes_nodes_before_edges(mock_graph):
+    order = []
+    for name in ("Person", "Company", "works_at"):
+        collection = mock_graph.db.collection(name)
+        collection.import_bulk.side_effect = lambda docs, name=name, **kwargs: (
+            order.append(name) or {"created": len(docs)}
+        )
+
+    counts = mock_graph.add_graph_documents(
+        graph_documents(12), batch_size=1, workers=4, max_in_flight_bytes=64
+    )
+
+    assert counts["Company"]["created"] == 3
+    assert counts["works_at"]["created"] == 3
+    assert set(order[:4]) == {"Person", "Company"}
+    assert order[4:] == ["works_at"] * 3
+
+
+def test_conflicts_are_retried(mock_graph, monkeypatch):
+    monkeypatch.setattr(
+        "langchain_arangodb.graphs.arango_graph.RETRY_BACKOFF_SECONDS", 0
+    )
+    response = MagicMock(
+        error_code=1200, error_message="write-write conflict", status_code=409
+    )
+    collection = mock_graph.db.collection("Company")
+    collection.import_bulk.side_effect = [
+        ArangoServerError(response, MagicMock()),
+        {
+            "created": 2, "errors": 1,
+            "details": ["at position 1: creating document failed with error "
+                        "'conflict, write-write conflict'"],
+        },
+        {"created": 1},
+    ]
+
+    counts = mock_graph.add_graph_documents(graph_documents(3))
+
+    assert counts["Company"] == {"created": 3, "updated": 0, "ignored": 0, "errors": 0}
+    retried = collection.import_bulk.call_args_list[2].args[0]
+    assert [doc["_key"] for doc in retried] == ["c1"]
+
+
+def test_unique_constraint_violation_is_raised_without_retry(mock_graph):
+    response = MagicMock(
+        error_code=1210, error_message="unique constraint violated", status_code=409
+    )
+    collection = mock_graph.db.collection("Company")
+    collection.import_bulk.side_effect = ArangoServerError(response, MagicMock())
+
+    with pytest.raises(ArangoServerError) as error:
+        mock_graph.add_graph_documents(graph_documents(3))
+
+    assert error.value.http_code == 409
+    assert collection.import_bulk.call_count == 1
+
+
+def test_only_write_write_conflicts_are_retried(mock_graph):
+    collection = mock_graph.db.collection("Company")
+    collection.import_bulk.side_effect = [
+        {
+            "created": 1, "errors": 2,
+            "details": [
+                "at position 0: creating document failed with error 'unique "
+                "constraint violated - in index primary of type primary over "
+                "'_key'; conflicting key: c0', offending document: {}",
+                "at position 1: creating document failed with error 'illegal "
+                "document key', offending document: {\"note\": \"write-write "
+                "conflict\"}",
+            ],
+        },
+    ]
+
+    counts = mock_graph.add_graph_documents(graph_documents(3))
+
+    assert counts["Company"]["errors"] == 2
+    assert collection.import_bulk.call_count == 1
@@ -0,0 +1,371 @@
+import asyncio
+from hashlib import md5
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.embeddings import FakeEmbeddings
+
+from langchain_arangodb.graphs.async_client import AsyncArangoClient
+from langchain_arangodb.vectorstores.arango_vector import ArangoVector
+from langchain_arangodb.vectorstores.embedding_cache import InMemoryQueryEmbeddingCache
+from langchain_arangodb.vectorstores.local_index import LocalVectorIndex
+from langchain_arangodb.vectorstores.utils import EmbeddingEncoding
+
+
+@pytest.fixture
+def mock_store():
+    with patch("langchain_arangodb.vectorstores.arango_vector.ArangoClient") as client:
+        db = client.return_value.db.return_value
+        collection = MagicMock()
+        collection.import_bulk.side_effect = lambda docs, **kwargs: {
+            "created": len(docs), "updated": 0, "ignored": 0, "errors": 0,
+        }
+        db.collection.return_value = collection
+        yield ArangoVector(
+            FakeEmbeddings(size=4),
+            db_url="http://localhost:8529",
+            username="root",
+            password="",
+            database="_system",
+            collection_name="vectors",
+            batch_size=2,
+        )
+
+
+def test_add_texts_writes_in_batches(mock_store):
+    texts = (f"text {i}" for i in range(5))
+    ids = mock_store.add_texts(texts, metadatas=({"i": i} for i in range(5)))
+
+    assert len(ids) == 5
+    calls = mock_store.collection.import_bulk.call_args_list
+    assert [len(call.args[0]) for call in calls] == [2, 2, 1]
+    assert all(call.kwargs["on_duplicate"] == "replace" for call in calls)
+    assert calls[2].args[0][0]["i"] == 4
+    assert [batch["created"] for batch in mock_store.last_import_summary] == [2, 2, 1]
+
+
+def test_metadata_cannot_overwrite_stored_fields(mock_store):
+    metadata = {"_key": "evil", mock_store.text_field: "x", "source": "a.txt"}
+    ids = mock_store.add_embeddings(["hello"], [[0.1, 0.2]], [metadata], ["k1"])
+
+    doc = mock_store.collection.import_bulk.call_args.args[0][0]
+    assert ids == ["k1"]
+    assert doc["_key"] == "k1"
+    assert doc[mock_store.text_field] == "hello"
+    assert doc["source"] == "a.txt"
+
+
+def test_mismatched_lengths_are_rejected(mock_store):
+    with pytest.raises(ValueError, match="same number"):
+        mock_store.add_embeddings(["a", "b"], [[0.1], [0.2]], ids=["only-one"])
+    with pytest.raises(ValueError, match="same number"):
+        mock_store.add_texts(["a", "b", "c"], metadatas=[{}, {}])
+
+
+def test_add_texts_pipelined(mock_store):
+    texts = [f"text {i}" for i in range(7)]
+    ids = mock_store.add_texts(texts, pipelined=True, queue_depth=1)
+
+    assert len(ids) == 7
+    assert mock_store.collection.import_bulk.call_count == 4
+    assert mock_store.last_pipeline_stats["documents"] == 7
+    assert mock_store.last_pipeline_stats["batches"] == 4
+    assert mock_store.last_pipeline_stats["docs_per_second"] > 0
+
+
+def test_add_texts_pipelined_propagates_write_errors(mock_store):
+    mock_store.collection.import_bulk.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        mock_store.add_texts([f"text {i}" for i in range(7)], pipelined=True)
+
+
+def test_similarity_search_uses_vector_index(mock_store):
+    mock_store.collection.indexes.return_value = [
+        {"id": "1", "type": "vector", "fields": ["embedding"],
+         "params": {"metric": "cosine", "dimension": 4, "nLists": 1}},
+    ]
+    mock_store.db.aql.execute.return_value = iter([
+        {"doc": {"_key": "a", "text": "hello", "lang": "en"}, "score": 0.9,
+         "embedding": None},
+    ])
+
+    results = mock_store.similarity_search_with_score_by_vector([0.1] * 4, k=1, n_probe=8)
+
+    aql, bind_vars = (
+        mock_store.db.aql.execute.call_args.args[0],
+        mock_store.db.aql.execute.call_args.kwargs["bind_vars"],
+    )
+    assert "APPROX_NEAR_COSINE" in aql
+    assert bind_vars["n_probe"] == 8
+    assert results[0][0].page_content == "hello"
+    assert results[0][0].metadata == {"_key": "a", "lang": "en"}
+    assert results[0][1] == 0.9
+
+
+def test_similarity_search_falls_back_to_exact_scan(mock_store):
+    mock_store.collection.indexes.return_value = []
+    mock_store.db.aql.execute.return_value = iter([])
+
+    mock_store.similarity_search_by_vector([0.1] * 4, k=3)
+
+    aql = mock_store.db.aql.execute.call_args.args[0]
+    assert "COSINE_SIMILARITY" in aql
+    assert "APPROX_NEAR" not in aql
+
+
+def test_filter_post_filters_approximate_search(mock_store):
+    mock_store.collection.indexes.return_value = [
+        {"id": "1", "type": "vector", "fields": ["embedding"],
+         "params": {"metric": "cosine", "dimension": 4, "nLists": 1}},
+    ]
+    mock_store.db.aql.execute.return_value = iter([])
+
+    mock_store.similarity_search_by_vector([0.1] * 4, k=3, filter={"lang": "en"})
+
+    aql = mock_store.db.aql.execute.call_args.args[0]
+    bind_vars = mock_store.db.aql.execute.call_args.kwargs["bind_vars"]
+    assert "APPROX_NEAR_COSINE" in aql
+    assert aql.index("LIMIT @fetch_k") < aql.index("FILTER doc.`lang` == @filter_0")
+    assert bind_vars["fetch_k"] == 30
+    assert bind_vars["filter_0"] == "en"
+
+
+def test_filter_on_indexed_field_pre_filters(mock_store):
+    mock_store.collection.indexes.return_value = [
+        {"id": "1", "type": "vector", "fields": ["embedding"],
+         "params": {"metric": "cosine", "dimension": 4, "nLists": 1}},
+        {"id": "2", "type": "persistent", "fields": ["lang", "year"]},
+    ]
+    mock_store.db.aql.execute.return_value = iter([])
+
+    mock_store.similarity_search_by_vector(
+        [0.1] * 4, k=3, filter={"lang": "en", "year": {"$gte": 2000}}
+    )
+
+    aql = mock_store.db.aql.execute.call_args.args[0]
+    assert "APPROX_NEAR" not in aql
+    assert "fetch_k" not in aql
+    assert aql.index("FILTER (doc.`lang` == @filter_0") < aql.index("LET score")
+
+
+def test_hybrid_search_single_request(mock_store):
+    mock_store.collection.indexes.return_value = []
+    mock_store.db.aql.execute.return_value = iter([
+        {"doc": {"_key": "a", "text": "hello"}, "score": 0.03, "embedding": None},
+    ])
+
+    results = mock_store.hybrid_search_with_score(
+        "hello", k=2, filter={"lang": "en"}, alpha=0.7
+    )
+
+    assert mock_store.db.aql.execute.call_count == 1
+    aql = mock_store.db.aql.execute.call_args.args[0]
+    bind_vars = mock_store.db.aql.execute.call_args.kwargs["bind_vars"]
+    assert "BM25(doc)" in aql and "COSINE_SIMILARITY" in aql
+    assert aql.count("FILTER doc.`lang` == @filter_0") == 2
+    assert bind_vars["@view"] == "vectors_view"
+    assert bind_vars["k"] == 8 and bind_vars["top_k"] == 2
+    assert bind_vars["vector_weight"] == 0.7
+    assert bind_vars["rrf_k"] == 60
+    assert results[0][0].page_content == "hello"
+
+
+def test_hybrid_search_weighted_fusion(mock_store):
+    mock_store.collection.indexes.return_value = []
+    mock_store.db.aql.execute.return_value = iter([])
+
+    mock_store.hybrid_search("hello", fusion="weighted")
+
+    aql = mock_store.db.aql.execute.call_args.args[0]
+    bind_vars = mock_store.db.aql.execute.call_args.kwargs["bind_vars"]
+    assert "LET v_max = MAX(vector_hits[*].score)" in aql
+    assert "rrf_k" not in bind_vars
+    with pytest.raises(ValueError):
+        mock_store.hybrid_search("hello", fusion="max")
+
+
+def test_create_search_view(mock_store):
+    mock_store.db.views.return_value = []
+
+    mock_store.create_search_view(analyzer="text_de")
+
+    name, properties = mock_store.db.create_arangosearch_view.call_args.args
+    assert name == "vectors_view"
+    assert properties["links"]["vectors"]["fields"]["text"] == {
+        "analyzers": ["text_de"]
+    }
+
+
+def test_local_index_refresh_and_search(mock_store):
+    responses = {
+        "RETURN [doc._key, doc._rev, doc.@updated_at_field]": [
+            ["a", "1", 10.0], ["b", "1", None],
+        ],
+        "RETURN [doc._key, doc._rev, doc.@field, doc.@scale_field]": [
+            ["a", "1", [1.0, 0.0, 0.0, 0.0], None], ["b", "1", [0.0, 1.0, 0.0, 0.0], None],
+        ],
+        "UNSET(doc, @unset_fields)": [{"_key": "b", "text": "bee"}],
+    }
+    mock_store.db.aql.execute.side_effect = lambda aql, **kwargs: iter(
+        next(rows for marker, rows in responses.items() if marker in aql)
+    )
+    mock_store.local_index = LocalVectorIndex()
+
+    assert mock_store.refresh_local_index() == {"upserted": 2, "removed": 0}
+    results = mock_store.similarity_search_with_score_by_vector([0.0, 1.0, 0.0, 0.0], k=1)
+
+    assert results[0][0].page_content == "bee"
+    assert results[0][1] == pytest.approx(1.0)
+
+
+def test_local_index_sees_writes_through_the_store(mock_store):
+    stored = {}
+
+    def import_bulk(docs, **kwargs):
+        stored.update({doc["_key"]: doc for doc in docs})
+        return {"created": len(docs), "updated": 0, "ignored": 0, "errors": 0}
+
+    def execute(aql, bind_vars=None, **kwargs):
+        if "doc.@updated_at_field >= @since" in aql:
+            return iter(
+                [key, "1", doc["updated_at"], doc["embedding"], None]
+                for key, doc in stored.items()
+                if doc["updated_at"] >= bind_vars["since"]
+            )
+        if "UNSET(doc, @unset_fields)" in aql:
+            return iter(
+                {"_key": key, "text": stored[key]["text"]}
+                for key in bind_vars["keys"] if key in stored
+            )
+        return iter([])
+
+    mock_store.collection.import_bulk.side_effect = import_bulk
+    mock_store.collection.count.side_effect = lambda: len(stored)
+    mock_store.db.aql.execute.side_effect = execute
+    mock_store.local_index = LocalVectorIndex()
+    mock_store.refresh_local_index()
+
+    ids = mock_store.add_texts(["one", "two", "three"])
+    assert len(mock_store.similarity_search("one", k=3)) == 3
+    assert len(mock_store.local_index) == 3
+
+    mock_store.delete(ids[:1])
+    del stored[ids[0]]
+    assert len(mock_store.local_index) == 2
+    # Only documents written since the last refresh are read.
+    assert "@since" in mock_store.db.aql.execute.call_args_list[1].args[0]
+
+
+def test_similarity_search_batch_single_round_trip(mock_store):
+    mock_store.collection.indexes.return_value = []
+    mock_store.db.aql.execute.return_value = iter([
+        [{"doc": {"_key": "a", "text": "first"}, "score": 0.5, "embedding": None}],
+        [],
+    ])
+    mock_store.embedding = MagicMock(wraps=mock_store.embedding)
+
+    results = mock_store.similarity_search_batch(["q1", "q2"], k=1)
+
+    mock_store.embedding.embed_documents.assert_called_once_with(["q1", "q2"])
+    mock_store.embedding.embed_query.assert_not_called()
+    assert mock_store.db.aql.execute.call_count == 1
+    assert "FOR query_vector IN @queries" in mock_store.db.aql.execute.call_args.args[0]
+    assert [[doc.page_content for doc in docs] for docs in results] == [["first"], []]
+
+
+def test_asimilarity_search_uses_async_client(mock_store):
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        if request.url.path.endswith("/_api/index"):
+            return httpx.Response(200, json={"indexes": []})
+        return httpx.Response(201, json={
+            "result": [{"doc": {"_key": "a", "text": "async"}, "score": 1.0,
+                        "embedding": None}],
+            "hasMore": False,
+        })
+
+    mock_store._async_client = AsyncArangoClient(transport=httpx.MockTransport(handler))
+
+    results = asyncio.run(mock_store.asimilarity_search("hello", k=1))
+
+    assert [doc.page_content for doc in results] == ["async"]
+    mock_store.db.aql.execute.assert_not_called()
+
+
+def test_max_marginal_relevance_server_side(mock_store):
+    mock_store.collection.indexes.return_value = []
+    mock_store.db.aql.execute.return_value = iter([
+        {"doc": {"_key": "a", "text": "picked"}, "score": 0.7, "embedding": None},
+    ])
+
+    results = mock_store.max_marginal_relevance_search(
+        "hello", k=2, fetch_k=10, server_side=True
+    )
+
+    aql, bind_vars = (
+        mock_store.db.aql.execute.call_args.args[0],
+        mock_store.db.aql.execute.call_args.kwargs["bind_vars"],
+    )
+    assert "LET selected_2 =" in aql
+    assert bind_vars["k"] == 10
+    assert [doc.page_content for doc in results] == ["picked"]
+
+
+def test_int8_encoding_stores_scale(mock_store):
+    mock_store.embedding_encoding = EmbeddingEncoding.INT8
+
+    mock_store.add_embeddings(["a"], [[0.5, -1.0, 0.25, 0.0]])
+
+    doc = mock_store.collection.import_bulk.call_args.args[0][0]
+    assert doc["embedding"] == [64, -127, 32, 0]
+    assert doc["embedding_scale"] == pytest.approx(1.0 / 127)
+
+
+def test_base64_encoding_requires_local_index(mock_store):
+    mock_store.embedding_encoding = EmbeddingEncoding.FLOAT16_BASE64
+    mock_store.collection.indexes.return_value = []
+
+    with pytest.raises(ValueError, match="local_index"):
+        mock_store.similarity_search_by_vector([0.1] * 4)
+
+
+def test_query_embedding_cache(mock_store):
+    mock_store.collection.indexes.return_value = []
+    mock_store.db.aql.execute.side_effect = lambda *args, **kwargs: iter([])
+    mock_store.embedding = MagicMock(wraps=mock_store.embedding)
+    mock_store.query_embedding_cache = InMemoryQueryEmbeddingCache()
+
+    mock_store.similarity_search("hello")
+    mock_store.similarity_search("hello")
+    mock_store.similarity_search_batch(["hello", "world", "world"])
+
+    mock_store.embedding.embed_query.assert_called_once_with("hello")
+    mock_store.embedding.embed_documents.assert_called_once_with(["world"])
+    assert mock_store.query_embedding_cache_stats["hits"] == 2
+    assert mock_store.query_embedding_cache_stats["misses"] == 3
+
+
+def test_index_texts_embeds_only_changes(mock_store):
+    unchanged = ArangoVector._content_hash("same", {"source": "s3"})
+    keys = {text: md5(text.encode("utf-8")).hexdigest() for text in ["same", "edited", "new"]}
+    responses = {
+        "doc.@hash_field": [[keys["same"], unchanged], [keys["edited"], "stale-hash"]],
+        "REMOVE doc": [1, 1],
+    }
+    mock_store.db.aql.execute.side_effect = lambda aql, **kwargs: iter(
+        next(rows for marker, rows in responses.items() if marker in aql)
+    )
+    mock_store.embedding = MagicMock(wraps=mock_store.embedding)
+    mock_store.batch_size = 10
+
+    counts = mock_store.index_texts(["same", "edited", "new"], source="s3")
+
+    assert counts == {"added": 1, "updated": 1, "skipped": 1, "deleted": 2}
+    mock_store.embedding.embed_documents.assert_called_once_with(["edited", "new"])
+    written = mock_store.collection.import_bulk.call_args.args[0]
+    assert [doc["_key"] for doc in written] == [keys["edited"], keys["new"]]
+    assert all(doc["source"] == "s3" for doc in written)
+    remove_vars = mock_store.db.aql.execute.call_args.kwargs["bind_vars"]
+    assert remove_vars["keys"] == list(keys.values())
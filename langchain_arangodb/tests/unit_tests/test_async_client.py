@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import pytest
+
+from langchain_arangodb.graphs.async_client import AsyncArangoClient
+from langchain_arangodb.graphs.load_balancing import LoadBalancingHostResolver
+
+httpx = pytest.importorskip("httpx")
+
+
+def cursor_transport(batches, deleted):
+    def handler(request):
+        if request.method == "POST" and request.url.path.endswith("/_api/cursor"):
+            payload = json.loads(request.content)
+            assert payload["bindVars"] == {"x": 1}
+            return httpx.Response(201, json={"result": batches[0], "hasMore": True, "id": "42"})
+        if request.method == "PUT":
+            return httpx.Response(200, json={"result": batches[1], "hasMore": False, "id": "42"})
+        if request.method == "DELETE":
+            deleted.append(request.url.path)
+            return httpx.Response(202, json={"error": False})
+        return httpx.Response(404, json={"error": True, "errorMessage": "not found"})
+
+    return httpx.MockTransport(handler)
+
+
+def test_execute_follows_cursor_batches():
+    deleted = []
+    client = AsyncArangoClient(transport=cursor_transport([[1, 2], [3]], deleted))
+
+    rows = asyncio.run(client.execute("RETURN @x", {"x": 1}, batch_size=2))
+
+    assert rows == [1, 2, 3]
+    assert deleted == []
+
+
+def test_iter_query_deletes_cursor_on_early_exit():
+    deleted = []
+    client = AsyncArangoClient(transport=cursor_transport([[1, 2], [3]], deleted))
+
+    async def first_row():
+        rows = client.iter_query("RETURN @x", {"x": 1})
+        async for row in rows:
+            await rows.aclose()
+            return row
+
+    assert asyncio.run(first_row()) == 1
+    assert deleted == ["/_db/_system/_api/cursor/42"]
+
+
+def test_resolver_picks_one_host_per_cursor():
+    resolver = LoadBalancingHostResolver(["http://a:8529", "http://b:8529"])
+    hosts = []
+
+    def handler(request):
+        hosts.append(request.url.host)
+        return httpx.Response(201, json={"result": [1], "hasMore": False})
+
+    client = AsyncArangoClient(
+        ["http://a:8529", "http://b:8529"],
+        transport=httpx.MockTransport(handler),
+        resolver=resolver,
+    )
+
+    asyncio.run(client.execute("RETURN 1"))
+    asyncio.run(client.execute("RETURN 1"))
+
+    assert hosts == ["a", "b"]
+    assert resolver.stats()["http://a:8529"]["requests"] == 1
+
+
+def test_non_json_error_body_reports_the_status():
+    def handler(request):
+        return httpx.Response(502, text="<html>Bad Gateway</html>")
+
+    client = AsyncArangoClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(RuntimeError, match=r"\(502\): <html>Bad Gateway"):
+        asyncio.run(client.execute("RETURN 1"))
@@ -0,0 +1,179 @@
+from unittest.mock import MagicMock
+
+import pytest
+from arango.exceptions import ArangoServerError
+from langchain_core.messages import AIMessage, HumanMessage
+
+from langchain_arangodb.chat_message_histories.arangodb import (
+    ArangoChatMessageHistory,
+)
+
+
+def counter_graph(counters=None, start=0):
+    """Mock graph whose write query advances a shared per-session counter.
+
+    ``graph.writes`` collects the documents of every write with the ``seq``
+    the query would assign.
+    """
+    counters = {} if counters is None else counters
+    graph = MagicMock()
+    graph.writes = []
+
+    def execute(query, bind_vars):
+        key, count = bind_vars["key"], bind_vars["count"]
+        counters[key] = counters.get(key, start) + count
+        first = counters[key] - count + 1
+        graph.writes.append(
+            [dict(doc, seq=first + i) for i, doc in enumerate(bind_vars["documents"])]
+        )
+        return iter([])
+
+    graph.db.aql.execute.side_effect = execute
+    return graph
+
+
+def server_error(code):
+    error = ArangoServerError.__new__(ArangoServerError)
+    error.error_code = code
+    return error
+
+
+def test_constructor_ensures_session_index():
+    graph = MagicMock()
+
+    ArangoChatMessageHistory("s1", graph=graph)
+
+    index = graph.db.collection.return_value.add_index.call_args[0][0]
+    assert index["type"] == "persistent"
+    assert index["fields"] == ["session_id", "seq"]
+
+
+def test_new_sequence_index_replaces_timestamp_index():
+    graph = MagicMock()
+    collection = graph.db.collection.return_value
+    collection.add_index.return_value = {"name": "session_seq", "new": False}
+
+    ArangoChatMessageHistory("s1", graph=graph)
+    collection.delete_index.assert_not_called()
+
+    collection.add_index.return_value = {"name": "session_seq", "new": True}
+    ArangoChatMessageHistory("s1", graph=graph)
+    collection.delete_index.assert_called_once_with(
+        "session_timestamp", ignore_missing=True
+    )
+
+
+def test_messages_reads_latest_window_in_order():
+    graph = MagicMock()
+    graph.run_aql.return_value = [
+        {"type": "ai", "data": {"content": "newest"}},
+        {"type": "human", "data": {"content": "older"}},
+    ]
+    history = ArangoChatMessageHistory("s1", graph=graph, window=1)
+
+    messages = history.messages
+
+    query, bind_vars = graph.run_aql.call_args[0]
+    assert "SORT doc.seq DESC" in query
+    assert bind_vars == {"session_id": "s1", "limit": 2}
+    assert [m.content for m in messages] == ["older", "newest"]
+
+
+def test_add_messages_writes_one_batch_with_sequence_numbers():
+    graph = counter_graph(start=4)
+    history = ArangoChatMessageHistory("s1", graph=graph)
+
+    history.add_messages([HumanMessage(content="hi"), AIMessage(content="hello")])
+    history.add_message(HumanMessage(content="bye"))
+
+    first, second = graph.writes
+    assert [(d["seq"], d["role"]) for d in first] == [(5, "human"), (6, "ai")]
+    assert second[0]["seq"] == 7
+    # The counter update and the insert are one request per write.
+    assert graph.db.aql.execute.call_count == 2
+    query = graph.db.aql.execute.call_args[0][0]
+    assert "UPSERT" in query and "INSERT MERGE" in query
+
+
+def test_histories_of_one_session_never_share_sequence_numbers():
+    counters = {}
+    graphs = [counter_graph(counters), counter_graph(counters)]
+    histories = [ArangoChatMessageHistory("s1", graph=g) for g in graphs]
+
+    for i in range(3):
+        histories[i % 2].add_messages(
+            [HumanMessage(content="q"), AIMessage(content="a")]
+        )
+
+    seqs = [doc["seq"] for g in graphs for write in g.writes for doc in write]
+    assert sorted(seqs) == [1, 2, 3, 4, 5, 6]
+
+
+def test_conflicting_writes_are_retried():
+    graph = counter_graph()
+    write = graph.db.aql.execute.side_effect
+    errors = [server_error(1210), server_error(1200)]
+
+    def execute(query, bind_vars):
+        if errors:
+            raise errors.pop(0)
+        return write(query, bind_vars)
+
+    graph.db.aql.execute.side_effect = execute
+    history = ArangoChatMessageHistory("s1", graph=graph)
+
+    history.add_message(HumanMessage(content="a"))
+
+    assert graph.db.aql.execute.call_count == 3
+    assert [[d["seq"] for d in batch] for batch in graph.writes] == [[1]]
+
+
+def test_write_behind_flushes_on_size_and_exit():
+    graph = counter_graph()
+    execute = graph.db.aql.execute
+
+    with ArangoChatMessageHistory(
+        "s1", graph=graph, write_behind=True, flush_size=3, flush_interval=None
+    ) as history:
+        history.add_messages([HumanMessage(content="a"), AIMessage(content="b")])
+        # Buffering makes no request, not even for sequence numbers.
+        execute.assert_not_called()
+        history.add_message(HumanMessage(content="c"))
+        assert execute.call_count == 1
+        assert [d["seq"] for d in graph.writes[0]] == [1, 2, 3]
+        history.add_message(AIMessage(content="d"))
+        assert execute.call_count == 1
+
+    assert execute.call_count == 2
+    assert graph.writes[1][0]["seq"] == 4
+
+
+def test_finalizer_does_not_write_buffered_messages():
+    graph = counter_graph()
+    history = ArangoChatMessageHistory(
+        "s1", graph=graph, write_behind=True, flush_interval=None
+    )
+    history.add_message(HumanMessage(content="a"))
+
+    with pytest.warns(ResourceWarning):
+        history.__del__()
+
+    graph.db.aql.execute.assert_not_called()
+    history._buffer.clear()
+
+
+def test_failed_flush_keeps_messages_buffered():
+    graph = counter_graph()
+    write = graph.db.aql.execute.side_effect
+    graph.db.aql.execute.side_effect = RuntimeError("down")
+    history = ArangoChatMessageHistory(
+        "s1", graph=graph, write_behind=True, flush_interval=None
+    )
+    history.add_message(HumanMessage(content="a"))
+
+    with pytest.raises(RuntimeError):
+        history.flush()
+    graph.db.aql.execute.side_effect = write
+    history.flush()
+
+    assert graph.writes[0][0]["content"] == "a"
@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+
+from langchain_arangodb.graphs.client_registry import ClientRegistry
+from langchain_arangodb.graphs.load_balancing import InstrumentedHTTPClient
+
+
+@pytest.fixture
+def client_class():
+    with patch("langchain_arangodb.graphs.client_registry.ArangoClient") as client:
+        yield client
+
+
+def test_same_credentials_share_one_client(client_class):
+    registry = ClientRegistry()
+    first = registry.acquire("http://db:8529", "app", "bob", "secret", auth_method="jwt")
+    second = registry.acquire("http://db:8529", "app", "bob", "secret")
+
+    assert first is second
+    assert first.references == 2
+    assert client_class.call_count == 1
+    assert client_class.return_value.db.call_args.kwargs["auth_method"] == "jwt"
+
+
+def test_different_password_gets_its_own_client(client_class):
+    registry = ClientRegistry()
+    first = registry.acquire("http://db:8529", "app", "bob", "secret")
+    second = registry.acquire("http://db:8529", "app", "bob", "wrong")
+
+    assert first is not second
+    assert len(registry) == 2
+
+
+def test_release_keeps_idle_client_until_timeout(client_class):
+    registry = ClientRegistry(idle_timeout=60)
+    entry = registry.acquire("http://db:8529")
+    registry.release(entry)
+
+    assert len(registry) == 1
+    assert registry.acquire("http://db:8529") is entry
+
+    registry.release(entry)
+    registry.idle_timeout = 0
+    registry.acquire("http://other:8529")
+    assert len(registry) == 1
+    entry.client.close.assert_called_once()
+
+
+def test_connect_opens_a_client_configured_like_the_entry(client_class):
+    registry = ClientRegistry()
+    entry = registry.acquire(
+        ["http://a:8529", "http://b:8529"],
+        "app",
+        "bob",
+        "secret",
+        auth_method="jwt",
+        host_resolver="round_robin",
+    )
+
+    client, db = entry.connect()
+
+    first, second = client_class.call_args_list
+    assert second.kwargs["host_resolver"] is entry.resolver
+    assert isinstance(second.kwargs["http_client"], InstrumentedHTTPClient)
+    assert second.kwargs["http_client"] is not first.kwargs["http_client"]
+    assert client.db.call_args.kwargs["auth_method"] == "jwt"
+    assert registry.acquire(
+        ["http://a:8529", "http://b:8529"], "app", "bob", "secret",
+        host_resolver="round_robin",
+    ) is entry
+
+
+def test_release_while_lock_is_held_does_not_deadlock(client_class):
+    # What happens when the garbage collector finalizes a graph in the middle
+    # of an ``acquire`` on the same thread.
+    registry = ClientRegistry(idle_timeout=0)
+    entry = registry.acquire("http://db:8529")
+
+    with registry._lock:
+        registry.release(entry)
+
+    assert len(registry) == 0
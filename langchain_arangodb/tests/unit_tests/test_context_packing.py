@@ -0,0 +1,49 @@
+from langchain_arangodb.chains.graph_qa.context import (
+    ContextPacker,
+    referenced_attributes,
+)
+
+AQL = "FOR p IN Person FILTER p.age > 30 RETURN p"
+
+
+def test_referenced_attributes_ignore_string_literals():
+    names = referenced_attributes("FOR p IN Person FILTER p.city == 'bio' RETURN p")
+
+    assert "city" in names
+    assert "bio" not in names
+
+
+def test_projects_truncates_and_serializes_json_lines():
+    packer = ContextPacker(max_value_chars=5, max_list_items=2)
+    context = [
+        {"_key": "1", "age": 40, "bio": "a" * 100, "tags": [1, 2, 3]},
+        {"_key": "2", "age": 50, "bio": "short"},
+    ]
+
+    aql = "FOR p IN Person FILTER p.age > 30 RETURN {age: p.age, tags: p.tags}"
+
+    text, stats = packer.pack(context, aql)
+
+    assert text.splitlines() == [
+        '{"age":40,"tags":[1,2,"... 1 more"]}',
+        '{"age":50}',
+    ]
+    assert stats["rows"] == 2
+    assert stats["tokens_saved"] > 0
+
+
+def test_rows_without_referenced_attributes_are_kept_whole():
+    text, _ = ContextPacker().pack([{"name": "x"}, 3], AQL)
+
+    assert text == '{"name":"x"}\n3'
+
+
+def test_token_budget_omits_trailing_rows():
+    packer = ContextPacker(max_tokens=3, tokenizer=lambda text: 1, format="table")
+    context = [{"age": i} for i in range(5)]
+
+    text, stats = packer.pack(context, AQL)
+
+    assert text.splitlines() == ["age", "0", "1", "... 3 more rows omitted"]
+    assert stats["rows"] == 2
+    assert stats["rows_omitted"] == 3
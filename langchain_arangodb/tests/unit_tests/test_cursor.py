@@ -0,0 +1,104 @@
+import asyncio
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from langchain_arangodb.graphs.client_registry import default_registry
+from langchain_arangodb.graphs.cursor import iter_aql
+from langchain_arangodb.graphs.graph import ArangoGraph
+
+
+class FakeCursor:
+    """Serves ``rows`` in server batches of ``batch_size``."""
+
+    def __init__(self, rows, batch_size):
+        self._batches = [
+            rows[i:i + batch_size] for i in range(0, len(rows), batch_size)
+        ]
+        self._batch = deque(self._batches.pop(0) if self._batches else [])
+        self.fetches = 0
+        self.closed = False
+
+    def empty(self):
+        return not self._batch
+
+    def pop(self):
+        return self._batch.popleft()
+
+    def has_more(self):
+        return bool(self._batches)
+
+    def fetch(self):
+        self.fetches += 1
+        self._batch.extend(self._batches.pop(0))
+
+    def close(self, ignore_missing=False):
+        self.closed = True
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.aql.execute.side_effect = lambda query, **kwargs: FakeCursor(
+        list(range(10)), kwargs["batch_size"] or 4
+    )
+    return db
+
+
+def test_iter_aql_streams_all_rows(db):
+    assert list(iter_aql(db, "FOR x IN 0..9 RETURN x", ttl=30)) == list(range(10))
+
+    kwargs = db.aql.execute.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["ttl"] == 30
+
+
+def test_iter_aql_batches(db):
+    batches = list(iter_aql(db, "RETURN 1", batch_size=3, batches=True))
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+
+def test_iter_aql_limit_stops_fetching_and_closes_cursor():
+    cursor = FakeCursor(list(range(10)), 4)
+    db = MagicMock()
+    db.aql.execute.return_value = cursor
+
+    assert list(iter_aql(db, "RETURN 1", limit=5)) == [0, 1, 2, 3, 4]
+    assert cursor.fetches == 1
+    assert cursor.closed
+
+
+def test_iter_aql_zero_limit_runs_no_query_and_negative_is_rejected():
+    db = MagicMock()
+
+    assert list(iter_aql(db, "RETURN 1", limit=0)) == []
+    db.aql.execute.assert_not_called()
+    with pytest.raises(ValueError):
+        list(iter_aql(db, "RETURN 1", limit=-1))
+
+
+def test_iter_aql_closes_cursor_on_early_exit():
+    cursor = FakeCursor(list(range(10)), 4)
+    db = MagicMock()
+    db.aql.execute.return_value = cursor
+
+    rows = iter_aql(db, "RETURN 1")
+    assert next(rows) == 0
+    rows.close()
+
+    assert cursor.closed
+    assert cursor.fetches == 0
+
+
+def test_arun_aql_zero_limit_sends_no_request():
+    with patch("langchain_arangodb.graphs.client_registry.ArangoClient"):
+        graph = ArangoGraph(password="")
+        graph._async_client = MagicMock()
+
+        assert asyncio.run(graph.arun_aql("RETURN 1", limit=0)) == []
+        graph._async_client.iter_query.assert_not_called()
+        graph._async_client = None
+        graph.close()
+    default_registry.close_all()
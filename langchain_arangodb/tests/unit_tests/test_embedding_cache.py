@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_arangodb.vectorstores.embedding_cache import InMemoryQueryEmbeddingCache
+
+
+def test_lru_eviction_and_counters():
+    cache = InMemoryQueryEmbeddingCache(max_size=2)
+    cache.set("model", "a", [1.0])
+    cache.set("model", "b", [2.0])
+    assert cache.get("model", "a") == [1.0]
+    cache.set("model", "c", [3.0])
+
+    assert cache.get("model", "b") is None
+    assert cache.get("model", "c") == [3.0]
+    assert cache.get("other-model", "c") is None
+    assert cache.stats == {"hits": 2, "misses": 2, "hit_rate": 0.5, "size": 2}
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "langchain_arangodb.vectorstores.embedding_cache.time.monotonic", lambda: now[0]
+    )
+    cache = InMemoryQueryEmbeddingCache(ttl=10)
+    cache.set("model", "a", [1.0])
+
+    now[0] = 105.0
+    assert cache.get("model", "a") == [1.0]
+    now[0] = 111.0
+    assert cache.get("model", "a") is None
+    assert len(cache) == 0
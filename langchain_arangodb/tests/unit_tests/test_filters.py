@@ -0,0 +1,57 @@
+import pytest
+
+from langchain_arangodb.vectorstores.filters import FilterCompiler, filter_fields
+
+
+def test_compile_binds_every_value():
+    condition, bind_vars = FilterCompiler().compile(
+        {"genre": "drama", "year": {"$gte": 2000, "$lt": 2010}}
+    )
+
+    assert condition == (
+        "(doc.`genre` == @filter_0 AND doc.`year` >= @filter_1 "
+        "AND doc.`year` < @filter_2)"
+    )
+    assert bind_vars == {"filter_0": "drama", "filter_1": 2000, "filter_2": 2010}
+
+
+def test_compile_logical_and_special_operators():
+    condition, bind_vars = FilterCompiler().compile({
+        "$or": [
+            {"meta.lang": {"$in": ["en", "de"]}},
+            {"rating": {"$between": [4, 5]}},
+            {"title": {"$ilike": "%war%"}, "draft": {"$exists": False}},
+        ]
+    })
+
+    assert condition == (
+        "(doc.`meta`.`lang` IN @filter_0 OR "
+        "(doc.`rating` >= @filter_1 AND doc.`rating` <= @filter_2) OR "
+        "(LIKE(doc.`title`, @filter_3, true) AND doc.`draft` == null))"
+    )
+    assert bind_vars["filter_0"] == ["en", "de"]
+
+
+def test_same_shape_compiles_to_same_query():
+    first, _ = FilterCompiler().compile({"lang": "en", "year": {"$gt": 1}})
+    second, _ = FilterCompiler().compile({"lang": "fr", "year": {"$gt": 9}})
+
+    assert first == second
+
+
+@pytest.mark.parametrize("filter", [
+    {},
+    {"year": {"$regex": "1.*"}},
+    {"$not": [{"a": 1}]},
+    {"a`) OR true OR (`": 1},
+    {"lang": {"$in": "en"}},
+])
+def test_compile_rejects_invalid_filters(filter):
+    with pytest.raises(ValueError):
+        FilterCompiler().compile(filter)
+
+
+def test_filter_fields():
+    assert filter_fields(
+        {"a": 1, "$or": [{"b.c": {"$gt": 1}}, {"$and": [{"d": 2}]}]}
+    ) == {"a", "b.c", "d"}
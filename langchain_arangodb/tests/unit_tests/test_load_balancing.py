@@ -0,0 +1,120 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from langchain_arangodb.graphs.arango_graph import ArangoGraph
+from langchain_arangodb.graphs.client_registry import default_registry
+from langchain_arangodb.graphs.load_balancing import LoadBalancingHostResolver
+
+
+def stand_in(delay: float = 0.0):
+    """Start a local coordinator stand-in answering AQL cursor requests."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, body):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            self._reply(200, {"mode": "default"})
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            hits.append(self.path)
+            time.sleep(delay)
+            self._reply(201, {"error": False, "result": [1], "hasMore": False})
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", hits
+
+
+def unused_host():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(delay=0.0):
+        server, host, hits = stand_in(delay)
+        started.append(server)
+        return host, hits
+
+    yield start
+    default_registry.close_all()
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def test_round_robin_spreads_requests(servers):
+    (first, first_hits), (second, second_hits) = servers(), servers()
+    graph = ArangoGraph(hosts=[first, second], password="", host_resolver="round_robin")
+
+    for _ in range(6):
+        assert graph.query("RETURN 1") == [1]
+
+    assert len(first_hits) == len(second_hits) == 3
+    assert all(stats["requests"] == 3 for stats in graph.host_stats.values())
+    graph.close()
+
+
+def test_failed_host_is_ejected_and_skipped(servers):
+    down = unused_host()
+    up, hits = servers()
+    resolver = LoadBalancingHostResolver([down, up], eject_after_errors=1)
+    graph = ArangoGraph(hosts=[down, up], password="", host_resolver=resolver)
+
+    for _ in range(4):
+        assert graph.query("RETURN 1") == [1]
+
+    assert len(hits) == 4
+    stats = graph.host_stats
+    assert stats[down]["errors"] == 1 and stats[down]["ejected"]
+    assert stats[up]["errors"] == 0
+
+    assert resolver.check_health() == [False, True]
+    graph.close()
+
+
+def test_slow_host_is_ejected(servers):
+    (fast, fast_hits), (slow, slow_hits) = servers(), servers(delay=0.2)
+    resolver = LoadBalancingHostResolver(
+        [fast, slow], strategy="least_outstanding", slow_threshold=0.1
+    )
+    graph = ArangoGraph(hosts=[fast, slow], password="", host_resolver=resolver)
+
+    for _ in range(6):
+        graph.query("RETURN 1")
+
+    assert len(slow_hits) == 1
+    assert graph.host_stats[slow]["ejected"]
+
+    # A successful health check re-admits it.
+    assert resolver.check_health() == [True, True]
+    assert not graph.host_stats[slow]["ejected"]
+    graph.close()
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        LoadBalancingHostResolver(["http://a:8529"], strategy="fastest")
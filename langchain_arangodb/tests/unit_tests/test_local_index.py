@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from langchain_arangodb.vectorstores import local_index
+from langchain_arangodb.vectorstores.local_index import LocalVectorIndex
+from langchain_arangodb.vectorstores.utils import DistanceStrategy
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(50, 8)).astype(np.float32)
+
+
+@pytest.mark.parametrize(
+    "strategy", [DistanceStrategy.COSINE, DistanceStrategy.EUCLIDEAN_DISTANCE]
+)
+def test_search_matches_brute_force(vectors, strategy):
+    index = LocalVectorIndex(distance_strategy=strategy, initial_capacity=4)
+    keys = [str(i) for i in range(len(vectors))]
+    index.upsert(keys, ["r"] * len(keys), vectors)
+    query = vectors[3] + 0.01
+
+    if strategy == DistanceStrategy.COSINE:
+        expected = np.argsort(
+            -(vectors @ query) / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+        )[:5]
+    else:
+        expected = np.argsort(np.linalg.norm(vectors - query, axis=1))[:5]
+
+    assert [key for key, _ in index.search(query, 5)] == [str(i) for i in expected]
+
+
+def test_upsert_and_remove(vectors, tmp_path):
+    index = LocalVectorIndex(path=str(tmp_path / "vectors.npy"), initial_capacity=2)
+    index.upsert(["a", "b", "c"], ["1", "1", "1"], vectors[:3])
+    index.remove(["a"])
+    index.upsert(["b", "d"], ["2", "1"], [vectors[0], vectors[3]])
+
+    assert len(index) == 3
+    assert index.revisions == {"b": "2", "c": "1", "d": "1"}
+    assert index.search(vectors[0], 1)[0][0] == "b"
+    assert "a" not in [key for key, _ in index.search(vectors[0], 10)]
+
+
+def test_search_batch_matches_single_queries(vectors):
+    index = LocalVectorIndex(distance_strategy=DistanceStrategy.DOT_PRODUCT)
+    index.upsert([str(i) for i in range(len(vectors))], ["r"] * len(vectors), vectors)
+
+    batch = index.search_batch(vectors[:3], 4)
+
+    for hits, query in zip(batch, vectors[:3]):
+        expected = index.search(query, 4)
+        assert [key for key, _ in hits] == [key for key, _ in expected]
+        assert [score for _, score in hits] == pytest.approx(
+            [score for _, score in expected], rel=1e-5
+        )
+
+
+def test_jaccard_scores_in_row_chunks(vectors, monkeypatch):
+    positive = np.abs(vectors)
+    index = LocalVectorIndex(distance_strategy=DistanceStrategy.JACCARD)
+    index.upsert([str(i) for i in range(len(positive))], ["r"] * len(positive), positive)
+    expected = index.scores(positive[:3])
+
+    monkeypatch.setattr(local_index, "JACCARD_CHUNK_ELEMENTS", 7)
+
+    np.testing.assert_allclose(index.scores(positive[:3]), expected, rtol=1e-6)
@@ -0,0 +1,110 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from langchain_arangodb.graphs.client_registry import default_registry
+from langchain_arangodb.graphs.graph import ArangoGraph
+from langchain_arangodb.graphs.schema import (
+    ATTRIBUTE_TYPES_QUERY,
+    SchemaIntrospector,
+    format_schema,
+)
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.collections.return_value = [
+        {"name": "_graphs", "system": True, "type": "document"},
+        {"name": "Person", "system": False, "type": "document"},
+        {"name": "knows", "system": False, "type": "edge"},
+    ]
+    db.revisions = {"Person": "1", "knows": "1"}
+    db.sampled = []
+
+    def collection(name):
+        handle = MagicMock()
+        handle.revision.return_value = db.revisions[name]
+        handle.count.return_value = 2
+        return handle
+
+    def execute(query, bind_vars):
+        name = bind_vars["@collection"]
+        db.sampled.append((name, query == ATTRIBUTE_TYPES_QUERY))
+        if query != ATTRIBUTE_TYPES_QUERY:
+            return iter([{"from": "Person", "to": "Person"}])
+        if name == "Person":
+            return iter([
+                {"name": "age", "type": "number"},
+                {"name": "name", "type": "null"},
+                {"name": "name", "type": "string"},
+            ])
+        return iter([{"name": "since", "type": "number"}])
+
+    db.collection.side_effect = collection
+    db.aql.execute.side_effect = execute
+    db.graphs.return_value = [{
+        "name": "social",
+        "edge_definitions": [{
+            "edge_collection": "knows",
+            "from_vertex_collections": ["Person"],
+            "to_vertex_collections": ["Person"],
+        }],
+    }]
+    return db
+
+
+def test_refresh_samples_collections(db):
+    schema = SchemaIntrospector(db, sample_size=10).refresh()
+
+    assert list(schema["collections"]) == ["Person", "knows"]
+    assert schema["collections"]["Person"]["attributes"] == {
+        "age": "number", "name": "null|string",
+    }
+    assert schema["collections"]["knows"]["endpoints"] == [
+        {"from": "Person", "to": "Person"}
+    ]
+    assert format_schema(schema) == "\n".join([
+        "Collections:",
+        "- Person (document, 2 documents): age: number, name: null|string",
+        "- knows (edge, 2 documents): since: number",
+        "  Person -> Person",
+        "Graphs:",
+        "- social: knows (Person -> Person)",
+    ])
+
+
+def test_refresh_only_resamples_changed_collections(db):
+    introspector = SchemaIntrospector(db, ttl=None)
+    introspector.refresh()
+    db.sampled.clear()
+
+    db.revisions["knows"] = "2"
+    introspector.refresh()
+    assert {name for name, _ in db.sampled} == {"knows"}
+
+    db.sampled.clear()
+    introspector.refresh(full=True)
+    assert {name for name, _ in db.sampled} == {"Person", "knows"}
+    assert not introspector.expired()
+
+
+def test_expired_after_ttl(db):
+    introspector = SchemaIntrospector(db, ttl=0)
+    assert introspector.expired()
+    introspector.refresh()
+    introspector.refreshed_at -= 1
+    assert introspector.expired()
+
+
+def test_chain_graph_stores_structured_schema(db):
+    with patch("langchain_arangodb.graphs.client_registry.ArangoClient"):
+        graph = ArangoGraph(password="")
+        graph._schema_introspector = SchemaIntrospector(db)
+
+        structured = graph.get_structured_schema
+
+        assert set(structured["collections"]) == {"Person", "knows"}
+        assert graph.schema == format_schema(structured)
+        graph.close()
+    default_registry.close_all()
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from langchain_core.vectorstores.utils import maximal_marginal_relevance
+
+from langchain_arangodb.vectorstores.utils import (
+    EmbeddingEncoding,
+    decode_embedding,
+    encode_embedding,
+    maximal_marginal_relevance_matrix,
+)
+
+
+@pytest.mark.parametrize("lambda_mult", [0.0, 0.5, 1.0])
+def test_mmr_matrix_matches_langchain(lambda_mult):
+    rng = np.random.default_rng(1)
+    embeddings = rng.normal(size=(60, 12))
+    query = rng.normal(size=12)
+
+    expected = maximal_marginal_relevance(
+        query, embeddings.tolist(), lambda_mult=lambda_mult, k=10
+    )
+
+    assert maximal_marginal_relevance_matrix(
+        query, embeddings, lambda_mult=lambda_mult, k=10
+    ) == expected
+
+
+def test_mmr_matrix_handles_small_inputs():
+    assert maximal_marginal_relevance_matrix([1.0, 0.0], np.zeros((0, 2)), k=3) == []
+    assert maximal_marginal_relevance_matrix([1.0, 0.0], [[1.0, 0.0]], k=3) == [0]
+
+
+@pytest.mark.parametrize(
+    "encoding, tolerance",
+    [
+        (EmbeddingEncoding.JSON, 0),
+        (EmbeddingEncoding.FLOAT32_BASE64, 0),
+        (EmbeddingEncoding.FLOAT16_BASE64, 1e-3),
+        (EmbeddingEncoding.INT8, 1e-2),
+    ],
+)
+def test_embedding_encoding_round_trip(encoding, tolerance):
+    vector = np.random.default_rng(2).uniform(-1, 1, size=32).astype(np.float32)
+
+    value, scale = encode_embedding(vector.tolist(), encoding)
+    decoded = decode_embedding(value, encoding, scale)
+
+    assert decoded.dtype == np.float32
+    assert np.allclose(decoded, vector, atol=tolerance)
@@ -1,12 +1,98 @@
+import json
+import queue
+import threading
+import time
 import numpy as np
 
-from typing import List, Optional, Dict, Any
+from itertools import islice, zip_longest
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from hashlib import md5
+from arango.client import ArangoClient
+from arango.database import StandardDatabase
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
-from langchain_core.vectorstores.utils import maximal_marginal_relevance
-from langchain_arangodb.vectorstores.utils import DistanceStrategy
+from langchain_core.runnables.config import run_in_executor
+from langchain_arangodb.graphs.async_client import AsyncArangoClient
+from langchain_arangodb.vectorstores.embedding_cache import QueryEmbeddingCache
+from langchain_arangodb.vectorstores.filters import FilterCompiler, filter_fields
+from langchain_arangodb.vectorstores.local_index import LocalVectorIndex
+from langchain_arangodb.vectorstores.utils import (
+    DistanceStrategy,
+    EmbeddingEncoding,
+    decode_embedding,
+    encode_embedding,
+    maximal_marginal_relevance_matrix,
+)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_QUEUE_DEPTH = 2
+# Seconds re-read before the newest ``updated_at`` a local index refresh saw,
+# so that writers with slightly lagging clocks are not missed.
+LOCAL_INDEX_REFRESH_OVERLAP = 5.0
+
+# (texts, metadatas, ids) for one batch of ``add_texts`` input.
+_TextBatch = Tuple[List[str], Optional[List[dict]], Optional[List[str]]]
+
+# Vector index ``metric`` for each strategy that ArangoDB can index.
+VECTOR_INDEX_METRICS = {
+    DistanceStrategy.COSINE: "cosine",
+    DistanceStrategy.EUCLIDEAN_DISTANCE: "l2",
+    DistanceStrategy.MAX_INNER_PRODUCT: "innerProduct",
+    DistanceStrategy.DOT_PRODUCT: "innerProduct",
+}
+
+# Approximate (vector index backed) AQL function and sort order per strategy.
+APPROX_SCORE_FUNCTIONS = {
+    DistanceStrategy.COSINE: ("APPROX_NEAR_COSINE", "DESC"),
+    DistanceStrategy.EUCLIDEAN_DISTANCE: ("APPROX_NEAR_L2", "ASC"),
+    DistanceStrategy.MAX_INNER_PRODUCT: ("APPROX_NEAR_INNER_PRODUCT", "DESC"),
+    DistanceStrategy.DOT_PRODUCT: ("APPROX_NEAR_INNER_PRODUCT", "DESC"),
+}
+
+# Exact AQL score expression and sort order per strategy. ``{field}`` is the
+# embedding attribute access and ``{query}`` the query vector.
+EXACT_SCORE_EXPRESSIONS = {
+    DistanceStrategy.COSINE: ("COSINE_SIMILARITY({field}, {query})", "DESC"),
+    DistanceStrategy.EUCLIDEAN_DISTANCE: ("L2_DISTANCE({field}, {query})", "ASC"),
+    DistanceStrategy.MAX_INNER_PRODUCT: (
+        "SUM(FOR i IN 0..LENGTH({query}) - 1 RETURN {field}[i] * {query}[i])",
+        "DESC",
+    ),
+    DistanceStrategy.DOT_PRODUCT: (
+        "SUM(FOR i IN 0..LENGTH({query}) - 1 RETURN {field}[i] * {query}[i])",
+        "DESC",
+    ),
+    # Weighted (Ruzicka) Jaccard similarity over the vector components.
+    DistanceStrategy.JACCARD: (
+        "SUM(FOR i IN 0..LENGTH({query}) - 1 RETURN MIN([{field}[i], {query}[i]]))"
+        " / SUM(FOR i IN 0..LENGTH({query}) - 1 RETURN MAX([{field}[i], {query}[i]]))",
+        "DESC",
+    ),
+}
+
+
+_MISSING = object()
+
+
+def _zip_equal(**iterables: Iterable[Any]) -> Iterator[Tuple[Any, ...]]:
+    """``zip`` that raises ``ValueError`` when the iterables differ in length."""
+    for items in zip_longest(*iterables.values(), fillvalue=_MISSING):
+        if any(item is _MISSING for item in items):
+            raise ValueError(
+                f"{', '.join(iterables)} must have the same number of items"
+            )
+        yield items
+
+
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
 
 
 class ArangoVector(VectorStore):
@@ -22,6 +108,21 @@ class ArangoVector(VectorStore):
             embedding_field: str = "embedding",
             text_field: str = "text",
             distance_strategy: DistanceStrategy = DistanceStrategy.COSINE,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            on_duplicate: str = "replace",
+            n_probe: Optional[int] = None,
+            local_index: bool = False,
+            local_index_path: Optional[str] = None,
+            local_index_refresh_interval: Optional[float] = None,
+            async_max_connections: int = 100,
+            embedding_encoding: EmbeddingEncoding = EmbeddingEncoding.JSON,
+            query_embedding_cache: Optional[QueryEmbeddingCache] = None,
+            embedding_model_name: Optional[str] = None,
+            content_hash_field: str = "content_hash",
+            updated_at_field: str = "updated_at",
+            post_filter_overfetch: int = 10,
+            search_view_name: Optional[str] = None,
+            search_analyzer: str = "text_en",
     ):
         self.embedding = embedding
         self.db_url = db_url
@@ -32,77 +133,434 @@ class ArangoVector(VectorStore):
         self.embedding_field = embedding_field
         self.text_field = text_field
         self._distance_strategy = distance_strategy
+        self.batch_size = batch_size
+        self.on_duplicate = on_duplicate
+        self.n_probe = n_probe
+        self.embedding_encoding = EmbeddingEncoding(embedding_encoding)
+        # Per-vector scale of INT8-encoded embeddings.
+        self.embedding_scale_field = f"{embedding_field}_scale"
+        # Hash of text and metadata, compared by ``index_texts``.
+        self.content_hash_field = content_hash_field
+        # Write time (epoch seconds), read by ``refresh_local_index``.
+        self.updated_at_field = updated_at_field
+        # Candidates fetched per requested result when an approximate search
+        # has to be filtered afterwards, see ``_use_approximate``.
+        self.post_filter_overfetch = post_filter_overfetch
+        # ArangoSearch view over ``text_field`` used by ``hybrid_search``.
+        self.search_view_name = search_view_name or f"{collection_name}_view"
+        self.search_analyzer = search_analyzer
 
-        # TODO: Initialize ArangoDB client and collection handle
-        self.collection = None  # Placeholder
+        self.client = ArangoClient(hosts=db_url)
+        self.db: StandardDatabase = self.client.db(
+            database, username=username, password=password
+        )
+        if not self.db.has_collection(collection_name):
+            self.db.create_collection(collection_name)
+        self.collection = self.db.collection(collection_name)
+
+        # Query embeddings are cached per model, see ``_embed_query``.
+        self.query_embedding_cache = query_embedding_cache
+        self.embedding_model_name = (
+            embedding_model_name
+            or getattr(embedding, "model", None)
+            or getattr(embedding, "model_name", None)
+            or type(embedding).__name__
+        )
+
+        # Per-batch ``import_bulk`` summaries of the most recent write.
+        self.last_import_summary: List[Dict[str, Any]] = []
+        # Throughput and back-pressure of the most recent pipelined write.
+        self.last_pipeline_stats: Dict[str, Any] = {}
+        # Cached vector index description; ``False`` means "looked up, none".
+        self._vector_index: Any = None
+        # Leading fields of the collection's persistent indexes.
+        self._indexed_fields: Optional[Set[str]] = None
+
+        # Created on first use by the async methods, see ``async_client``.
+        self.async_max_connections = async_max_connections
+        self._async_client: Optional[AsyncArangoClient] = None
+
+        # Optional in-process copy of the embeddings, see ``refresh_local_index``.
+        self.local_index: Optional[LocalVectorIndex] = None
+        self.local_index_refresh_interval = local_index_refresh_interval
+        self._local_index_refreshed_at = 0.0
+        # Newest ``updated_at`` loaded; ``None`` until the first full load.
+        self._local_index_since: Optional[float] = None
+        # Set by writes through this store so the next search refreshes.
+        self._local_index_stale = False
+        if local_index:
+            self.local_index = LocalVectorIndex(
+                distance_strategy=distance_strategy, path=local_index_path
+            )
+            self.collection.add_index(
+                {
+                    "type": "persistent",
+                    "fields": [updated_at_field],
+                    "sparse": True,
+                    "name": f"{updated_at_field}_local_index",
+                }
+            )
+            self.refresh_local_index()
 
     @classmethod
     def from_texts(
             cls,
-            texts: List[str],
+            texts: Iterable[str],
             embedding: Embeddings,
-            metadatas: Optional[List[dict]] = None,
-            ids: Optional[List[str]] = None,
+            metadatas: Optional[Iterable[dict]] = None,
+            ids: Optional[Iterable[str]] = None,
+            pipelined: bool = False,
+            queue_depth: int = DEFAULT_QUEUE_DEPTH,
             **kwargs: Any,
     ) -> "ArangoVector":
-        embeddings = embedding.embed_documents(texts)
-        return cls.__from(
+        store = cls(embedding=embedding, **kwargs)
+        store.add_texts(
             texts=texts,
-            embeddings=embeddings,
-            embedding=embedding,
             metadatas=metadatas,
             ids=ids,
-            **kwargs,
+            pipelined=pipelined,
+            queue_depth=queue_depth,
         )
+        return store
 
-    @classmethod
-    def __from(
-            cls,
-            texts: List[str],
-            embeddings: List[List[float]],
-            embedding: Embeddings,
-            metadatas: Optional[List[dict]] = None,
-            ids: Optional[List[str]] = None,
+    def add_texts(
+            self,
+            texts: Iterable[str],
+            metadatas: Optional[Iterable[dict]] = None,
+            ids: Optional[Iterable[str]] = None,
+            batch_size: Optional[int] = None,
+            pipelined: bool = False,
+            queue_depth: int = DEFAULT_QUEUE_DEPTH,
             **kwargs: Any,
-    ) -> "ArangoVector":
-        if ids is None:
-            ids = [md5(text.encode("utf-8")).hexdigest() for text in texts]
+    ) -> List[str]:
+        """Embed and write ``texts`` one batch at a time.
 
-        if not metadatas:
-            metadatas = [{} for _ in texts]
+        Only a single batch of texts and vectors is held in memory, so
+        ``texts``, ``metadatas`` and ``ids`` may be arbitrarily long generators.
+        With ``pipelined=True`` embedding and writing run concurrently,
+        connected by a queue holding at most ``queue_depth`` embedded batches.
+        """
+        batch_size = batch_size or self.batch_size
+        batches = self._text_batches(texts, metadatas, ids, batch_size)
+        if pipelined:
+            return self._add_batches_pipelined(
+                batches, batch_size=batch_size, queue_depth=queue_depth, **kwargs
+            )
 
-        store = cls(embedding=embedding, **kwargs)
-        store.add_embeddings(texts=texts, embeddings=embeddings, metadatas=metadatas, ids=ids)
-        return store
+        added_ids: List[str] = []
+        summary: List[Dict[str, Any]] = []
+        for text_batch, metadata_batch, id_batch in batches:
+            added_ids.extend(
+                self.add_embeddings(
+                    texts=text_batch,
+                    embeddings=self.embedding.embed_documents(text_batch),
+                    metadatas=metadata_batch,
+                    ids=id_batch,
+                    batch_size=batch_size,
+                    **kwargs,
+                )
+            )
+            summary.extend(self.last_import_summary)
+
+        self.last_import_summary = summary
+        return added_ids
+
+    @staticmethod
+    def _text_batches(
+            texts: Iterable[str],
+            metadatas: Optional[Iterable[dict]],
+            ids: Optional[Iterable[str]],
+            batch_size: int,
+    ) -> Iterator[_TextBatch]:
+        columns: Dict[str, Iterable[Any]] = {"texts": texts}
+        if metadatas is not None:
+            columns["metadatas"] = metadatas
+        if ids is not None:
+            columns["ids"] = ids
+        for batch in _batched(_zip_equal(**columns), batch_size):
+            text_batch = [row[0] for row in batch]
+            yield (
+                text_batch,
+                [row[1] for row in batch] if metadatas is not None else None,
+                [row[-1] for row in batch] if ids is not None else None,
+            )
+
+    def _add_batches_pipelined(
+            self,
+            batches: Iterator[_TextBatch],
+            batch_size: int,
+            queue_depth: int,
+            **kwargs: Any,
+    ) -> List[str]:
+        """Embed batches on the calling thread while a writer thread inserts them.
+
+        ``embed_blocked_seconds`` grows when the writer is the bottleneck (the
+        queue is full), ``write_idle_seconds`` when the embedder is.
+        """
+        work: "queue.Queue[Optional[Tuple[Any, ...]]]" = queue.Queue(
+            maxsize=max(queue_depth, 1)
+        )
+        added_ids: List[str] = []
+        summary: List[Dict[str, Any]] = []
+        errors: List[BaseException] = []
+        stats: Dict[str, Any] = {
+            "documents": 0,
+            "batches": 0,
+            "embed_seconds": 0.0,
+            "write_seconds": 0.0,
+            "embed_blocked_seconds": 0.0,
+            "write_idle_seconds": 0.0,
+            "max_queue_size": 0,
+        }
+
+        def write_stage() -> None:
+            while True:
+                waited = time.perf_counter()
+                item = work.get()
+                stats["write_idle_seconds"] += time.perf_counter() - waited
+                if item is None:
+                    return
+                if errors:
+                    continue
+                text_batch, embeddings, metadata_batch, id_batch = item
+                started = time.perf_counter()
+                try:
+                    added_ids.extend(
+                        self.add_embeddings(
+                            texts=text_batch,
+                            embeddings=embeddings,
+                            metadatas=metadata_batch,
+                            ids=id_batch,
+                            batch_size=batch_size,
+                            **kwargs,
+                        )
+                    )
+                    summary.extend(self.last_import_summary)
+                except BaseException as e:
+                    errors.append(e)
+                stats["write_seconds"] += time.perf_counter() - started
+                stats["documents"] += len(text_batch)
+                stats["batches"] += 1
+
+        started = time.perf_counter()
+        writer = threading.Thread(target=write_stage, daemon=True)
+        writer.start()
+        try:
+            for text_batch, metadata_batch, id_batch in batches:
+                if errors:
+                    break
+                embed_started = time.perf_counter()
+                embeddings = self.embedding.embed_documents(text_batch)
+                put_started = time.perf_counter()
+                stats["embed_seconds"] += put_started - embed_started
+                work.put((text_batch, embeddings, metadata_batch, id_batch))
+                stats["embed_blocked_seconds"] += time.perf_counter() - put_started
+                stats["max_queue_size"] = max(stats["max_queue_size"], work.qsize())
+        finally:
+            work.put(None)
+            writer.join()
+
+        elapsed = time.perf_counter() - started
+        stats["elapsed_seconds"] = elapsed
+        stats["docs_per_second"] = stats["documents"] / elapsed if elapsed else 0.0
+        self.last_pipeline_stats = stats
+        self.last_import_summary = summary
+
+        if errors:
+            raise errors[0]
+        return added_ids
 
     def add_embeddings(
             self,
-            texts: List[str],
-            embeddings: List[List[float]],
-            metadatas: Optional[List[dict]] = None,
-            ids: Optional[List[str]] = None,
+            texts: Iterable[str],
+            embeddings: Iterable[List[float]],
+            metadatas: Optional[Iterable[dict]] = None,
+            ids: Optional[Iterable[str]] = None,
+            batch_size: Optional[int] = None,
+            on_duplicate: Optional[str] = None,
             **kwargs: Any,
     ) -> List[str]:
-        if ids is None:
-            ids = [md5(text.encode("utf-8")).hexdigest() for text in texts]
+        """Write pre-computed embeddings with one ``import_bulk`` call per batch.
+
+        ``on_duplicate`` is passed through to ArangoDB and is one of
+        ``"error"``, ``"update"``, ``"replace"`` or ``"ignore"``. The
+        created/updated/ignored/error counts of every batch are stored in
+        ``last_import_summary``.
+        """
+        batch_size = batch_size or self.batch_size
+        on_duplicate = on_duplicate or self.on_duplicate
 
-        if not metadatas:
-            metadatas = [{} for _ in texts]
+        added_ids: List[str] = []
+        self.last_import_summary = []
+        for batch in _batched(
+                self._documents(texts, embeddings, metadatas, ids), batch_size
+        ):
+            result = self.collection.import_bulk(
+                batch,
+                halt_on_error=False,
+                details=True,
+                on_duplicate=on_duplicate,
+            )
+            self.last_import_summary.append(self._import_summary(batch, result))
+            added_ids.extend(doc["_key"] for doc in batch)
 
-        documents = []
-        for text, embedding, metadata, doc_id in zip(texts, embeddings, metadatas, ids):
+        self._mark_local_index_stale()
+        return added_ids
+
+    def _documents(
+            self,
+            texts: Iterable[str],
+            embeddings: Iterable[List[float]],
+            metadatas: Optional[Iterable[dict]] = None,
+            ids: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        columns: Dict[str, Iterable[Any]] = {"texts": texts, "embeddings": embeddings}
+        if metadatas is not None:
+            columns["metadatas"] = metadatas
+        if ids is not None:
+            columns["ids"] = ids
+        for row in _zip_equal(**columns):
+            text, embedding = row[0], row[1]
+            metadata = row[2] if metadatas is not None else None
+            doc_id = row[-1] if ids is not None else None
+            value, scale = encode_embedding(embedding, self.embedding_encoding)
+            # Metadata first, so it cannot overwrite the key or stored fields.
             doc = {
-                "_key": doc_id,
+                **(metadata or {}),
+                "_key": doc_id or md5(text.encode("utf-8")).hexdigest(),
                 self.text_field: text,
-                self.embedding_field: embedding,
-                **metadata,
+                self.embedding_field: value,
+                self.content_hash_field: self._content_hash(text, metadata),
+                self.updated_at_field: time.time(),
             }
-            documents.append(doc)
+            if scale is not None:
+                doc[self.embedding_scale_field] = scale
+            else:
+                doc.pop(self.embedding_scale_field, None)
+            yield doc
+
+    @property
+    def _internal_fields(self) -> List[str]:
+        """Stored attributes that are not returned as document metadata."""
+        return [
+            self.embedding_field,
+            self.embedding_scale_field,
+            self.content_hash_field,
+            self.updated_at_field,
+        ]
+
+    @staticmethod
+    def _content_hash(text: str, metadata: Optional[dict]) -> str:
+        payload = json.dumps([text, metadata or {}], sort_keys=True, default=str)
+        return md5(payload.encode("utf-8")).hexdigest()
+
+    def index_texts(
+            self,
+            texts: Iterable[str],
+            metadatas: Optional[Iterable[dict]] = None,
+            ids: Optional[Iterable[str]] = None,
+            source: Optional[str] = None,
+            source_field: str = "source",
+            cleanup: bool = True,
+            batch_size: Optional[int] = None,
+            **kwargs: Any,
+    ) -> Dict[str, int]:
+        """Incrementally index ``texts``, embedding only what changed.
+
+        Each batch is checked against the stored content hashes with one AQL
+        lookup; unchanged documents are skipped and only new or changed texts
+        are embedded and written. When ``source`` is given it is stored under
+        ``source_field`` and, with ``cleanup=True``, documents of that source
+        that were not part of this run are deleted afterwards.
+        """
+        batch_size = batch_size or self.batch_size
+        counts = {"added": 0, "updated": 0, "skipped": 0, "deleted": 0}
+        seen_keys: List[str] = []
 
-        # TODO: Insert documents into ArangoDB
-        # Example: self.collection.import_bulk(documents)
+        for text_batch, metadata_batch, id_batch in self._text_batches(
+                texts, metadatas, ids, batch_size
+        ):
+            metadata_batch = metadata_batch or [{} for _ in text_batch]
+            if source is not None:
+                metadata_batch = [
+                    {**metadata, source_field: source} for metadata in metadata_batch
+                ]
+            keys = id_batch or [
+                md5(text.encode("utf-8")).hexdigest() for text in text_batch
+            ]
+            seen_keys.extend(keys)
 
-        return ids
+            cursor = self.db.aql.execute(
+                "FOR key IN @keys LET doc = DOCUMENT(@@collection, key) "
+                "FILTER doc != null RETURN [doc._key, doc.@hash_field]",
+                bind_vars={
+                    "@collection": self.collection_name,
+                    "hash_field": self.content_hash_field,
+                    "keys": keys,
+                },
+            )
+            stored = dict(cursor)
+
+            pending = [
+                (text, metadata, key)
+                for text, metadata, key in zip(text_batch, metadata_batch, keys)
+                if stored.get(key) != self._content_hash(text, metadata)
+            ]
+            counts["skipped"] += len(text_batch) - len(pending)
+            if not pending:
+                continue
+            counts["updated"] += sum(1 for _, _, key in pending if key in stored)
+            counts["added"] += sum(1 for _, _, key in pending if key not in stored)
+
+            pending_texts = [text for text, _, _ in pending]
+            self.add_embeddings(
+                texts=pending_texts,
+                embeddings=self.embedding.embed_documents(pending_texts),
+                metadatas=[metadata for _, metadata, _ in pending],
+                ids=[key for _, _, key in pending],
+                batch_size=batch_size,
+                **kwargs,
+            )
+
+        if source is not None and cleanup:
+            cursor = self.db.aql.execute(
+                "FOR doc IN @@collection "
+                "FILTER doc.@source_field == @source AND doc._key NOT IN @keys "
+                "REMOVE doc IN @@collection RETURN OLD._key",
+                bind_vars={
+                    "@collection": self.collection_name,
+                    "source_field": source_field,
+                    "source": source,
+                    "keys": seen_keys,
+                },
+            )
+            deleted = list(cursor)
+            counts["deleted"] = len(deleted)
+            if self.local_index is not None:
+                self.local_index.remove(deleted)
+
+        return counts
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        if ids is None:
+            raise ValueError("No ids provided to delete.")
+        self.collection.delete_many([{"_key": doc_id} for doc_id in ids])
+        if self.local_index is not None:
+            self.local_index.remove(ids)
+        return True
+
+    @staticmethod
+    def _import_summary(
+            batch: List[Dict[str, Any]], result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "size": len(batch),
+            "created": result.get("created", 0),
+            "updated": result.get("updated", 0),
+            "ignored": result.get("ignored", 0),
+            "errors": result.get("errors", 0),
+            "details": result.get("details", []) if result.get("errors") else [],
+        }
 
     def similarity_search(
             self,
@@ -111,11 +569,56 @@ class ArangoVector(VectorStore):
             filter: Optional[Dict[str, Any]] = None,
             **kwargs: Any,
     ) -> List[Document]:
-        query_embedding = self.embedding.embed_query(query)
+        query_embedding = self._embed_query(query)
         return self.similarity_search_by_vector(
             embedding=query_embedding, k=k, filter=filter, **kwargs
         )
 
+    @property
+    def query_embedding_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the query embedding cache, if one is set."""
+        if self.query_embedding_cache is None:
+            return {}
+        return self.query_embedding_cache.stats
+
+    def _embed_query(self, query: str) -> List[float]:
+        cache = self.query_embedding_cache
+        if cache is None:
+            return self.embedding.embed_query(query)
+        embedding = cache.get(self.embedding_model_name, query)
+        if embedding is None:
+            embedding = self.embedding.embed_query(query)
+            cache.set(self.embedding_model_name, query, embedding)
+        return embedding
+
+    def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed ``queries`` with one ``embed_documents`` call for the misses."""
+        cache = self.query_embedding_cache
+        if cache is None:
+            return self.embedding.embed_documents(queries)
+        found = cache.get_many(self.embedding_model_name, queries)
+        missing = list(dict.fromkeys(
+            query for query, embedding in zip(queries, found) if embedding is None
+        ))
+        embedded: Dict[str, List[float]] = {}
+        if missing:
+            embedded = dict(zip(missing, self.embedding.embed_documents(missing)))
+            cache.set_many(self.embedding_model_name, missing, list(embedded.values()))
+        return [
+            embedding if embedding is not None else embedded[query]
+            for query, embedding in zip(queries, found)
+        ]
+
+    async def _aembed_query(self, query: str) -> List[float]:
+        cache = self.query_embedding_cache
+        if cache is None:
+            return await self.embedding.aembed_query(query)
+        embedding = (await cache.aget_many(self.embedding_model_name, [query]))[0]
+        if embedding is None:
+            embedding = await self.embedding.aembed_query(query)
+            await cache.aset_many(self.embedding_model_name, [query], [embedding])
+        return embedding
+
     def similarity_search_by_vector(
             self,
             embedding: List[float],
@@ -123,24 +626,611 @@ class ArangoVector(VectorStore):
             filter: Optional[Dict[str, Any]] = None,
             **kwargs: Any,
     ) -> List[Document]:
+        docs_and_scores = self.similarity_search_with_score_by_vector(
+            embedding=embedding, k=k, filter=filter, **kwargs
+        )
+        return [doc for doc, _ in docs_and_scores]
+
+    def similarity_search_with_score(
+            self,
+            query: str,
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        query_embedding = self._embed_query(query)
+        return self.similarity_search_with_score_by_vector(
+            embedding=query_embedding, k=k, filter=filter, **kwargs
+        )
+
+    def similarity_search_with_score_by_vector(
+            self,
+            embedding: List[float],
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        """Return the ``k`` nearest documents and their scores.
+
+        The top-k is computed in AQL. When the collection has a vector index
+        matching the distance strategy the ``APPROX_NEAR_*`` functions are used,
+        otherwise every document is scored exactly. Pass ``use_index=False`` to
+        force the exact scan and ``n_probe`` to override the index default.
+        """
         return_embeddings = kwargs.get("return_embeddings", False)
-        # TODO: Perform vector similarity search using ArangoDB's AQL or Search Views
-        # This is a placeholder return with mock documents
-        results = []
+        records = self._search_records(embedding, k, filter, **kwargs)
+        return [self._to_document(record, return_embeddings) for record in records]
+
+    def _search_records(
+            self,
+            embedding: List[float],
+            k: int,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Top-k as raw ``{doc, score, embedding}`` records."""
+        return_embeddings = kwargs.get("return_embeddings", False)
+        use_index = kwargs.get("use_index", True)
+        n_probe = kwargs.get("n_probe", self.n_probe)
+
+        if self.local_index is not None and filter is None and use_index:
+            return self._local_search_batch([embedding], k, return_embeddings)[0]
+
+        aql, bind_vars = self._build_search_query(
+            embedding,
+            k=k,
+            approximate=self._use_approximate(filter, use_index),
+            n_probe=n_probe,
+            return_embeddings=return_embeddings,
+            filter=filter,
+        )
+        return list(self.db.aql.execute(aql, bind_vars=bind_vars))
+
+    def similarity_search_batch(
+            self,
+            queries: List[str],
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[List[Document]]:
+        """Run several similarity searches at once.
+
+        All queries are embedded with a single ``embed_documents`` call and
+        resolved in one AQL request (or one matrix product in local mode).
+        Returns one result list per query, in input order.
+        """
+        embeddings = self._embed_queries(queries)
+        return self.similarity_search_by_vector_batch(
+            embeddings=embeddings, k=k, filter=filter, **kwargs
+        )
+
+    def similarity_search_by_vector_batch(
+            self,
+            embeddings: List[List[float]],
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[List[Document]]:
+        results = self.similarity_search_with_score_by_vector_batch(
+            embeddings=embeddings, k=k, filter=filter, **kwargs
+        )
+        return [[doc for doc, _ in docs_and_scores] for docs_and_scores in results]
+
+    def similarity_search_with_score_by_vector_batch(
+            self,
+            embeddings: List[List[float]],
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[List[Tuple[Document, float]]]:
+        if not embeddings:
+            return []
+        return_embeddings = kwargs.get("return_embeddings", False)
+        use_index = kwargs.get("use_index", True)
+        n_probe = kwargs.get("n_probe", self.n_probe)
+
+        if self.local_index is not None and filter is None and use_index:
+            return [
+                [self._to_document(record, return_embeddings) for record in records]
+                for records in self._local_search_batch(embeddings, k, return_embeddings)
+            ]
+
+        aql, bind_vars = self._build_batch_search_query(
+            embeddings,
+            k=k,
+            approximate=self._use_approximate(filter, use_index),
+            n_probe=n_probe,
+            return_embeddings=return_embeddings,
+            filter=filter,
+        )
+        cursor = self.db.aql.execute(aql, bind_vars=bind_vars)
+        return [
+            [self._to_document(record, return_embeddings) for record in records]
+            for records in cursor
+        ]
+
+    def _build_search_query(
+            self,
+            embedding: List[float],
+            k: int,
+            approximate: bool,
+            n_probe: Optional[int] = None,
+            return_embeddings: bool = False,
+            filter: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        bind_vars: Dict[str, Any] = {
+            "@collection": self.collection_name,
+            "query": [float(x) for x in embedding],
+            "k": k,
+            "unset_fields": self._internal_fields,
+        }
+        aql = self._search_subquery(
+            "@query", approximate, n_probe, return_embeddings, bind_vars, filter
+        )
+        return aql, bind_vars
+
+    def _build_batch_search_query(
+            self,
+            embeddings: List[List[float]],
+            k: int,
+            approximate: bool,
+            n_probe: Optional[int] = None,
+            return_embeddings: bool = False,
+            filter: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        bind_vars: Dict[str, Any] = {
+            "@collection": self.collection_name,
+            "queries": [[float(x) for x in embedding] for embedding in embeddings],
+            "k": k,
+            "unset_fields": self._internal_fields,
+        }
+        subquery = self._search_subquery(
+            "query_vector", approximate, n_probe, return_embeddings, bind_vars, filter
+        )
+        aql = f"""
+        FOR query_vector IN @queries
+            RETURN ({subquery})
+        """
+        return aql, bind_vars
 
-        # Example:
-        # query = "FOR doc IN vector_collection ... SORT ... LIMIT ... RETURN doc"
-        # bind_vars = {...}
-        # cursor = db.aql.execute(query, bind_vars=bind_vars)
-        # for record in cursor:
-        #     metadata = record.copy()
-        #     text = metadata.pop(self.text_field)
-        #     if return_embeddings:
-        #         metadata["_embedding_"] = record[self.embedding_field]
-        #     results.append(Document(page_content=text, metadata=metadata))
+    def _search_subquery(
+            self,
+            query: str,
+            approximate: bool,
+            n_probe: Optional[int],
+            return_embeddings: bool,
+            bind_vars: Dict[str, Any],
+            filter: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Top-k subquery over ``@@collection``.
+
+        Without a vector index (or when ``_use_approximate`` prefers an index
+        on the filtered fields) the filter is applied before scoring. An
+        approximate search can only return the index's nearest neighbours, so
+        there the filter runs on ``post_filter_overfetch * k`` candidates.
+        """
+        if not self._scorable_in_aql():
+            raise ValueError(
+                f"{self.embedding_encoding.value} embeddings cannot be scored in "
+                "AQL; create the store with `local_index=True` to search them."
+            )
+
+        field = f"doc.`{self.embedding_field}`"
+        scored = field
+        if (
+            self.embedding_encoding == EmbeddingEncoding.INT8
+            and self._distance_strategy != DistanceStrategy.COSINE
+        ):
+            # Cosine is scale invariant; every other metric needs real values.
+            scored = f"(FOR x IN {field} RETURN x * doc.`{self.embedding_scale_field}`)"
+
+        if approximate:
+            function, order = APPROX_SCORE_FUNCTIONS[self._distance_strategy]
+            if n_probe:
+                score = f"{function}({field}, {query}, {{ nProbe: @n_probe }})"
+                bind_vars["n_probe"] = n_probe
+            else:
+                score = f"{function}({field}, {query})"
+            source = "FOR doc IN @@collection"
+        else:
+            expression, order = EXACT_SCORE_EXPRESSIONS[self._distance_strategy]
+            score = expression.format(field=scored, query=query)
+            source = f"FOR doc IN @@collection FILTER {field} != null"
+
+        limit = "LIMIT @k"
+        if filter:
+            condition, filter_vars = FilterCompiler().compile(filter)
+            bind_vars.update(filter_vars)
+            if approximate:
+                bind_vars["fetch_k"] = bind_vars["k"] * self.post_filter_overfetch
+                limit = f"""LIMIT @fetch_k
+            FILTER {condition}
+            LIMIT @k"""
+            else:
+                source = f"""{source}
+            FILTER {condition}"""
+
+        returned = f"{field}" if return_embeddings else "null"
+        scale = f"doc.`{self.embedding_scale_field}`" if return_embeddings else "null"
+        return f"""
+        {source}
+            LET score = {score}
+            SORT score {order}
+            {limit}
+            RETURN {{
+                doc: UNSET(doc, @unset_fields),
+                score: score,
+                embedding: {returned},
+                embedding_scale: {scale}
+            }}
+        """
+
+    def _scorable_in_aql(self) -> bool:
+        return self.embedding_encoding in (EmbeddingEncoding.JSON, EmbeddingEncoding.INT8)
+
+    def _record_embedding(self, record: Dict[str, Any]) -> Any:
+        embedding = record["embedding"]
+        if (
+            embedding is None
+            or isinstance(embedding, np.ndarray)
+            or self.embedding_encoding == EmbeddingEncoding.JSON
+        ):
+            return embedding
+        return decode_embedding(
+            embedding, self.embedding_encoding, record.get("embedding_scale")
+        )
+
+    def _to_document(
+            self, record: Dict[str, Any], return_embeddings: bool = False
+    ) -> Tuple[Document, float]:
+        metadata = record["doc"]
+        text = metadata.pop(self.text_field, "")
+        if return_embeddings:
+            embedding = self._record_embedding(record)
+            if isinstance(embedding, np.ndarray):
+                embedding = embedding.tolist()
+            metadata["_embedding_"] = embedding
+        return Document(page_content=text, metadata=metadata), record["score"]
+
+    def refresh_local_index(self, full: bool = False) -> Dict[str, int]:
+        """Bring the local index in line with the collection.
+
+        Documents are written with ``updated_at_field``, so a refresh only
+        reads those written since the previous one, through a sparse index
+        on that field. Removals made through this store are applied
+        directly; if the collection count still differs from the index
+        afterwards (documents removed elsewhere, or written without the
+        field), or with ``full=True``, every ``_key``/``_rev`` pair is read
+        and compared instead.
+        """
+        if self.local_index is None:
+            raise ValueError("ArangoVector was created without `local_index=True`.")
+
+        if full or self._local_index_since is None:
+            counts = self._reconcile_local_index()
+        else:
+            counts = self._refresh_local_index_since(self._local_index_since)
+            if self.collection.count() != len(self.local_index):
+                reconciled = self._reconcile_local_index()
+                counts = {
+                    "upserted": counts["upserted"] + reconciled["upserted"],
+                    "removed": reconciled["removed"],
+                }
+
+        self._local_index_stale = False
+        self._local_index_refreshed_at = time.monotonic()
+        return counts
+
+    def _refresh_local_index_since(self, since: float) -> Dict[str, int]:
+        assert self.local_index is not None
+        cursor = self.db.aql.execute(
+            "FOR doc IN @@collection "
+            "FILTER doc.@updated_at_field >= @since AND doc.@field != null "
+            "RETURN [doc._key, doc._rev, doc.@updated_at_field, "
+            "doc.@field, doc.@scale_field]",
+            bind_vars={
+                "@collection": self.collection_name,
+                "updated_at_field": self.updated_at_field,
+                "field": self.embedding_field,
+                "scale_field": self.embedding_scale_field,
+                "since": since - LOCAL_INDEX_REFRESH_OVERLAP,
+            },
+            stream=True,
+        )
+        known = self.local_index.revisions
+        upserted = 0
+        for batch in _batched(cursor, self.batch_size):
+            self._track_updated_at(row[2] for row in batch)
+            changed = [row for row in batch if known.get(row[0]) != row[1]]
+            self._upsert_local_rows(
+                [(key, rev, value, scale) for key, rev, _, value, scale in changed]
+            )
+            upserted += len(changed)
+        return {"upserted": upserted, "removed": 0}
+
+    def _reconcile_local_index(self) -> Dict[str, int]:
+        """Diff every ``_key``/``_rev`` pair, fetching vectors only for new or
+        changed documents and dropping rows whose document is gone."""
+        assert self.local_index is not None
+        cursor = self.db.aql.execute(
+            "FOR doc IN @@collection FILTER doc.@field != null "
+            "RETURN [doc._key, doc._rev, doc.@updated_at_field]",
+            bind_vars={
+                "@collection": self.collection_name,
+                "field": self.embedding_field,
+                "updated_at_field": self.updated_at_field,
+            },
+            stream=True,
+        )
+        revisions = {}
+        for key, rev, updated_at in cursor:
+            revisions[key] = rev
+            self._track_updated_at([updated_at])
+        if self._local_index_since is None:
+            self._local_index_since = 0.0
+        known = self.local_index.revisions
+        stale = [key for key in known if key not in revisions]
+        changed = [key for key, rev in revisions.items() if known.get(key) != rev]
+
+        for batch in _batched(changed, self.batch_size):
+            cursor = self.db.aql.execute(
+                "FOR key IN @keys LET doc = DOCUMENT(@@collection, key) "
+                "FILTER doc != null "
+                "RETURN [doc._key, doc._rev, doc.@field, doc.@scale_field]",
+                bind_vars={
+                    "@collection": self.collection_name,
+                    "field": self.embedding_field,
+                    "scale_field": self.embedding_scale_field,
+                    "keys": batch,
+                },
+            )
+            self._upsert_local_rows(list(cursor))
+        self.local_index.remove(stale)
+        return {"upserted": len(changed), "removed": len(stale)}
 
+    def _upsert_local_rows(self, rows: List[Any]) -> None:
+        """Upsert ``(key, rev, stored embedding, scale)`` rows."""
+        assert self.local_index is not None
+        if not rows:
+            return
+        keys, revs, values, scales = zip(*rows)
+        vectors = [
+            decode_embedding(value, self.embedding_encoding, scale)
+            for value, scale in zip(values, scales)
+        ]
+        self.local_index.upsert(keys, revs, vectors)
+
+    def _track_updated_at(self, values: Iterable[Any]) -> None:
+        newest = max((v for v in values if isinstance(v, (int, float))), default=None)
+        if newest is not None and (
+            self._local_index_since is None or newest > self._local_index_since
+        ):
+            self._local_index_since = float(newest)
+
+    def _mark_local_index_stale(self) -> None:
+        if self.local_index is not None:
+            self._local_index_stale = True
+
+    def _local_search_batch(
+            self,
+            embeddings: List[List[float]],
+            k: int,
+            return_embeddings: bool = False,
+    ) -> List[List[Dict[str, Any]]]:
+        if self._local_index_expired():
+            self.refresh_local_index()
+        hits = self._local_hits(embeddings, k)
+        aql, bind_vars = self._local_payload_query(hits)
+        documents = self.db.aql.execute(aql, bind_vars=bind_vars) if aql else []
+        return self._local_results(hits, documents, return_embeddings)
+
+    def _local_index_expired(self) -> bool:
+        return self._local_index_stale or (
+            self.local_index_refresh_interval is not None
+            and time.monotonic() - self._local_index_refreshed_at
+            > self.local_index_refresh_interval
+        )
+
+    def _local_hits(
+            self, embeddings: List[List[float]], k: int
+    ) -> List[List[Tuple[str, float]]]:
+        assert self.local_index is not None
+        return self.local_index.search_batch(embeddings, k)
+
+    def _local_payload_query(
+            self, hits: List[List[Tuple[str, float]]]
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        # The vectors are local; only the payloads of the top-k are fetched,
+        # by primary key, in a single request.
+        keys = list(dict.fromkeys(key for query_hits in hits for key, _ in query_hits))
+        if not keys:
+            return None, {}
+        aql = (
+            "FOR key IN @keys LET doc = DOCUMENT(@@collection, key) "
+            "FILTER doc != null RETURN UNSET(doc, @unset_fields)"
+        )
+        return aql, {
+            "@collection": self.collection_name,
+            "unset_fields": self._internal_fields,
+            "keys": keys,
+        }
+
+    def _local_results(
+            self,
+            hits: List[List[Tuple[str, float]]],
+            documents: Iterable[Dict[str, Any]],
+            return_embeddings: bool = False,
+    ) -> List[List[Dict[str, Any]]]:
+        assert self.local_index is not None
+        by_key = {doc["_key"]: doc for doc in documents}
+        results = []
+        for query_hits in hits:
+            found = [(key, score) for key, score in query_hits if key in by_key]
+            vectors = (
+                self.local_index.embeddings_for([key for key, _ in found])
+                if return_embeddings and found else None
+            )
+            results.append([
+                {
+                    "doc": dict(by_key[key]),
+                    "score": score,
+                    "embedding": vectors[i] if vectors is not None else None,
+                }
+                for i, (key, score) in enumerate(found)
+            ])
         return results
 
+    def _indexable(self) -> bool:
+        if self._distance_strategy not in VECTOR_INDEX_METRICS:
+            return False
+        if self.embedding_encoding == EmbeddingEncoding.INT8:
+            # Quantized values are only comparable without their scale under cosine.
+            return self._distance_strategy == DistanceStrategy.COSINE
+        return self.embedding_encoding == EmbeddingEncoding.JSON
+
+    def _has_vector_index(self) -> bool:
+        if not self._indexable():
+            return False
+        if self._vector_index is None:
+            self._load_indexes(self.collection.indexes())
+        return bool(self._vector_index)
+
+    def _load_indexes(self, indexes: List[Dict[str, Any]]) -> None:
+        self._vector_index = self._match_vector_index(indexes) or False
+        self._indexed_fields = {
+            index["fields"][0]
+            for index in indexes
+            if index.get("type") in ("persistent", "hash", "skiplist")
+            and index.get("fields")
+        }
+
+    def _use_approximate(
+            self, filter: Optional[Dict[str, Any]], use_index: bool
+    ) -> bool:
+        """Whether to search through the vector index.
+
+        A filter on a field that leads a persistent index is selective enough
+        to pre-filter with the persistent index and score the survivors
+        exactly, which also avoids post-filtering an over-fetched candidate
+        set that may come back short of ``k``.
+        """
+        if not (use_index and self._has_vector_index()):
+            return False
+        return not (filter and filter_fields(filter) & (self._indexed_fields or set()))
+
+    def create_metadata_index(
+            self, fields: List[str], name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a persistent index on metadata ``fields``.
+
+        Filtered searches whose filter references ``fields[0]`` are then
+        pre-filtered through this index instead of post-filtering the
+        approximate vector search.
+        """
+        data: Dict[str, Any] = {"type": "persistent", "fields": fields}
+        if name is not None:
+            data["name"] = name
+        index = self.collection.add_index(data, formatter=True)
+        self._vector_index = None
+        return index
+
+    def retrieve_vector_index(self) -> Optional[Dict[str, Any]]:
+        """Return the vector index on ``embedding_field`` matching the
+        distance strategy, or ``None`` if there is none."""
+        return self._match_vector_index(self.collection.indexes())
+
+    def _match_vector_index(
+            self, indexes: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        metric = VECTOR_INDEX_METRICS.get(self._distance_strategy)
+        for index in indexes:
+            if (
+                index.get("type") == "vector"
+                and index.get("fields") == [self.embedding_field]
+                and index.get("params", {}).get("metric") == metric
+            ):
+                return index
+        return None
+
+    def create_vector_index(
+            self,
+            n_lists: Optional[int] = None,
+            default_n_probe: Optional[int] = None,
+            training_iterations: Optional[int] = None,
+            dimension: Optional[int] = None,
+            name: Optional[str] = None,
+            parallelism: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Create a vector index on ``embedding_field``.
+
+        ArangoDB trains the index on the documents already in the collection,
+        so call this after the initial load. ``n_lists`` defaults to
+        ``15 * sqrt(count)``; raise ``default_n_probe`` (or pass ``n_probe``
+        per query) to trade latency for recall.
+        """
+        metric = VECTOR_INDEX_METRICS.get(self._distance_strategy)
+        if metric is None:
+            raise ValueError(
+                f"{self._distance_strategy} is not supported by ArangoDB vector "
+                "indexes; searches will use an exact scan."
+            )
+        if not self._indexable():
+            raise ValueError(
+                f"{self.embedding_encoding.value} embeddings cannot be indexed "
+                f"for {self._distance_strategy.value} search."
+            )
+
+        if dimension is None:
+            cursor = self.db.aql.execute(
+                "FOR doc IN @@collection FILTER doc.@field != null LIMIT 1 "
+                "RETURN LENGTH(doc.@field)",
+                bind_vars={
+                    "@collection": self.collection_name,
+                    "field": self.embedding_field,
+                },
+            )
+            dimension = next(iter(cursor), None)
+            if dimension is None:
+                raise ValueError(
+                    "Cannot create a vector index on an empty collection; "
+                    "add documents first or pass `dimension`."
+                )
+
+        if n_lists is None:
+            n_lists = max(1, int(15 * np.sqrt(self.collection.count())))
+
+        params: Dict[str, Any] = {
+            "metric": metric,
+            "dimension": dimension,
+            "nLists": n_lists,
+        }
+        if default_n_probe is not None:
+            params["defaultNProbe"] = default_n_probe
+        if training_iterations is not None:
+            params["trainingIterations"] = training_iterations
+
+        data: Dict[str, Any] = {
+            "type": "vector",
+            "fields": [self.embedding_field],
+            "params": params,
+        }
+        if name is not None:
+            data["name"] = name
+        if parallelism is not None:
+            data["parallelism"] = parallelism
+
+        index = self.collection.add_index(data, formatter=True)
+        self._vector_index = index
+        return index
+
+    def delete_vector_index(self) -> bool:
+        """Drop the vector index on ``embedding_field`` if it exists."""
+        index = self.retrieve_vector_index()
+        self._vector_index = False
+        if index is None:
+            return False
+        return self.collection.delete_index(index["id"].split("/")[-1])
+
     def max_marginal_relevance_search(
             self,
             query: str,
@@ -150,23 +1240,530 @@ class ArangoVector(VectorStore):
             filter: Optional[Dict[str, Any]] = None,
             **kwargs: Any,
     ) -> List[Document]:
-        query_embedding = self.embedding.embed_query(query)
-        initial_results = self.similarity_search_by_vector(
+        query_embedding = self._embed_query(query)
+        return self.max_marginal_relevance_search_by_vector(
             embedding=query_embedding,
-            k=fetch_k,
+            k=k,
+            fetch_k=fetch_k,
+            lambda_mult=lambda_mult,
             filter=filter,
+            **kwargs,
+        )
+
+    def max_marginal_relevance_search_by_vector(
+            self,
+            embedding: List[float],
+            k: int = 4,
+            fetch_k: int = 20,
+            lambda_mult: float = 0.5,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Document]:
+        """Diversify the ``fetch_k`` nearest documents down to ``k``.
+
+        By default the candidates' embeddings are fetched once into a float32
+        matrix and selected with ``maximal_marginal_relevance_matrix``. With
+        ``server_side=True`` the selection runs inside the AQL query and only
+        the ``k`` chosen documents are transferred.
+        """
+        kwargs["return_embeddings"] = not kwargs.pop("server_side", False)
+        if not kwargs["return_embeddings"]:
+            aql, bind_vars = self._build_mmr_query(
+                embedding,
+                k=k,
+                fetch_k=fetch_k,
+                lambda_mult=lambda_mult,
+                approximate=self._use_approximate(
+                    filter, kwargs.get("use_index", True)
+                ),
+                n_probe=kwargs.get("n_probe", self.n_probe),
+                filter=filter,
+            )
+            cursor = self.db.aql.execute(aql, bind_vars=bind_vars)
+            return [self._to_document(record)[0] for record in cursor]
+
+        records = self._search_records(embedding, fetch_k, filter, **kwargs)
+        return self._select_mmr(embedding, records, k, lambda_mult)
+
+    def _select_mmr(
+            self,
+            embedding: List[float],
+            records: List[Dict[str, Any]],
+            k: int,
+            lambda_mult: float,
+    ) -> List[Document]:
+        if not records:
+            return []
+        matrix = np.asarray(
+            [self._record_embedding(record) for record in records], dtype=np.float32
+        )
+        selected = maximal_marginal_relevance_matrix(
+            embedding, matrix, lambda_mult=lambda_mult, k=k
+        )
+        return [self._to_document(records[i])[0] for i in selected]
+
+    def _build_mmr_query(
+            self,
+            embedding: List[float],
+            k: int,
+            fetch_k: int,
+            lambda_mult: float,
+            approximate: bool,
+            n_probe: Optional[int] = None,
+            filter: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """AQL running greedy MMR over the ``fetch_k`` candidates.
+
+        AQL has no loops with mutable state, so the ``k`` greedy steps are
+        unrolled into ``k`` ``LET`` statements, each appending the best
+        remaining candidate to the selection.
+        """
+        aql, bind_vars = self._build_search_query(
+            embedding,
+            k=fetch_k,
+            approximate=approximate,
+            n_probe=n_probe,
             return_embeddings=True,
+            filter=filter,
+        )
+        bind_vars["lambda_mult"] = lambda_mult
+
+        steps = []
+        for i in range(1, k + 1):
+            steps.append(f"""
+        LET pick_{i} = FIRST(
+            FOR c IN candidates
+                FILTER c.doc._key NOT IN selected_{i - 1}[*].doc._key
+                LET redundancy = MAX(
+                    FOR s IN selected_{i - 1}
+                        RETURN COSINE_SIMILARITY(c.embedding, s.embedding)
+                )
+                SORT @lambda_mult * c.relevance
+                    - (1 - @lambda_mult) * redundancy DESC
+                LIMIT 1
+                RETURN c
+        )
+        LET selected_{i} = pick_{i} == null
+            ? selected_{i - 1} : APPEND(selected_{i - 1}, pick_{i})""")
+
+        mmr_aql = f"""
+        LET candidates = (
+            FOR c IN ({aql})
+                RETURN MERGE(c, {{
+                    relevance: COSINE_SIMILARITY(c.embedding, @query)
+                }})
+        )
+        LET selected_0 = []
+        {"".join(steps)}
+        FOR s IN selected_{k}
+            RETURN {{ doc: s.doc, score: s.score, embedding: null }}
+        """
+        return mmr_aql, bind_vars
+
+    def retrieve_search_view(self) -> Optional[Dict[str, Any]]:
+        """Return the ArangoSearch view used by ``hybrid_search``, or ``None``."""
+        if not any(view["name"] == self.search_view_name for view in self.db.views()):
+            return None
+        return self.db.view(self.search_view_name)
+
+    def create_search_view(self, analyzer: Optional[str] = None) -> Dict[str, Any]:
+        """Create (or relink) the ArangoSearch view indexing ``text_field``.
+
+        ``analyzer`` defaults to ``search_analyzer`` and must exist in the
+        database; the built-in ``text_<lang>`` analyzers stem and lowercase
+        tokens, which is what BM25 ranking expects.
+        """
+        if analyzer is not None:
+            self.search_analyzer = analyzer
+        properties = {
+            "links": {
+                self.collection_name: {
+                    "fields": {
+                        self.text_field: {"analyzers": [self.search_analyzer]}
+                    }
+                }
+            }
+        }
+        if self.retrieve_search_view() is not None:
+            return self.db.update_arangosearch_view(self.search_view_name, properties)
+        return self.db.create_arangosearch_view(self.search_view_name, properties)
+
+    def delete_search_view(self) -> bool:
+        """Drop the ArangoSearch view if it exists."""
+        return self.db.delete_view(self.search_view_name, ignore_missing=True)
+
+    def hybrid_search(
+            self,
+            query: str,
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Document]:
+        docs_and_scores = self.hybrid_search_with_score(
+            query, k=k, filter=filter, **kwargs
+        )
+        return [doc for doc, _ in docs_and_scores]
+
+    def hybrid_search_with_score(
+            self,
+            query: str,
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        """Fuse BM25 keyword and vector search over ``search_view_name``.
+
+        Both rankings and their fusion run in one AQL request. ``fusion`` is
+        ``"rrf"`` (reciprocal rank fusion, ``1 / (rrf_k + rank)``) or
+        ``"weighted"`` (min-max normalized scores). ``alpha`` weights the
+        vector side and ``1 - alpha`` the keyword side; each side contributes
+        its best ``fetch_k`` (default ``4 * k``) candidates.
+        """
+        embedding = self._embed_query(query)
+        aql, bind_vars = self._build_hybrid_query(
+            query,
+            embedding,
+            k=k,
+            approximate=self._use_approximate(filter, kwargs.get("use_index", True)),
+            filter=filter,
             **kwargs,
         )
+        cursor = self.db.aql.execute(aql, bind_vars=bind_vars)
+        return [self._to_document(record) for record in cursor]
+
+    def _build_hybrid_query(
+            self,
+            query: str,
+            embedding: List[float],
+            k: int,
+            approximate: bool,
+            filter: Optional[Dict[str, Any]] = None,
+            fusion: str = "rrf",
+            alpha: float = 0.5,
+            rrf_k: int = 60,
+            fetch_k: Optional[int] = None,
+            **kwargs: Any,
+    ) -> Tuple[str, Dict[str, Any]]:
+        if fusion not in ("rrf", "weighted"):
+            raise ValueError(f"Unknown fusion {fusion!r}; use 'rrf' or 'weighted'.")
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError("alpha must be between 0 and 1.")
+
+        # The shared subquery limits to ``@k``; the fused list uses ``@top_k``.
+        vector_aql, bind_vars = self._build_search_query(
+            embedding,
+            k=fetch_k or 4 * k,
+            approximate=approximate,
+            n_probe=kwargs.get("n_probe", self.n_probe),
+            filter=filter,
+        )
+        bind_vars.update({
+            "@view": self.search_view_name,
+            "keywords": query,
+            "analyzer": self.search_analyzer,
+            "text_field": self.text_field,
+            "top_k": k,
+            "vector_weight": alpha,
+            "keyword_weight": 1.0 - alpha,
+        })
+
+        keyword_filter = ""
+        if filter:
+            # Same shape and values, so the bind variables are identical.
+            condition, _ = FilterCompiler().compile(filter)
+            keyword_filter = f"FILTER {condition}"
+
+        if fusion == "rrf":
+            bind_vars["rrf_k"] = rrf_k
+            vector_score = "@vector_weight / (@rrf_k + i + 1)"
+            keyword_score = "@keyword_weight / (@rrf_k + i + 1)"
+            bounds = ""
+        else:
+            _, order = EXACT_SCORE_EXPRESSIONS[self._distance_strategy]
+            best, worst = ("v_max", "v_min") if order == "DESC" else ("v_min", "v_max")
+            vector_score = (
+                "@vector_weight * (v_max == v_min ? 1 : "
+                f"(hit.score - {worst}) / ({best} - {worst}))"
+            )
+            keyword_score = (
+                "@keyword_weight * (k_max == k_min ? 1 : "
+                "(hit.score - k_min) / (k_max - k_min))"
+            )
+            bounds = """
+        LET v_min = MIN(vector_hits[*].score)
+        LET v_max = MAX(vector_hits[*].score)
+        LET k_min = MIN(keyword_hits[*].score)
+        LET k_max = MAX(keyword_hits[*].score)"""
+
+        aql = f"""
+        LET vector_hits = ({vector_aql})
+        LET keyword_hits = (
+            FOR doc IN @@view
+                SEARCH ANALYZER(
+                    doc.@text_field IN TOKENS(@keywords, @analyzer), @analyzer
+                )
+                {keyword_filter}
+                LET score = BM25(doc)
+                SORT score DESC
+                LIMIT @k
+                RETURN {{ doc: UNSET(doc, @unset_fields), score: score }}
+        ){bounds}
+        LET fused = UNION(
+            (FOR i IN 0..LENGTH(vector_hits) FILTER i < LENGTH(vector_hits)
+                LET hit = vector_hits[i]
+                RETURN {{ doc: hit.doc, score: {vector_score} }}),
+            (FOR i IN 0..LENGTH(keyword_hits) FILTER i < LENGTH(keyword_hits)
+                LET hit = keyword_hits[i]
+                RETURN {{ doc: hit.doc, score: {keyword_score} }})
+        )
+        FOR hit IN fused
+            COLLECT key = hit.doc._key INTO matches = hit
+            LET score = SUM(matches[*].score)
+            SORT score DESC
+            LIMIT @top_k
+            RETURN {{ doc: FIRST(matches).doc, score: score, embedding: null }}
+        """
+        return aql, bind_vars
+
+    @property
+    def async_client(self) -> AsyncArangoClient:
+        """Shared asyncio client; all async methods reuse its connection pool."""
+        if self._async_client is None:
+            self._async_client = AsyncArangoClient(
+                hosts=self.db_url,
+                db_name=self.database,
+                username=self.username,
+                password=self.password,
+                max_connections=self.async_max_connections,
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    async def aadd_texts(
+            self,
+            texts: Iterable[str],
+            metadatas: Optional[Iterable[dict]] = None,
+            ids: Optional[Iterable[str]] = None,
+            batch_size: Optional[int] = None,
+            **kwargs: Any,
+    ) -> List[str]:
+        batch_size = batch_size or self.batch_size
+        added_ids: List[str] = []
+        summary: List[Dict[str, Any]] = []
+        for text_batch, metadata_batch, id_batch in self._text_batches(
+                texts, metadatas, ids, batch_size
+        ):
+            added_ids.extend(
+                await self.aadd_embeddings(
+                    texts=text_batch,
+                    embeddings=await self.embedding.aembed_documents(text_batch),
+                    metadatas=metadata_batch,
+                    ids=id_batch,
+                    batch_size=batch_size,
+                    **kwargs,
+                )
+            )
+            summary.extend(self.last_import_summary)
+
+        self.last_import_summary = summary
+        return added_ids
+
+    async def aadd_embeddings(
+            self,
+            texts: Iterable[str],
+            embeddings: Iterable[List[float]],
+            metadatas: Optional[Iterable[dict]] = None,
+            ids: Optional[Iterable[str]] = None,
+            batch_size: Optional[int] = None,
+            on_duplicate: Optional[str] = None,
+            **kwargs: Any,
+    ) -> List[str]:
+        batch_size = batch_size or self.batch_size
+        on_duplicate = on_duplicate or self.on_duplicate
+
+        added_ids: List[str] = []
+        summary: List[Dict[str, Any]] = []
+        for batch in _batched(
+                self._documents(texts, embeddings, metadatas, ids), batch_size
+        ):
+            result = await self.async_client.import_bulk(
+                self.collection_name, batch, on_duplicate=on_duplicate
+            )
+            summary.append(self._import_summary(batch, result))
+            added_ids.extend(doc["_key"] for doc in batch)
+
+        self.last_import_summary = summary
+        self._mark_local_index_stale()
+        return added_ids
+
+    async def asimilarity_search(
+            self,
+            query: str,
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Document]:
+        query_embedding = await self._aembed_query(query)
+        return await self.asimilarity_search_by_vector(
+            embedding=query_embedding, k=k, filter=filter, **kwargs
+        )
+
+    async def asimilarity_search_by_vector(
+            self,
+            embedding: List[float],
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Document]:
+        docs_and_scores = await self.asimilarity_search_with_score_by_vector(
+            embedding=embedding, k=k, filter=filter, **kwargs
+        )
+        return [doc for doc, _ in docs_and_scores]
+
+    async def asimilarity_search_with_score(
+            self,
+            query: str,
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        query_embedding = await self._aembed_query(query)
+        return await self.asimilarity_search_with_score_by_vector(
+            embedding=query_embedding, k=k, filter=filter, **kwargs
+        )
+
+    async def asimilarity_search_with_score_by_vector(
+            self,
+            embedding: List[float],
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        return_embeddings = kwargs.get("return_embeddings", False)
+        records = await self._asearch_records(embedding, k, filter, **kwargs)
+        return [self._to_document(record, return_embeddings) for record in records]
+
+    async def _asearch_records(
+            self,
+            embedding: List[float],
+            k: int,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        return_embeddings = kwargs.get("return_embeddings", False)
+        use_index = kwargs.get("use_index", True)
+        n_probe = kwargs.get("n_probe", self.n_probe)
+
+        if self.local_index is not None and filter is None and use_index:
+            if self._local_index_expired():
+                await run_in_executor(None, self.refresh_local_index)
+            hits = self._local_hits([embedding], k)
+            aql, bind_vars = self._local_payload_query(hits)
+            documents = await self.async_client.execute(aql, bind_vars) if aql else []
+            return self._local_results(hits, documents, return_embeddings)[0]
+
+        if use_index:
+            # Populates the index cache read by ``_use_approximate``.
+            await self._ahas_vector_index()
+        aql, bind_vars = self._build_search_query(
+            embedding,
+            k=k,
+            approximate=self._use_approximate(filter, use_index),
+            n_probe=n_probe,
+            return_embeddings=return_embeddings,
+            filter=filter,
+        )
+        return await self.async_client.execute(aql, bind_vars)
+
+    async def _ahas_vector_index(self) -> bool:
+        if not self._indexable():
+            return False
+        if self._vector_index is None:
+            self._load_indexes(await self.async_client.indexes(self.collection_name))
+        return bool(self._vector_index)
 
-        embeddings = [doc.metadata.get("_embedding_") for doc in initial_results]
-        selected_indices = maximal_marginal_relevance(
-            np.array(query_embedding), embeddings, lambda_mult=lambda_mult, k=k
+    async def amax_marginal_relevance_search(
+            self,
+            query: str,
+            k: int = 4,
+            fetch_k: int = 20,
+            lambda_mult: float = 0.5,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Document]:
+        query_embedding = await self._aembed_query(query)
+        return await self.amax_marginal_relevance_search_by_vector(
+            embedding=query_embedding,
+            k=k,
+            fetch_k=fetch_k,
+            lambda_mult=lambda_mult,
+            filter=filter,
+            **kwargs,
         )
-        selected_docs = [initial_results[i] for i in selected_indices]
 
-        for doc in selected_docs:
-            if "_embedding_" in doc.metadata:
-                del doc.metadata["_embedding_"]
+    async def amax_marginal_relevance_search_by_vector(
+            self,
+            embedding: List[float],
+            k: int = 4,
+            fetch_k: int = 20,
+            lambda_mult: float = 0.5,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Document]:
+        kwargs["return_embeddings"] = not kwargs.pop("server_side", False)
+        if not kwargs["return_embeddings"]:
+            use_index = kwargs.get("use_index", True)
+            if use_index:
+                await self._ahas_vector_index()
+            aql, bind_vars = self._build_mmr_query(
+                embedding,
+                k=k,
+                fetch_k=fetch_k,
+                lambda_mult=lambda_mult,
+                approximate=self._use_approximate(filter, use_index),
+                n_probe=kwargs.get("n_probe", self.n_probe),
+                filter=filter,
+            )
+            records = await self.async_client.execute(aql, bind_vars)
+            return [self._to_document(record)[0] for record in records]
+
+        records = await self._asearch_records(embedding, fetch_k, filter, **kwargs)
+        return self._select_mmr(embedding, records, k, lambda_mult)
 
-        return selected_docs
+    async def ahybrid_search(
+            self,
+            query: str,
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Document]:
+        docs_and_scores = await self.ahybrid_search_with_score(
+            query, k=k, filter=filter, **kwargs
+        )
+        return [doc for doc, _ in docs_and_scores]
+
+    async def ahybrid_search_with_score(
+            self,
+            query: str,
+            k: int = 4,
+            filter: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        embedding = await self._aembed_query(query)
+        use_index = kwargs.get("use_index", True)
+        if use_index:
+            await self._ahas_vector_index()
+        aql, bind_vars = self._build_hybrid_query(
+            query,
+            embedding,
+            k=k,
+            approximate=self._use_approximate(filter, use_index),
+            filter=filter,
+            **kwargs,
+        )
+        records = await self.async_client.execute(aql, bind_vars)
+        return [self._to_document(record) for record in records]
@@ -0,0 +1,182 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from arango.database import StandardDatabase
+from langchain_core.runnables.config import run_in_executor
+
+
+def cache_key(model: str, text: str) -> str:
+    """Key of ``text`` embedded by ``model``."""
+    return md5(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class QueryEmbeddingCache(ABC):
+    """Cache of query embeddings keyed by embedding model and query text.
+
+    Subclasses implement ``_get_many``/``_set_many``; hit and miss counters
+    are kept here so that every backend reports them the same way.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        return self.get_many(model, [text])[0]
+
+    def set(self, model: str, text: str, embedding: List[float]) -> None:
+        self.set_many(model, [text], [embedding])
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        found = self._get_many([cache_key(model, text) for text in texts])
+        hits = sum(1 for embedding in found if embedding is not None)
+        with self._counter_lock:
+            self.hits += hits
+            self.misses += len(found) - hits
+        return found
+
+    def set_many(
+        self, model: str, texts: Sequence[str], embeddings: Sequence[List[float]]
+    ) -> None:
+        self._set_many(
+            [cache_key(model, text) for text in texts], [list(e) for e in embeddings]
+        )
+
+    async def aget_many(
+        self, model: str, texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        return await run_in_executor(None, self.get_many, model, texts)
+
+    async def aset_many(
+        self, model: str, texts: Sequence[str], embeddings: Sequence[List[float]]
+    ) -> None:
+        await run_in_executor(None, self.set_many, model, texts, embeddings)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    @abstractmethod
+    def _get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        ...
+
+    @abstractmethod
+    def _set_many(self, keys: List[str], embeddings: List[List[float]]) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class InMemoryQueryEmbeddingCache(QueryEmbeddingCache):
+    """Process-local LRU cache with an optional time-to-live."""
+
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = None) -> None:
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def aget_many(
+        self, model: str, texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        # Lookups never block, so there is no need for an executor hop.
+        return self.get_many(model, texts)
+
+    async def aset_many(
+        self, model: str, texts: Sequence[str], embeddings: Sequence[List[float]]
+    ) -> None:
+        self.set_many(model, texts, embeddings)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats, "size": len(self._entries)}
+
+    def _get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        now = time.monotonic()
+        found: List[Optional[List[float]]] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl is not None and now - entry[0] > self.ttl:
+                    del self._entries[key]
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                found.append(entry[1] if entry is not None else None)
+        return found
+
+    def _set_many(self, keys: List[str], embeddings: List[List[float]]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, embedding in zip(keys, embeddings):
+                self._entries[key] = (now, embedding)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ArangoQueryEmbeddingCache(QueryEmbeddingCache):
+    """Cache shared between processes through an ArangoDB collection.
+
+    Entries carry an ``expires_at`` Unix timestamp covered by a TTL index, so
+    ArangoDB removes them in the background; expired entries that have not
+    been collected yet are treated as misses.
+    """
+
+    def __init__(
+        self,
+        db: StandardDatabase,
+        collection_name: str = "query_embedding_cache",
+        ttl: Optional[float] = 24 * 60 * 60,
+    ) -> None:
+        super().__init__()
+        self.ttl = ttl
+        if not db.has_collection(collection_name):
+            db.create_collection(collection_name)
+        self.collection = db.collection(collection_name)
+        if ttl is not None:
+            self.collection.add_index(
+                {"type": "ttl", "fields": ["expires_at"], "expireAfter": 0}
+            )
+
+    def _get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        now = time.time()
+        docs = {
+            doc["_key"]: doc
+            for doc in self.collection.get_many(keys)
+            if doc.get("expires_at") is None or doc["expires_at"] > now
+        }
+        return [docs[key]["embedding"] if key in docs else None for key in keys]
+
+    def _set_many(self, keys: List[str], embeddings: List[List[float]]) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        self.collection.import_bulk(
+            [
+                {"_key": key, "embedding": embedding, "expires_at": expires_at}
+                for key, embedding in zip(keys, embeddings)
+            ],
+            on_duplicate="replace",
+        )
+
+    def clear(self) -> None:
+        self.collection.truncate()
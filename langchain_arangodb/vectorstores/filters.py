@@ -0,0 +1,116 @@
+import re
+from typing import Any, Dict, List, Set, Tuple
+
+COMPARISON_OPERATORS = {
+    "$eq": "==",
+    "$ne": "!=",
+    "$lt": "<",
+    "$lte": "<=",
+    "$gt": ">",
+    "$gte": ">=",
+    "$in": "IN",
+    "$nin": "NOT IN",
+    "$like": "LIKE",
+}
+LOGICAL_OPERATORS = {"$and": "AND", "$or": "OR"}
+
+_FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_\-]*(\.[A-Za-z_][A-Za-z0-9_\-]*)*$")
+
+
+class FilterCompiler:
+    """Compile a metadata filter dict into an AQL ``FILTER`` condition.
+
+    Filters follow the usual LangChain vector store syntax::
+
+        {"genre": "drama", "year": {"$gte": 2000}}
+        {"$or": [{"lang": {"$in": ["en", "de"]}}, {"rating": {"$between": [4, 5]}}]}
+
+    Every value becomes a bind variable and names are allocated in traversal
+    order, so filters with the same shape compile to identical query strings
+    and share ArangoDB's query plan cache.
+    """
+
+    def __init__(self, doc_variable: str = "doc", bind_prefix: str = "filter_") -> None:
+        self.doc_variable = doc_variable
+        self.bind_prefix = bind_prefix
+
+    def compile(self, filter: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Return ``(condition, bind_vars)`` for ``filter``."""
+        bind_vars: Dict[str, Any] = {}
+        return self._compile(filter, bind_vars), bind_vars
+
+    def _compile(self, filter: Dict[str, Any], bind_vars: Dict[str, Any]) -> str:
+        if not isinstance(filter, dict) or not filter:
+            raise ValueError(f"Expected a non-empty filter dict, got {filter!r}")
+
+        conditions = []
+        for key, value in filter.items():
+            if key in LOGICAL_OPERATORS:
+                if not isinstance(value, list) or not value:
+                    raise ValueError(f"{key} expects a non-empty list of filters")
+                parts = [self._compile(part, bind_vars) for part in value]
+                conditions.append(
+                    "(" + f" {LOGICAL_OPERATORS[key]} ".join(parts) + ")"
+                )
+            elif key.startswith("$"):
+                raise ValueError(f"Unsupported filter operator: {key}")
+            elif isinstance(value, dict):
+                for operator, operand in value.items():
+                    conditions.append(
+                        self._comparison(key, operator, operand, bind_vars)
+                    )
+            else:
+                conditions.append(self._comparison(key, "$eq", value, bind_vars))
+
+        if len(conditions) == 1:
+            return conditions[0]
+        return "(" + " AND ".join(conditions) + ")"
+
+    def _comparison(
+        self, field: str, operator: str, value: Any, bind_vars: Dict[str, Any]
+    ) -> str:
+        attribute = self._attribute(field)
+        if operator in COMPARISON_OPERATORS:
+            if operator in ("$in", "$nin") and not isinstance(value, list):
+                raise ValueError(f"{operator} expects a list, got {value!r}")
+            name = self._bind(value, bind_vars)
+            return f"{attribute} {COMPARISON_OPERATORS[operator]} @{name}"
+        if operator == "$ilike":
+            name = self._bind(value, bind_vars)
+            return f"LIKE({attribute}, @{name}, true)"
+        if operator == "$between":
+            if not isinstance(value, (list, tuple)) or len(value) != 2:
+                raise ValueError(f"$between expects [low, high], got {value!r}")
+            low = self._bind(value[0], bind_vars)
+            high = self._bind(value[1], bind_vars)
+            return f"({attribute} >= @{low} AND {attribute} <= @{high})"
+        if operator == "$exists":
+            return f"{attribute} {'!=' if value else '=='} null"
+        raise ValueError(f"Unsupported filter operator: {operator}")
+
+    def _attribute(self, field: str) -> str:
+        if not _FIELD_PATTERN.match(field):
+            raise ValueError(f"Invalid filter field name: {field!r}")
+        return self.doc_variable + "".join(f".`{part}`" for part in field.split("."))
+
+    def _bind(self, value: Any, bind_vars: Dict[str, Any]) -> str:
+        name = f"{self.bind_prefix}{len(bind_vars)}"
+        bind_vars[name] = value
+        return name
+
+
+def filter_fields(filter: Dict[str, Any]) -> Set[str]:
+    """Attribute paths referenced anywhere in ``filter``."""
+    fields: Set[str] = set()
+    stack: List[Any] = [filter]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            for key, value in item.items():
+                if key in LOGICAL_OPERATORS:
+                    stack.append(value)
+                elif not key.startswith("$"):
+                    fields.add(key)
+    return fields
@@ -0,0 +1,205 @@
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from langchain_arangodb.vectorstores.utils import DistanceStrategy
+
+# Strategies where a smaller score is a better match.
+_ASCENDING_STRATEGIES = {DistanceStrategy.EUCLIDEAN_DISTANCE}
+# Upper bound on the (queries, rows, dimension) temporaries of JACCARD scoring.
+JACCARD_CHUNK_ELEMENTS = 1 << 24
+
+
+class LocalVectorIndex:
+    """In-process copy of a collection's embeddings for exact top-k search.
+
+    Vectors live in one contiguous float32 matrix, optionally memory-mapped to
+    ``path`` so that large collections are backed by the page cache rather
+    than anonymous memory. Rows are addressed by document ``_key`` and carry
+    the ``_rev`` they were loaded from, which is what
+    ``ArangoVector.refresh_local_index`` diffs against to sync incrementally.
+    Scores match the exact AQL expressions used by ``ArangoVector``.
+    """
+
+    def __init__(
+            self,
+            distance_strategy: DistanceStrategy = DistanceStrategy.COSINE,
+            path: Optional[str] = None,
+            initial_capacity: int = 1024,
+    ):
+        self.distance_strategy = distance_strategy
+        self.path = path
+        self.revisions: Dict[str, str] = {}
+        self._initial_capacity = initial_capacity
+        self._positions: Dict[str, int] = {}
+        self._keys: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._valid = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def dimension(self) -> Optional[int]:
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    def upsert(
+            self,
+            keys: Sequence[str],
+            revisions: Sequence[str],
+            embeddings: Sequence[Sequence[float]],
+    ) -> None:
+        if not keys:
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("All embeddings must have the same dimension.")
+        if self.dimension is not None and vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match the "
+                f"local index dimension {self.dimension}."
+            )
+
+        new_rows = sum(1 for key in keys if key not in self._positions)
+        self._reserve(new_rows, vectors.shape[1])
+
+        rows = np.empty(len(keys), dtype=np.int64)
+        for i, key in enumerate(keys):
+            row = self._positions.get(key)
+            if row is None:
+                row = self._free.pop() if self._free else len(self._keys)
+                if row == len(self._keys):
+                    self._keys.append(key)
+                else:
+                    self._keys[row] = key
+                self._positions[key] = row
+            rows[i] = row
+            self.revisions[key] = revisions[i]
+
+        assert self._matrix is not None
+        self._matrix[rows] = vectors
+        self._norms[rows] = np.linalg.norm(vectors, axis=1)
+        self._valid[rows] = True
+
+    def remove(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            row = self._positions.pop(key, None)
+            self.revisions.pop(key, None)
+            if row is None:
+                continue
+            self._keys[row] = None
+            self._valid[row] = False
+            self._free.append(row)
+
+    def embeddings_for(self, keys: Sequence[str]) -> np.ndarray:
+        assert self._matrix is not None
+        return np.asarray(self._matrix[[self._positions[key] for key in keys]])
+
+    def scores(self, queries: Sequence[Sequence[float]]) -> np.ndarray:
+        """Score every row against each query, returning a (queries, rows)
+        matrix. Rows that are not in use get the worst possible score."""
+        q = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if self._matrix is None:
+            return np.zeros((len(q), 0), dtype=np.float32)
+        size = len(self._keys)
+        matrix = self._matrix[:size]
+
+        if self.distance_strategy == DistanceStrategy.COSINE:
+            denominator = np.outer(np.linalg.norm(q, axis=1), self._norms[:size])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = np.where(denominator > 0, (q @ matrix.T) / denominator, 0.0)
+        elif self.distance_strategy == DistanceStrategy.EUCLIDEAN_DISTANCE:
+            squared = (
+                self._norms[:size] ** 2
+                - 2 * (q @ matrix.T)
+                + np.einsum("ij,ij->i", q, q)[:, None]
+            )
+            scores = np.sqrt(np.maximum(squared, 0.0))
+        elif self.distance_strategy == DistanceStrategy.JACCARD:
+            scores = self._jaccard(q, matrix)
+        else:
+            scores = q @ matrix.T
+
+        worst = np.inf if self._ascending else -np.inf
+        return np.where(self._valid[:size], scores, worst)
+
+    @staticmethod
+    def _jaccard(q: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        # Broadcasting over all rows at once would need a
+        # (queries, rows, dimension) array, so rows are scored in chunks.
+        scores = np.empty((len(q), len(matrix)), dtype=np.float32)
+        step = max(1, JACCARD_CHUNK_ELEMENTS // max(1, len(q) * matrix.shape[1]))
+        for start in range(0, len(matrix), step):
+            rows = np.asarray(matrix[start:start + step])[None, :, :]
+            minimum = np.minimum(rows, q[:, None, :]).sum(axis=2)
+            maximum = np.maximum(rows, q[:, None, :]).sum(axis=2)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores[:, start:start + step] = np.where(
+                    maximum != 0, minimum / maximum, 0.0
+                )
+        return scores
+
+    def search(self, query: Sequence[float], k: int) -> List[Tuple[str, float]]:
+        """Return the ``k`` best ``(key, score)`` pairs, best first."""
+        return self.search_batch([query], k)[0]
+
+    def search_batch(
+            self, queries: Sequence[Sequence[float]], k: int
+    ) -> List[List[Tuple[str, float]]]:
+        """Top-k for several queries with one matrix product."""
+        scores = self.scores(queries)
+        k = min(k, len(self))
+        if k <= 0:
+            return [[] for _ in range(len(scores))]
+
+        ranked = scores if self._ascending else -scores
+        if k < ranked.shape[1]:
+            top = np.argpartition(ranked, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(ranked.shape[1]), (len(ranked), 1))
+        order = np.argsort(np.take_along_axis(ranked, top, axis=1), axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)[:, :k]
+        return [
+            [(str(self._keys[row]), float(row_scores[row])) for row in rows]
+            for rows, row_scores in zip(top, scores)
+        ]
+
+    @property
+    def _ascending(self) -> bool:
+        return self.distance_strategy in _ASCENDING_STRATEGIES
+
+    def _reserve(self, new_rows: int, dimension: int) -> None:
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        needed = len(self._keys) + max(new_rows - len(self._free), 0)
+        if needed <= capacity:
+            return
+
+        new_capacity = max(self._initial_capacity, capacity)
+        while new_capacity < needed:
+            new_capacity *= 2
+
+        matrix = self._allocate(new_capacity, dimension)
+        if self._matrix is not None:
+            matrix[:capacity] = self._matrix
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[:capacity] = self._norms
+        valid = np.zeros(new_capacity, dtype=bool)
+        valid[:capacity] = self._valid
+
+        self._matrix, self._norms, self._valid = matrix, norms, valid
+        if self.path is not None and isinstance(matrix, np.memmap):
+            matrix.flush()
+            os.replace(f"{self.path}.tmp", self.path)
+
+    def _allocate(self, capacity: int, dimension: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, dimension), dtype=np.float32)
+        return np.lib.format.open_memmap(
+            f"{self.path}.tmp",
+            mode="w+",
+            dtype=np.float32,
+            shape=(capacity, dimension),
+        )
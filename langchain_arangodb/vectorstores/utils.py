@@ -1,4 +1,8 @@
+import base64
 from enum import Enum
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 class DistanceStrategy(str, Enum):
@@ -10,3 +14,95 @@ class DistanceStrategy(str, Enum):
     DOT_PRODUCT = "DOT_PRODUCT"
     JACCARD = "JACCARD"
     COSINE = "COSINE"
+
+
+class EmbeddingEncoding(str, Enum):
+    """How embeddings are stored under ``embedding_field``.
+
+    ``JSON`` is a plain array of floats. ``INT8`` is an array of integers in
+    [-127, 127] with a per-vector scale stored next to it; both remain
+    numeric arrays that AQL can score. ``FLOAT32_BASE64`` and
+    ``FLOAT16_BASE64`` are base64 strings of the little-endian vector bytes
+    and are opaque to AQL.
+    """
+
+    JSON = "JSON"
+    FLOAT32_BASE64 = "FLOAT32_BASE64"
+    FLOAT16_BASE64 = "FLOAT16_BASE64"
+    INT8 = "INT8"
+
+
+_BASE64_DTYPES = {
+    EmbeddingEncoding.FLOAT32_BASE64: np.dtype("<f4"),
+    EmbeddingEncoding.FLOAT16_BASE64: np.dtype("<f2"),
+}
+
+
+def encode_embedding(
+    embedding: Sequence[float], encoding: EmbeddingEncoding
+) -> Tuple[Any, Optional[float]]:
+    """Encode ``embedding`` for storage, returning ``(value, scale)``.
+
+    ``scale`` is only set for ``INT8`` and must be stored alongside the value.
+    """
+    if encoding == EmbeddingEncoding.JSON:
+        return embedding, None
+    vector = np.asarray(embedding, dtype=np.float32)
+    if encoding == EmbeddingEncoding.INT8:
+        peak = float(np.abs(vector).max()) if vector.size else 0.0
+        scale = peak / 127 if peak else 1.0
+        return np.round(vector / scale).astype(np.int8).tolist(), scale
+    data = vector.astype(_BASE64_DTYPES[encoding]).tobytes()
+    return base64.b64encode(data).decode("ascii"), None
+
+
+def decode_embedding(
+    value: Any, encoding: EmbeddingEncoding, scale: Optional[float] = None
+) -> np.ndarray:
+    """Inverse of ``encode_embedding``, always returning a float32 vector."""
+    if encoding == EmbeddingEncoding.JSON:
+        return np.asarray(value, dtype=np.float32)
+    if encoding == EmbeddingEncoding.INT8:
+        return np.asarray(value, dtype=np.float32) * np.float32(scale or 1.0)
+    raw = np.frombuffer(base64.b64decode(value), dtype=_BASE64_DTYPES[encoding])
+    return raw.astype(np.float32)
+
+
+def maximal_marginal_relevance_matrix(
+    query_embedding: Sequence[float],
+    embedding_matrix: np.ndarray,
+    lambda_mult: float = 0.5,
+    k: int = 4,
+) -> List[int]:
+    """Select ``k`` row indices of ``embedding_matrix`` by maximal marginal
+    relevance, using cosine similarity like
+    ``langchain_core.vectorstores.utils.maximal_marginal_relevance``.
+
+    The pairwise similarity matrix is computed once and each step only folds
+    the newly selected row into a running "max similarity to selected" vector,
+    so selection costs O(k * n) after a single n x n matrix product.
+    """
+    matrix = np.asarray(embedding_matrix, dtype=np.float32)
+    k = min(k, len(matrix))
+    if k <= 0:
+        return []
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normalized = matrix / np.where(norms == 0, 1.0, norms)
+    query = np.asarray(query_embedding, dtype=np.float32)
+    query_norm = np.linalg.norm(query)
+    relevance = normalized @ (query / query_norm if query_norm else query)
+    pairwise = normalized @ normalized.T
+
+    selected = [int(np.argmax(relevance))]
+    redundancy = pairwise[selected[0]].copy()
+    available = np.ones(len(matrix), dtype=bool)
+    available[selected[0]] = False
+    while len(selected) < k:
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(redundancy, pairwise[best], out=redundancy)
+    return selected